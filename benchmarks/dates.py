@@ -0,0 +1,94 @@
+"""Benchmark publication-date parsing against the previous implementation.
+
+Run from the repository root::
+
+    python -m benchmarks.dates --items 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fashion_business_daily.dates import DateParser
+
+# Date formats seen across publishers; each fixture source sticks to one.
+FORMATS: List[Tuple[str, Callable[[datetime], str]]] = [
+    ("rfc822-gmt", lambda d: format_datetime(d, usegmt=True)),
+    ("rfc822-offset", lambda d: format_datetime(d.astimezone(timezone(timedelta(hours=-4))))),
+    ("rfc822-named-zone", lambda d: (d - timedelta(hours=7)).strftime("%a, %d %b %Y %H:%M:%S PDT")),
+    ("rfc822-cest", lambda d: (d + timedelta(hours=2)).strftime("%a, %d %b %Y %H:%M:%S CEST")),
+    ("rfc822-no-weekday", lambda d: d.strftime("%d %b %Y %H:%M:%S +0000")),
+    ("iso-offset", lambda d: d.isoformat()),
+    ("iso-zulu", lambda d: d.strftime("%Y-%m-%dT%H:%M:%SZ")),
+    ("iso-millis-zulu", lambda d: d.strftime("%Y-%m-%dT%H:%M:%S.") + f"{d.microsecond // 1000:03d}Z"),
+    ("iso-compact", lambda d: d.strftime("%Y%m%dT%H%M%SZ")),
+]
+
+
+def legacy_parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """The parser used before :mod:`fashion_business_daily.dates` (for comparison)."""
+
+    if not value:
+        return None
+    try:
+        dt = parsedate_to_datetime(value)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
+    except (TypeError, ValueError):
+        try:
+            return datetime.fromisoformat(value).astimezone(timezone.utc)
+        except ValueError:
+            return None
+
+
+def build_corpus(items: int, sources: int, seed: int = 11) -> List[Tuple[str, str, datetime]]:
+    """Return ``(source, text, expected)`` rows; each source sticks to one format."""
+
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    formats = [FORMATS[index % len(FORMATS)] for index in range(sources)]
+    corpus = []
+    for _ in range(items):
+        source = rng.randrange(sources)
+        moment = start + timedelta(seconds=rng.randrange(365 * 86400))
+        corpus.append((f"source-{source}", formats[source][1](moment), moment))
+    return corpus
+
+
+def run(items: int, sources: int) -> Dict[str, Any]:
+    corpus = build_corpus(items, sources)
+    parser = DateParser()
+    results: Dict[str, Any] = {"items": items, "sources": sources}
+    for name, parse in (
+        ("legacy", lambda source, text: legacy_parse_datetime(text)),
+        ("memoized", lambda source, text: parser.parse(text, source)),
+    ):
+        started = time.perf_counter()
+        parsed = [parse(source, text) for source, text, _ in corpus]
+        elapsed = time.perf_counter() - started
+        results[name] = {
+            "seconds": elapsed,
+            "per_second": items / elapsed if elapsed else 0.0,
+            "correct": sum(1 for value, (_, _, expected) in zip(parsed, corpus) if value == expected),
+        }
+    return results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Date parsing benchmark")
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--sources", type=int, default=40)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.items, args.sources), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,168 @@
+"""Local HTTP server serving synthetic RSS, Atom and NYT Top Stories feeds."""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from xml.sax.saxutils import escape
+
+from fashion_business_daily.config import DEFAULT_CATEGORIES
+from fashion_business_daily.sources import NewsSource, NYTimesTopStoriesSource, RSSNewsSource
+
+BRANDS = ["Gucci", "Prada", "Chanel", "Dior", "Loewe", "Hermès", "Zara", "Balenciaga"]
+FILLER = "runway atelier season label collection retail growth luxury market quarter".split()
+
+
+@dataclass
+class FixtureConfig:
+    """Shape of the synthetic feeds served by :class:`FixtureServer`."""
+
+    rss_feeds: int = 10
+    atom_feeds: int = 5
+    nyt_feeds: int = 1
+    items: int = 50
+    body_size: int = 400
+    latency: float = 0.0
+    failure_rate: float = 0.0
+    seed: int = 7
+
+
+class FixtureServer:
+    """Serve deterministic synthetic feeds on ``127.0.0.1`` in a background thread."""
+
+    def __init__(self, config: Optional[FixtureConfig] = None) -> None:
+        self.config = config or FixtureConfig()
+        rng = random.Random(self.config.seed)
+        self._keywords = sorted({kw for kws in DEFAULT_CATEGORIES.values() for kw in kws})
+        self._now = datetime.now(timezone.utc).replace(microsecond=0)
+        self._documents: Dict[str, bytes] = {}
+        self.failing: List[str] = []
+        counts = (
+            ("rss", self.config.rss_feeds),
+            ("atom", self.config.atom_feeds),
+            ("nyt", self.config.nyt_feeds),
+        )
+        for kind, count in counts:
+            for index in range(count):
+                path = self._path(kind, index)
+                self._documents[path] = self._render(kind, index, rng)
+                if rng.random() < self.config.failure_rate:
+                    self.failing.append(path)
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def __enter__(self) -> "FixtureServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def sources(self) -> List[NewsSource]:
+        """Return news sources pointing at every feed served by this server."""
+
+        sources: List[NewsSource] = []
+        for path in self._documents:
+            kind, name = path.strip("/").split("/", 1)
+            if kind == "nyt":
+                section = name.rsplit("/", 1)[-1].removesuffix(".json")
+                sources.append(
+                    NYTimesTopStoriesSource(f"NYT {section}", section, base_url=f"{self.url}/nyt")
+                )
+            else:
+                sources.append(RSSNewsSource(f"{kind} {name}", f"{self.url}{path}"))
+        return sources
+
+    @staticmethod
+    def _path(kind: str, index: int) -> str:
+        if kind == "nyt":
+            return f"/nyt/svc/topstories/v2/section{index}.json"
+        return f"/{kind}/feed{index}.xml"
+
+    def _story(self, rng: random.Random, feed: int, item: int) -> Dict[str, str]:
+        title = f"{rng.choice(BRANDS)} {rng.choice(self._keywords)} {rng.choice(FILLER)} {feed}-{item}"
+        words: List[str] = []
+        while sum(len(word) + 1 for word in words) < self.config.body_size:
+            words.append(rng.choice(FILLER if rng.random() < 0.9 else self._keywords))
+        return {
+            "title": title,
+            "url": f"https://fixtures.example/{feed}/{item}",
+            "summary": " ".join(words),
+        }
+
+    def _render(self, kind: str, index: int, rng: random.Random) -> bytes:
+        stories = [self._story(rng, index, item) for item in range(self.config.items)]
+        dates = [self._now - timedelta(minutes=7 * item + index) for item in range(len(stories))]
+        if kind == "nyt":
+            results = [
+                {"title": s["title"], "url": s["url"], "abstract": s["summary"], "published_date": d.isoformat()}
+                for s, d in zip(stories, dates)
+            ]
+            return json.dumps({"status": "OK", "results": results}).encode("utf-8")
+        if kind == "atom":
+            entries = "".join(
+                f"<entry><title>{escape(s['title'])}</title><link rel=\"alternate\" href=\"{s['url']}\"/>"
+                f"<summary>&lt;p&gt;{escape(s['summary'])}&lt;/p&gt;</summary>"
+                f"<updated>{d.isoformat()}</updated></entry>"
+                for s, d in zip(stories, dates)
+            )
+            return (
+                f"<?xml version=\"1.0\" encoding=\"utf-8\"?>"
+                f"<feed xmlns=\"http://www.w3.org/2005/Atom\"><title>Feed {index}</title>{entries}</feed>"
+            ).encode("utf-8")
+        items = "".join(
+            f"<item><title>{escape(s['title'])}</title><link>{s['url']}</link>"
+            f"<description>{escape(s['summary'])}</description>"
+            f"<pubDate>{format_datetime(d)}</pubDate></item>"
+            for s, d in zip(stories, dates)
+        )
+        return (
+            f"<?xml version=\"1.0\" encoding=\"utf-8\"?>"
+            f"<rss version=\"2.0\"><channel><title>Feed {index}</title>{items}</channel></rss>"
+        ).encode("utf-8")
+
+    def _handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802 - http.server API
+                path = self.path.split("?", 1)[0]
+                if server.config.latency:
+                    time.sleep(server.config.latency)
+                body = server._documents.get(path)
+                if body is None or path in server.failing:
+                    status, body = (404, b"not found") if body is None else (500, b"error")
+                else:
+                    status = 200
+                self.send_response(status)
+                content_type = "application/json" if path.endswith(".json") else "application/xml"
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        return Handler
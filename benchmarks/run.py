@@ -0,0 +1,213 @@
+"""End-to-end benchmark of the aggregation pipeline against local fixture feeds.
+
+Run from the repository root::
+
+    python -m benchmarks.run --rss-feeds 100 --items 50 --latency 0.05
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import math
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Union
+
+from fashion_business_daily.aggregator import NewsAggregator
+from fashion_business_daily.articles import Article
+from fashion_business_daily.config import load_categories
+from fashion_business_daily.report import build_markdown_digest
+from fashion_business_daily.site import build_site_assets
+from fashion_business_daily.sources import HTTPTransport, NewsSource, RawFeed
+
+from .fixture_server import FixtureConfig, FixtureServer
+
+
+class TimedSource(NewsSource):
+    """Wrap a source and record how long each fetch takes."""
+
+    def __init__(self, inner: NewsSource, latencies: List[float]) -> None:
+        super().__init__(inner.name)
+        self.inner = inner
+        self.latencies = latencies
+
+    def fetch(self, *, limit: int) -> List[Article]:
+        started = time.perf_counter()
+        try:
+            return self.inner.fetch(limit=limit)
+        finally:
+            self.latencies.append(time.perf_counter() - started)
+
+    def fetch_raw(self, *, limit: int) -> Union[RawFeed, List[Article]]:
+        started = time.perf_counter()
+        try:
+            return self.inner.fetch_raw(limit=limit)
+        finally:
+            self.latencies.append(time.perf_counter() - started)
+
+    def remember(self, raw: RawFeed, articles: List[Article]) -> None:
+        self.inner.remember(raw, articles)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Return the nearest-rank ``pct`` percentile of ``values``."""
+
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, math.ceil(pct * len(ordered) / 100) - 1))
+    return ordered[rank]
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """Time ``func`` ``repeat`` times, then trace one extra call for peak memory."""
+
+    timings: List[float] = []
+    result: Any = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "seconds": statistics.median(timings),
+        "peak_mb": peak / (1024 * 1024),
+        "result": result,
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    os.environ.setdefault("NYTIMES_API_KEY", "fixture")
+    config = FixtureConfig(
+        rss_feeds=args.rss_feeds,
+        atom_feeds=args.atom_feeds,
+        nyt_feeds=args.nyt_feeds,
+        items=args.items,
+        body_size=args.body_size,
+        latency=args.latency,
+        failure_rate=args.failure_rate,
+    )
+    categories = load_categories()
+    latencies: List[float] = []
+    with FixtureServer(config) as server:
+        transport = HTTPTransport(pool_maxsize=max(args.workers, 1), retries=0)
+        sources: List[NewsSource] = []
+        for source in server.sources():
+            source.transport = transport
+            sources.append(TimedSource(source, latencies))
+        aggregator = NewsAggregator(
+            sources,
+            categories,
+            max_items_per_source=args.limit,
+            max_workers=args.workers,
+            parse_workers=args.parse_workers,
+        )
+        fetch = measure(aggregator.fetch, args.repeat)
+        transport.close()
+
+    articles: List[Article] = fetch.pop("result")
+    count = len(articles)
+    stages: Dict[str, Dict[str, Any]] = {"fetch": fetch}
+
+    def classify() -> None:
+        aggregator.classifier.classify_batch(articles)
+
+    def assign_categories() -> None:
+        for article in articles:
+            article.assign_categories(categories)
+
+    for name, func in (
+        ("classify", classify),
+        ("assign_categories", assign_categories),
+        ("digest", lambda: build_markdown_digest(articles)),
+        ("site", lambda: build_site_assets(articles)),
+    ):
+        stages[name] = measure(func, args.repeat)
+        stages[name].pop("result")
+
+    for stage in stages.values():
+        stage["articles_per_second"] = count / stage["seconds"] if stage["seconds"] else 0.0
+    return {
+        "config": vars(config),
+        "articles": count,
+        "failing_feeds": len(server.failing),
+        "fetch_latency": {
+            f"p{pct}": percentile(latencies, pct) for pct in (50, 90, 99)
+        },
+        "stages": stages,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Return a description of every stage slower than ``baseline`` allows."""
+
+    regressions: List[str] = []
+    for name, stage in results["stages"].items():
+        previous = baseline.get("stages", {}).get(name)
+        if not previous:
+            continue
+        for metric in ("seconds", "peak_mb"):
+            limit = previous[metric] * (1 + tolerance)
+            if stage[metric] > limit:
+                regressions.append(
+                    f"{name}.{metric}: {stage[metric]:.4f} > {previous[metric]:.4f} (+{tolerance:.0%})"
+                )
+    return regressions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Fashion Business Daily benchmarks")
+    parser.add_argument("--rss-feeds", type=int, default=20)
+    parser.add_argument("--atom-feeds", type=int, default=10)
+    parser.add_argument("--nyt-feeds", type=int, default=2)
+    parser.add_argument("--items", type=int, default=50, help="Items per fixture feed")
+    parser.add_argument("--limit", type=int, default=20, help="Items kept per source")
+    parser.add_argument("--body-size", type=int, default=400, help="Summary length in bytes")
+    parser.add_argument("--latency", type=float, default=0.0, help="Injected delay per request")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of feeds returning 500")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument(
+        "--parse-workers", type=int, default=0, help="Worker processes for parsing (default: 0)"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare against a saved results file")
+    parser.add_argument("--save-baseline", type=Path, help="Save results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown (default: 0.2)")
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    # Injected failures are expected; keep their tracebacks out of the report.
+    logging.basicConfig(level=logging.CRITICAL)
+    results = run(args)
+    rendered = json.dumps(results, indent=2, sort_keys=True)
+    print(rendered)
+    if args.output:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    if args.save_baseline:
+        args.save_baseline.write_text(rendered + "\n", encoding="utf-8")
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+"""Measure CLI import time and startup, and check them against budgets.
+
+Run from the repository root::
+
+    PYTHONPATH=src python -m benchmarks.startup --import-budget-ms 60 --startup-budget-ms 250
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+SAMPLE_CONFIG = """sources:
+  - name: "Business of Fashion"
+    type: "rss"
+    url: "https://www.businessoffashion.com/rss"
+    interval: 300
+  - name: "New York Times Fashion"
+    type: "nyt_topstories"
+    section: "fashion"
+"""
+
+# Prints how long loading the configuration took and whether PyYAML was needed.
+# Building the source objects is left out: it imports the HTTP stack either way.
+LOAD_CONFIG = (
+    "import sys, time; started = time.perf_counter(); "
+    "from fashion_business_daily.config import load_categories, load_snapshot; "
+    "load_snapshot(); load_categories(); "
+    "print(time.perf_counter() - started, 'yaml' in sys.modules)"
+)
+
+
+def _python(args: List[str], cwd: Path) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    src = str(Path(__file__).resolve().parent.parent / "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable, *args], cwd=cwd, env=env, capture_output=True, text=True, check=True
+    )
+
+
+def import_time_ms(module: str, cwd: Path) -> float:
+    """Return the cumulative ``-X importtime`` of ``module`` in milliseconds."""
+
+    stderr = _python(["-X", "importtime", "-c", f"import {module}"], cwd).stderr
+    for line in stderr.splitlines():
+        fields = [field.strip() for field in line.removeprefix("import time:").split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"{module} missing from -X importtime output")
+
+
+def run(repeat: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = Path(tmp)
+        (cwd / "config").mkdir()
+        config = cwd / "config" / "sources.yaml"
+        config.write_text(SAMPLE_CONFIG, encoding="utf-8")
+
+        imports = [import_time_ms("fashion_business_daily.cli", cwd) for _ in range(repeat)]
+        startups = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            _python(["-m", "fashion_business_daily.cli", "--help"], cwd)
+            startups.append((time.perf_counter() - started) * 1000)
+
+        config_loads: Dict[str, Dict[str, Any]] = {}
+        for name in ("cold", "warm"):
+            if name == "cold":
+                (cwd / "config" / ".sources.snapshot.json").unlink(missing_ok=True)
+            seconds, yaml_loaded = _python(["-c", LOAD_CONFIG], cwd).stdout.split()
+            config_loads[name] = {"ms": float(seconds) * 1000, "yaml_imported": yaml_loaded == "True"}
+
+    return {
+        "cli_import_ms": statistics.median(imports),
+        "help_startup_ms": statistics.median(startups),
+        "config_load": config_loads,
+    }
+
+
+def check(results: Dict[str, Any], *, import_budget_ms: float, startup_budget_ms: float) -> List[str]:
+    """Return a description of every measurement over its budget."""
+
+    failures: List[str] = []
+    if results["cli_import_ms"] > import_budget_ms:
+        failures.append(f"cli_import_ms: {results['cli_import_ms']:.1f} > {import_budget_ms:.1f}")
+    if results["help_startup_ms"] > startup_budget_ms:
+        failures.append(f"help_startup_ms: {results['help_startup_ms']:.1f} > {startup_budget_ms:.1f}")
+    if results["config_load"]["warm"]["yaml_imported"]:
+        failures.append("config_load.warm: PyYAML imported despite an up-to-date snapshot")
+    return failures
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="CLI startup benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--import-budget-ms", type=float, default=60)
+    parser.add_argument("--startup-budget-ms", type=float, default=250)
+    args = parser.parse_args(argv)
+    results = run(args.repeat)
+    print(json.dumps(results, indent=2, sort_keys=True))
+    failures = check(
+        results, import_budget_ms=args.import_budget_ms, startup_budget_ms=args.startup_budget_ms
+    )
+    for failure in failures:
+        print(f"OVER BUDGET {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
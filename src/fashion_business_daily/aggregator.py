@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timezone
-from typing import Iterable, List
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
-from .articles import Article, Category
-from .sources import NewsSource
+from .articles import RECENT_SECONDS, Article, ArticleBatch, Category
+from .classifier import CategoryClassifier
+from .health import HALF_OPEN, OPEN, HealthTracker
+from .metrics import get_recorder
+from .sources import NewsSource, RawFeed
+from .store import ArticleStore, article_key
+
+if TYPE_CHECKING:  # pragma: no cover - import-time hints only
+    from .enrich import Enricher
+    from .pipeline import ParseResult
 
 LOGGER = logging.getLogger(__name__)
 
+# A source's fetch result: parsed articles, or a raw body in pipeline mode.
+Fetched = Union[List[Article], RawFeed]
+
 
 class NewsAggregator:
     """Fetch and categorise fashion business news from multiple sources."""
@@ -21,28 +34,293 @@ class NewsAggregator:
         categories: Iterable[Category],
         *,
         max_items_per_source: int = 25,
+        max_workers: int = 1,
+        deadline: Optional[float] = None,
+        source_timeout: Optional[float] = None,
+        word_boundaries: bool = True,
+        store: Optional[ArticleStore] = None,
+        health: Optional[HealthTracker] = None,
+        parse_workers: int = 0,
+        enricher: Optional[Enricher] = None,
+        max_age: Optional[float] = RECENT_SECONDS,
     ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         self.sources = list(sources)
         self.categories = list(categories)
+        self.classifier = CategoryClassifier(self.categories, word_boundaries=word_boundaries)
         self.max_items_per_source = max_items_per_source
+        self.max_workers = max_workers
+        self.deadline = deadline
+        self.source_timeout = source_timeout
+        self.store = store
+        self.health = health
+        self.parse_workers = parse_workers
+        self.enricher = enricher
+        # Results keep stories up to this many seconds old (``None``: all).
+        self.max_age = max_age
 
     def fetch(self) -> List[Article]:
-        """Fetch articles from all configured sources."""
+        """Fetch articles from all configured sources.
 
-        all_articles: List[Article] = []
-        for source in self.sources:
+        With ``parse_workers`` set, sources hand back raw bodies that are
+        parsed and classified on that many worker processes. With an
+        ``enricher``, new articles with short summaries are reclassified from
+        the text of their pages.
+        """
+
+        return self.fetch_batch().to_articles()
+
+    def fetch_batch(self) -> ArticleBatch:
+        """Fetch like :meth:`fetch`, returning a columnar :class:`ArticleBatch`."""
+
+        raw = self.parse_workers > 0
+        if self.max_workers > 1:
+            fetched = self._fetch_concurrently(raw=raw)
+        else:
+            fetched = self._fetch_sequentially(raw=raw)
+        if raw:
+            return self.collect_batch(self._parse_in_pool(fetched), classified=True)
+        return self.collect_batch([item for _, item in fetched])  # type: ignore[misc]
+
+    async def fetch_async(self, *, concurrency: Optional[int] = None) -> List[Article]:
+        """Fetch articles from all sources on the running event loop.
+
+        At most ``concurrency`` sources (default: ``max_workers``) are fetched
+        at once, each bounded by ``source_timeout``. Sources still running when
+        ``deadline`` passes are cancelled and skipped. Classification and the
+        store update run in a worker thread so the loop stays responsive.
+        """
+
+        limit = concurrency or self.max_workers
+        if limit < 1:
+            raise ValueError("concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(limit)
+        tasks = [
+            asyncio.create_task(self._fetch_source_async(source, semaphore), name=source.name)
+            for source in self.sources
+        ]
+        if not tasks:
+            return []
+        _, pending = await asyncio.wait(tasks, timeout=self.deadline)
+        for task in pending:
+            LOGGER.warning("Deadline reached before %s finished; skipping", task.get_name())
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        fetched = [task.result() for task in tasks if task not in pending]
+        return await asyncio.to_thread(self.collect, fetched)
+
+    def collect(
+        self, fetched: Sequence[List[Article]], *, classified: bool = False
+    ) -> List[Article]:
+        """Classify, store and sort already fetched per-source article lists."""
+
+        return self.collect_batch(fetched, classified=classified).to_articles()
+
+    def collect_batch(
+        self, fetched: Sequence[List[Article]], *, classified: bool = False
+    ) -> ArticleBatch:
+        """Like :meth:`collect`, but return the recent articles as a columnar batch."""
+
+        recorder = get_recorder()
+        collected: List[Article] = []
+        new_articles: List[Article] = []
+        with recorder.timer("classify_seconds"):
+            for articles in fetched:
+                known = self.store.known_categories(articles) if self.store else {}
+                for article in articles:
+                    stored = known.get(article_key(article))
+                    if stored is None:
+                        if not classified:
+                            self.classifier.classify(article)
+                        new_articles.append(article)
+                    else:
+                        article.categories = stored
+                    collected.append(article)
+        if self.enricher is not None:
+            # Only new stories: stored ones were enriched when first seen.
+            self.enricher.enrich(new_articles, self.classifier)
+        batch = ArticleBatch.from_articles(collected)
+        if self.store is not None:
+            seen = sum(len(articles) for articles in fetched) - len(new_articles)
+            added = self.store.add(new_articles)
+            LOGGER.info("Stored %d new articles (%d already seen)", added, seen)
+        if self.max_age is not None:
+            batch = batch.recent(max_age=self.max_age)
+        # Undated articles sort first, as if published just now.
+        batch = batch.sorted(newest_first=True)
+        recorder.observe("articles_total", len(batch))
+        return batch
+
+    def _fetch_source(self, source: NewsSource, raw: bool = False) -> Fetched:
+        state = self._circuit_state(source)
+        if state == OPEN:
+            return []
+        recorder = get_recorder()
+        started = time.perf_counter()
+        timeout, retries = source.timeout, source.retries
+        if state == HALF_OPEN and self.health is not None:
+            # A probe is a single short attempt: transport retries would
+            # multiply its timeout.
+            source.timeout = min(timeout, self.health.probe_timeout)
+            source.retries = False
+        fetched: Fetched
+        try:
+            if raw:
+                fetched = source.fetch_raw(limit=self.max_items_per_source)
+            else:
+                fetched = source.fetch(limit=self.max_items_per_source)
+        except Exception as exc:
+            LOGGER.exception("Failed to fetch from %s: %s", source.name, exc)
+            recorder.observe("fetch_errors", 1, source=source.name)
+            self._record_health(source, exc)
+            fetched = []
+        else:
+            # A raw body can still fail to parse; _parse_in_pool records its outcome.
+            if not isinstance(fetched, RawFeed):
+                self._record_health(source)
+        finally:
+            source.timeout, source.retries = timeout, retries
+        recorder.observe("fetch_seconds", time.perf_counter() - started, source=source.name)
+        if isinstance(fetched, list):
+            recorder.observe("fetch_items", len(fetched), source=source.name)
+        return fetched
+
+    async def _fetch_source_async(
+        self, source: NewsSource, semaphore: asyncio.Semaphore
+    ) -> List[Article]:
+        state = self._circuit_state(source)
+        if state == OPEN:
+            return []
+        recorder = get_recorder()
+        limit = self.source_timeout
+        probe = False
+        if state == HALF_OPEN and self.health is not None:
+            limit = min(limit or self.health.probe_timeout, self.health.probe_timeout)
+            probe = True
+        async with semaphore:
+            started = time.perf_counter()
+            timeout, retries = source.timeout, source.retries
+            if limit is not None:
+                # wait_for only stops waiting: the request itself must also give
+                # up by the limit, or abandoned fetches pile up in the executor.
+                source.timeout = min(timeout, limit)
+            if probe:
+                source.retries = False
             try:
-                articles = source.fetch(limit=self.max_items_per_source)
-            except Exception as exc:  # pragma: no cover - defensive logging
+                articles = await asyncio.wait_for(
+                    source.fetch_async(limit=self.max_items_per_source), limit
+                )
+            except asyncio.TimeoutError as exc:
+                LOGGER.warning("Timed out fetching %s after %ss", source.name, limit)
+                recorder.observe("fetch_errors", 1, source=source.name)
+                self._record_health(source, exc)
+                articles = []
+            except Exception as exc:
                 LOGGER.exception("Failed to fetch from %s: %s", source.name, exc)
+                recorder.observe("fetch_errors", 1, source=source.name)
+                self._record_health(source, exc)
+                articles = []
+            else:
+                self._record_health(source)
+            finally:
+                source.timeout, source.retries = timeout, retries
+            recorder.observe("fetch_seconds", time.perf_counter() - started, source=source.name)
+            recorder.observe("fetch_items", len(articles), source=source.name)
+        return articles
+
+    def _circuit_state(self, source: NewsSource) -> Optional[str]:
+        if self.health is None:
+            return None
+        state = self.health.state(source.name)
+        if state == OPEN:
+            LOGGER.info("Skipping %s: too many recent failures", source.name)
+            get_recorder().observe("fetch_skipped", 1, source=source.name)
+        elif state == HALF_OPEN:
+            LOGGER.info("Probing %s after earlier failures", source.name)
+        return state
+
+    def _record_health(self, source: NewsSource, error: Optional[BaseException] = None) -> None:
+        if self.health is None:
+            return
+        if error is None:
+            self.health.record_success(source.name)
+        else:
+            self.health.record_failure(source.name, error)
+
+    def _parse_in_pool(
+        self, fetched: Sequence[Tuple[NewsSource, Fetched]]
+    ) -> List[List[Article]]:
+        """Parse raw bodies in worker processes; classify anything already parsed here."""
+
+        from .pipeline import ParsePipeline
+
+        raws = [item for _, item in fetched if isinstance(item, RawFeed)]
+        recorder = get_recorder()
+        parsed: List[ParseResult] = []
+        if raws:
+            with recorder.timer("pool_parse_seconds"), ParsePipeline(
+                self.categories,
+                workers=self.parse_workers,
+                word_boundaries=self.classifier.word_boundaries,
+            ) as pipeline:
+                parsed = pipeline.parse(raws)
+        results: List[List[Article]] = []
+        outcomes = iter(parsed)
+        for source, item in fetched:
+            if not isinstance(item, RawFeed):
+                self.classifier.classify_batch(item)
+                results.append(item)
                 continue
-            for article in articles:
-                article.assign_categories(self.categories)
-                if article.is_recent:
-                    all_articles.append(article)
-        # sort by published desc fallback to now
-        all_articles.sort(
-            key=lambda article: article.published or datetime.now(timezone.utc),
-            reverse=True,
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                LOGGER.error("Failed to parse %s: %s", source.name, outcome)
+                recorder.observe("fetch_errors", 1, source=source.name)
+                self._record_health(source, outcome)
+                continue
+            self._record_health(source)
+            source.remember(item, outcome)
+            recorder.observe("fetch_items", len(outcome), source=source.name)
+            results.append(outcome)
+        return results
+
+    def _fetch_sequentially(self, *, raw: bool = False) -> List[Tuple[NewsSource, Fetched]]:
+        started = time.monotonic()
+        results: List[Tuple[NewsSource, Fetched]] = []
+        for source in self.sources:
+            if self.deadline is not None and time.monotonic() - started >= self.deadline:
+                LOGGER.warning("Deadline reached; skipping %s", source.name)
+                continue
+            results.append((source, self._fetch_source(source, raw)))
+        return results
+
+    def _fetch_concurrently(self, *, raw: bool = False) -> List[Tuple[NewsSource, Fetched]]:
+        """Fetch every source on a bounded thread pool, preserving source order."""
+
+        results: Dict[int, Fetched] = {}
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, max(len(self.sources), 1)),
+            thread_name_prefix="fetch",
         )
-        return all_articles
+        try:
+            pending: Dict[Future, int] = {
+                executor.submit(self._fetch_source, source, raw): index
+                for index, source in enumerate(self.sources)
+            }
+            ends_at = None if self.deadline is None else time.monotonic() + self.deadline
+            while pending:
+                timeout = None if ends_at is None else max(ends_at - time.monotonic(), 0)
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+            for index in sorted(pending.values()):
+                LOGGER.warning(
+                    "Deadline reached before %s finished; skipping", self.sources[index].name
+                )
+        finally:
+            # Do not block on stragglers; their sockets time out on their own.
+            executor.shutdown(wait=False, cancel_futures=True)
+        return [(self.sources[index], results[index]) for index in sorted(results)]
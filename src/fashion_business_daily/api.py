@@ -0,0 +1,247 @@
+"""Local read-only JSON API over the latest aggregation."""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import logging
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .articles import Article
+from .render import article_payload
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+class ApiError(Exception):
+    """A request the API cannot answer, with the HTTP status to send."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class ApiResponse:
+    """A rendered response body and its validator."""
+
+    status: int
+    body: bytes
+    etag: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class ArticleIndex:
+    """Lookup tables over one aggregation, built once when it lands.
+
+    Articles are held newest first (undated ones first, as if just
+    published), whatever order they were published in; ranking may have
+    reordered them by relevance. Per-category and per-source lists hold
+    positions into that order, and dated articles are kept in a second,
+    ascending list for ``bisect`` range queries.
+    """
+
+    def __init__(
+        self, articles: Iterable[Article], *, generation: int = 0, updated: Optional[datetime] = None
+    ) -> None:
+        self.generation = generation
+        self.updated = updated or datetime.now(timezone.utc)
+        # Stable, so stories published at the same moment keep their order.
+        self.articles: List[Article] = sorted(
+            articles,
+            key=lambda article: article.published.timestamp() if article.published else math.inf,
+            reverse=True,
+        )
+        self.by_category: Dict[str, List[int]] = {}
+        self.by_source: Dict[str, List[int]] = {}
+        dated: List[Tuple[float, int]] = []
+        for position, article in enumerate(self.articles):
+            for category in article.categories or ["General"]:
+                self.by_category.setdefault(category, []).append(position)
+            self.by_source.setdefault(article.source, []).append(position)
+            if article.published is not None:
+                dated.append((article.published.timestamp(), position))
+        dated.sort()
+        self._timestamps = [timestamp for timestamp, _ in dated]
+        self._dated = [position for _, position in dated]
+
+    def between(self, since: Optional[datetime], until: Optional[datetime]) -> List[int]:
+        """Return positions of articles published in ``[since, until)``, newest first."""
+
+        start = 0 if since is None else bisect.bisect_left(self._timestamps, since.timestamp())
+        end = (
+            len(self._timestamps)
+            if until is None
+            else bisect.bisect_left(self._timestamps, until.timestamp())
+        )
+        return self._dated[start:end][::-1]
+
+
+class ArticleAPI:
+    """Answer API requests from an :class:`ArticleIndex`, caching rendered responses.
+
+    :meth:`publish` swaps in a new index and clears the LRU response cache, so
+    a response is rendered once per aggregation no matter how many clients ask
+    for it. Every response carries a content-based ``ETag``; clients that send
+    it back in ``If-None-Match`` get an empty ``304``.
+    """
+
+    def __init__(self, *, cache_size: int = 256) -> None:
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._index = ArticleIndex([])
+        self._cache: "OrderedDict[str, ApiResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def index(self) -> ArticleIndex:
+        return self._index
+
+    def publish(self, articles: Iterable[Article]) -> ArticleIndex:
+        """Index ``articles`` as the new aggregation and invalidate cached responses."""
+
+        index = ArticleIndex(articles, generation=self._index.generation + 1)
+        with self._lock:
+            self._index = index
+            self._cache.clear()
+        LOGGER.info("API now serving %d articles (generation %d)", len(index.articles), index.generation)
+        return index
+
+    def handle(self, target: str, if_none_match: Optional[str] = None) -> ApiResponse:
+        """Return the response for the request target ``target`` (path and query)."""
+
+        with self._lock:
+            response = self._cache.get(target)
+            if response is not None:
+                self._cache.move_to_end(target)
+                self.hits += 1
+            index = self._index
+        if response is None:
+            response = self._render(index, target)
+            with self._lock:
+                self.misses += 1
+                # Skip errors and responses rendered from an index replaced meanwhile.
+                if response.status == 200 and index is self._index:
+                    self._cache[target] = response
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+        if response.etag and if_none_match and response.etag in _etags(if_none_match):
+            return ApiResponse(304, b"", response.etag, response.headers)
+        return response
+
+    def _render(self, index: ArticleIndex, target: str) -> ApiResponse:
+        parts = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        segments = [unquote(segment) for segment in parts.path.strip("/").split("/") if segment]
+        try:
+            payload = self._route(index, segments, query)
+        except ApiError as exc:
+            body = json.dumps({"error": str(exc)}).encode("utf-8")
+            return ApiResponse(exc.status, body)
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        return ApiResponse(
+            200,
+            body,
+            f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            {"Cache-Control": "no-cache"},
+        )
+
+    def _route(self, index: ArticleIndex, segments: List[str], query: Dict[str, str]) -> dict:
+        if segments[:1] != ["api"]:
+            raise ApiError(404, "Not found")
+        route = segments[1:]
+        if route == ["health"]:
+            return {
+                "generation": index.generation,
+                "updated": index.updated.isoformat(),
+                "articles": len(index.articles),
+            }
+        if route == ["articles"]:
+            since, until = _date(query, "since"), _date(query, "until")
+            if since is None and until is None:
+                return _page(index, range(len(index.articles)), query)
+            return _page(index, index.between(since, until), query)
+        if route == ["categories"]:
+            return {"categories": {name: len(items) for name, items in sorted(index.by_category.items())}}
+        if route == ["sources"]:
+            return {"sources": {name: len(items) for name, items in sorted(index.by_source.items())}}
+        if len(route) == 2 and route[0] in ("categories", "sources"):
+            table = index.by_category if route[0] == "categories" else index.by_source
+            if route[1] not in table:
+                raise ApiError(404, f"Unknown {route[0][:-1]}: {route[1]}")
+            return _page(index, table[route[1]], query)
+        raise ApiError(404, "Not found")
+
+
+def _page(index: ArticleIndex, positions: Sequence[int], query: Dict[str, str]) -> dict:
+    limit = _int(query, "limit", DEFAULT_LIMIT)
+    offset = _int(query, "offset", 0)
+    if not 1 <= limit <= MAX_LIMIT or offset < 0:
+        raise ApiError(400, f"limit must be 1-{MAX_LIMIT} and offset non-negative")
+    selected = positions[offset : offset + limit]
+    return {
+        "total": len(positions),
+        "offset": offset,
+        "articles": [article_payload(index.articles[position]) for position in selected],
+    }
+
+
+def _int(query: Dict[str, str], name: str, default: int) -> int:
+    try:
+        return int(query.get(name, default))
+    except ValueError:
+        raise ApiError(400, f"{name} must be an integer") from None
+
+
+def _date(query: Dict[str, str], name: str) -> Optional[datetime]:
+    value = query.get(name)
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise ApiError(400, f"{name} must be an ISO 8601 date or datetime") from None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _etags(header: str) -> List[str]:
+    return [tag.strip().removeprefix("W/") for tag in header.split(",")]
+
+
+def make_server(api: ArticleAPI, host: str = "127.0.0.1", port: int = 8080) -> ThreadingHTTPServer:
+    """Return an HTTP server answering GET requests from ``api`` (not yet started)."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            response = api.handle(self.path, self.headers.get("If-None-Match"))
+            self.send_response(response.status)
+            if response.status != 304:
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(response.body)))
+            if response.etag:
+                self.send_header("ETag", response.etag)
+            for name, value in response.headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(response.body)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            LOGGER.debug("%s %s", self.address_string(), format % args)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
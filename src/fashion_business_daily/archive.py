@@ -0,0 +1,243 @@
+"""Paginated multi-day archive site built from the article store."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from html import escape
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape as xml_escape
+
+from .articles import Article
+from .fsutil import write_if_changed
+from .site import STYLESHEET, render_section
+from .store import ArticleStore
+
+UNDATED = "undated"
+
+
+@dataclass
+class ArchiveResult:
+    """Summary of a :func:`build_archive` run."""
+
+    output_dir: Path
+    pages_written: int = 0
+    pages_unchanged: int = 0
+    days: int = 0
+    categories: int = 0
+
+
+def slugify(value: str) -> str:
+    """Return a URL-safe directory name for ``value``."""
+
+    return re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-") or "general"
+
+
+def build_archive(
+    store: ArticleStore,
+    output_dir: Path,
+    *,
+    page_size: int = 50,
+    feed_items: int = 50,
+    title: str = "Fashion Business Daily",
+) -> ArchiveResult:
+    """Write per-day and per-category pages, a day index and an Atom feed.
+
+    Articles are streamed from ``store`` in date order and written out one page
+    at a time, so memory stays bounded by ``page_size`` however long the
+    history is. Pages whose content did not change are not rewritten.
+    """
+
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    result = ArchiveResult(output_dir=output_dir)
+
+    def write(path: Path, content: str) -> None:
+        if write_if_changed(path, content):
+            result.pages_written += 1
+        else:
+            result.pages_unchanged += 1
+
+    days: List[Tuple[str, int, int]] = []
+    latest: List[Article] = []
+    paginator: Optional[_Paginator] = None
+    current_day: Optional[str] = None
+    for article in store.iter_articles(newest_first=True):
+        if len(latest) < feed_items:
+            latest.append(article)
+        day = article.published.date().isoformat() if article.published else UNDATED
+        if paginator is None or day != current_day:
+            if paginator is not None and current_day is not None:
+                days.append((current_day, paginator.count, paginator.close()))
+            current_day = day
+            paginator = _Paginator(write, output_dir / "days" / day, day, page_size, title)
+        paginator.add(article)
+    if paginator is not None and current_day is not None:
+        days.append((current_day, paginator.count, paginator.close()))
+    result.days = len(days)
+
+    categories = store.categories()
+    for category in categories:
+        paginator = _Paginator(
+            write, output_dir / "categories" / slugify(category), category, page_size, title
+        )
+        for article in store.iter_articles(category=category, newest_first=True):
+            paginator.add(article)
+        paginator.close()
+    result.categories = len(categories)
+
+    write(output_dir / "index.html", _render_index(title, days, categories))
+    write(output_dir / "feed.xml", _render_feed(title, latest))
+    write(output_dir / "styles.css", STYLESHEET + ARCHIVE_STYLES)
+    return result
+
+
+class _Paginator:
+    """Split a stream of articles into numbered pages holding one page in memory."""
+
+    def __init__(
+        self,
+        write: Callable[[Path, str], None],
+        directory: Path,
+        heading: str,
+        page_size: int,
+        title: str,
+    ) -> None:
+        self._write = write
+        self._directory = directory
+        self._heading = heading
+        self._page_size = page_size
+        self._title = title
+        self._buffer: List[Article] = []
+        self._page = 0
+        self.count = 0
+
+    def add(self, article: Article) -> None:
+        # A page is only written once the next one is known to exist, so its
+        # "Next" link is never dangling.
+        if len(self._buffer) == self._page_size:
+            self._flush(has_next=True)
+        self._buffer.append(article)
+        self.count += 1
+
+    def close(self) -> int:
+        """Write the final page and return the number of pages."""
+
+        if self._buffer:
+            self._flush(has_next=False)
+        return self._page
+
+    def _flush(self, *, has_next: bool) -> None:
+        self._page += 1
+        nav = ['<a href="../../index.html">All days</a>']
+        if self._page > 1:
+            nav.append(f'<a href="page-{self._page - 1}.html">Newer</a>')
+        if has_next:
+            nav.append(f'<a href="page-{self._page + 1}.html">Older</a>')
+        body = render_section(f"{self._heading} · page {self._page}", self._buffer)
+        self._write(
+            self._directory / f"page-{self._page}.html",
+            _render_page(self._title, body, " · ".join(nav), stylesheet="../../styles.css"),
+        )
+        self._buffer = []
+
+
+def _render_page(title: str, body: str, nav: str, *, stylesheet: str) -> str:
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>{escape(title)}</title>
+  <link rel="stylesheet" href="{stylesheet}" />
+</head>
+<body>
+  <header class="hero">
+    <h1>{escape(title)}</h1>
+  </header>
+  <main>
+    <nav class="pager">{nav}</nav>
+    {body}
+    <nav class="pager">{nav}</nav>
+  </main>
+</body>
+</html>
+"""
+
+
+def _render_index(title: str, days: List[Tuple[str, int, int]], categories: Dict[str, int]) -> str:
+    day_items = "\n".join(
+        f'      <li><a href="days/{day}/page-1.html">{escape(day)}</a>'
+        f' <span class="meta">{count} stories</span></li>'
+        for day, count, _pages in days
+    )
+    category_items = "\n".join(
+        f'      <li><a href="categories/{slugify(name)}/page-1.html">{escape(name)}</a>'
+        f' <span class="meta">{count} stories</span></li>'
+        for name, count in categories.items()
+    )
+    body = f"""<section class="category">
+    <h2>Days</h2>
+    <ul class="archive">
+{day_items}
+    </ul>
+  </section>
+  <section class="category">
+    <h2>Categories</h2>
+    <ul class="archive">
+{category_items}
+    </ul>
+  </section>"""
+    return _render_page(
+        f"{title} archive", body, '<a href="feed.xml">Atom feed</a>', stylesheet="styles.css"
+    )
+
+
+def _render_feed(title: str, articles: List[Article]) -> str:
+    updated = next(
+        (article.published for article in articles if article.published),
+        datetime(1970, 1, 1, tzinfo=timezone.utc),
+    )
+    entries = "".join(
+        "  <entry>\n"
+        f"    <title>{xml_escape(article.title)}</title>\n"
+        f'    <link href="{xml_escape(article.url, {chr(34): "&quot;"})}" />\n'
+        f"    <id>{xml_escape(article.url)}</id>\n"
+        f"    <updated>{(article.published or updated).isoformat()}</updated>\n"
+        f"    <author><name>{xml_escape(article.source)}</name></author>\n"
+        f"    <summary>{xml_escape(article.summary)}</summary>\n"
+        "  </entry>\n"
+        for article in articles
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom">\n'
+        f"  <title>{xml_escape(title)}</title>\n"
+        "  <id>urn:fashion-business-daily:archive</id>\n"
+        f"  <updated>{updated.isoformat()}</updated>\n"
+        f"{entries}"
+        "</feed>\n"
+    )
+
+
+ARCHIVE_STYLES = """
+.pager {
+  display: flex;
+  gap: 1rem;
+  margin: 1rem 0 2rem;
+}
+
+.archive {
+  list-style: none;
+  padding: 0;
+  display: grid;
+  gap: 0.5rem;
+}
+
+.archive .meta {
+  color: #4b5563;
+  font-size: 0.9rem;
+}
+"""
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import sys
+import threading
+from array import array
+from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Iterable, List, Optional, Set
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+RECENT_SECONDS = 72 * 3600
 
 
 @dataclass(frozen=True)
@@ -21,16 +27,105 @@ class Category:
         return any(keyword in lowered for keyword in self.keywords)
 
 
-@dataclass
+class CategoryTable:
+    """Interns category names and gives each one a bit in a category bitmask."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._bits: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._decoded: Dict[int, Tuple[str, ...]] = {0: ()}
+
+    def bit(self, name: str) -> int:
+        """Return the bit position of ``name``, registering it on first use."""
+
+        bit = self._bits.get(name)
+        if bit is None:
+            with self._lock:
+                bit = self._bits.get(name)
+                if bit is None:
+                    self._names.append(sys.intern(name))
+                    bit = self._bits[name] = len(self._names) - 1
+        return bit
+
+    def mask(self, names: Iterable[str]) -> int:
+        mask = 0
+        for name in names:
+            mask |= 1 << self.bit(name)
+        return mask
+
+    def names(self, mask: int) -> List[str]:
+        """Return the names selected by ``mask`` in registration order."""
+
+        decoded = self._decoded.get(mask)
+        if decoded is None:
+            decoded = tuple(name for index, name in enumerate(self._names) if mask >> index & 1)
+            self._decoded[mask] = decoded
+        return list(decoded)
+
+
+#: Process-wide table behind every :attr:`Article.category_mask`. Masks are
+#: only meaningful within one process; pickled articles carry category names.
+CATEGORY_TABLE = CategoryTable()
+
+
+@dataclass(init=False, repr=False, slots=True)
 class Article:
-    """Represents a single fashion business article."""
+    """Represents a single fashion business article.
+
+    Articles are slotted, their ``source`` is interned and their categories are
+    kept as a bitmask over :data:`CATEGORY_TABLE`; :attr:`categories` reads and
+    assigns them as a list of names.
+    """
 
     source: str
     title: str
     url: str
     summary: str
     published: Optional[datetime]
-    categories: List[str] = field(default_factory=list)
+    category_mask: int
+    alternates: List["Article"] = field(compare=False)
+
+    def __init__(
+        self,
+        source: str,
+        title: str,
+        url: str,
+        summary: str,
+        published: Optional[datetime],
+        categories: Iterable[str] = (),
+        alternates: Optional[List["Article"]] = None,
+        *,
+        category_mask: int = 0,
+    ) -> None:
+        self.source = sys.intern(source)
+        self.title = title
+        self.url = url
+        self.summary = summary
+        self.published = published
+        self.category_mask = category_mask | CATEGORY_TABLE.mask(categories)
+        self.alternates = [] if alternates is None else alternates
+
+    @property
+    def categories(self) -> List[str]:
+        return CATEGORY_TABLE.names(self.category_mask)
+
+    @categories.setter
+    def categories(self, names: Iterable[str]) -> None:
+        self.category_mask = CATEGORY_TABLE.mask(names)
+
+    def __repr__(self) -> str:
+        return (
+            f"Article(source={self.source!r}, title={self.title!r}, url={self.url!r}, "
+            f"published={self.published!r}, categories={self.categories!r})"
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Ship names rather than the process-local mask.
+        return (
+            Article,
+            (self.source, self.title, self.url, self.summary, self.published, self.categories, self.alternates),
+        )
 
     def assign_categories(self, categories: Iterable[Category]) -> None:
         """Assign matching categories to this article."""
@@ -48,4 +143,223 @@ class Article:
 
         if not self.published:
             return True
-        return (datetime.now(timezone.utc) - self.published).total_seconds() <= 72 * 3600
+        return (datetime.now(timezone.utc) - self.published).total_seconds() <= RECENT_SECONDS
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable representation of the article."""
+
+        return {
+            "source": self.source,
+            "title": self.title,
+            "url": self.url,
+            "summary": self.summary,
+            "published": self.published.isoformat() if self.published else None,
+            "categories": list(self.categories),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "Article":
+        """Rebuild an article previously serialised with :meth:`to_dict`."""
+
+        published = payload.get("published")
+        return cls(
+            source=payload["source"],
+            title=payload["title"],
+            url=payload["url"],
+            summary=payload.get("summary", ""),
+            published=datetime.fromisoformat(published) if published else None,
+            categories=list(payload.get("categories", [])),
+        )
+
+
+_NO_DATE = -(1 << 63)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_micros(value: Optional[datetime]) -> int:
+    if value is None:
+        return _NO_DATE
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+class ArticleBatch:
+    """Column-oriented container for many articles.
+
+    Every field is a column: strings in lists (sources interned), publication
+    times as integer microseconds in an :class:`array.array` and categories as
+    bitmasks over :data:`CATEGORY_TABLE`. Sorting, recency filtering and
+    grouping work on the columns, and iteration yields :class:`ArticleRef`
+    views rather than :class:`Article` objects.
+    """
+
+    __slots__ = ("sources", "titles", "urls", "summaries", "published", "masks", "alternates")
+
+    def __init__(self) -> None:
+        self.sources: List[str] = []
+        self.titles: List[str] = []
+        self.urls: List[str] = []
+        self.summaries: List[str] = []
+        self.published = array("q")
+        self.masks: List[int] = []
+        # Sparse: only rows that grouped other coverage have an entry.
+        self.alternates: Dict[int, List[Article]] = {}
+
+    @classmethod
+    def from_articles(cls, articles: Iterable[Union[Article, "ArticleRef"]]) -> "ArticleBatch":
+        batch = cls()
+        for article in articles:
+            batch.append(article)
+        return batch
+
+    def append(self, article: Union[Article, "ArticleRef"]) -> None:
+        if article.alternates:
+            self.alternates[len(self.titles)] = list(article.alternates)
+        self.sources.append(sys.intern(article.source))
+        self.titles.append(article.title)
+        self.urls.append(article.url)
+        self.summaries.append(article.summary)
+        self.published.append(_to_micros(article.published))
+        self.masks.append(article.category_mask)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def __iter__(self) -> Iterator["ArticleRef"]:
+        for index in range(len(self.titles)):
+            yield ArticleRef(self, index)
+
+    def __getitem__(self, index: int) -> "ArticleRef":
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+        return ArticleRef(self, index % len(self))
+
+    def article(self, index: int) -> Article:
+        """Materialise row ``index`` as an :class:`Article`."""
+
+        return Article(
+            self.sources[index],
+            self.titles[index],
+            self.urls[index],
+            self.summaries[index],
+            self.published_at(index),
+            alternates=list(self.alternates.get(index, ())),
+            category_mask=self.masks[index],
+        )
+
+    def to_articles(self) -> List[Article]:
+        return [self.article(index) for index in range(len(self))]
+
+    def published_at(self, index: int) -> Optional[datetime]:
+        micros = self.published[index]
+        return None if micros == _NO_DATE else _EPOCH + timedelta(microseconds=micros)
+
+    def take(self, indices: Iterable[int]) -> "ArticleBatch":
+        """Return a new batch holding the rows at ``indices``, in that order."""
+
+        batch = ArticleBatch()
+        for position, index in enumerate(indices):
+            batch.sources.append(self.sources[index])
+            batch.titles.append(self.titles[index])
+            batch.urls.append(self.urls[index])
+            batch.summaries.append(self.summaries[index])
+            batch.published.append(self.published[index])
+            batch.masks.append(self.masks[index])
+            if index in self.alternates:
+                batch.alternates[position] = self.alternates[index]
+        return batch
+
+    def sorted(self, *, newest_first: bool = True) -> "ArticleBatch":
+        """Return the batch ordered by publication time; undated rows count as newest."""
+
+        published = self.published
+        undated = (1 << 63) - 1
+        order = sorted(
+            range(len(self)),
+            key=lambda index: undated if published[index] == _NO_DATE else published[index],
+            reverse=newest_first,
+        )
+        return self.take(order)
+
+    def recent(
+        self, *, max_age: float = RECENT_SECONDS, now: Optional[datetime] = None
+    ) -> "ArticleBatch":
+        """Return the rows published within ``max_age`` seconds of ``now`` (or undated)."""
+
+        cutoff = _to_micros(now or datetime.now(timezone.utc)) - int(max_age * 1_000_000)
+        published = self.published
+        return self.take(
+            index
+            for index in range(len(self))
+            if published[index] == _NO_DATE or published[index] >= cutoff
+        )
+
+    def group_by_categories(self, *, default: str = "General") -> Dict[str, "ArticleBatch"]:
+        """Split rows by their exact category set, labelled ``"A, B"`` (or ``default``).
+
+        Names in a label are sorted, so labels do not depend on the order in
+        which this process happened to register categories.
+        """
+
+        by_mask: Dict[int, List[int]] = defaultdict(list)
+        for index, mask in enumerate(self.masks):
+            by_mask[mask].append(index)
+        return {
+            ", ".join(sorted(CATEGORY_TABLE.names(mask))) or default: self.take(indices)
+            for mask, indices in by_mask.items()
+        }
+
+
+class ArticleRef:
+    """Read-only view of one row of an :class:`ArticleBatch`."""
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: ArticleBatch, index: int) -> None:
+        self._batch = batch
+        self._index = index
+
+    @property
+    def source(self) -> str:
+        return self._batch.sources[self._index]
+
+    @property
+    def title(self) -> str:
+        return self._batch.titles[self._index]
+
+    @property
+    def url(self) -> str:
+        return self._batch.urls[self._index]
+
+    @property
+    def summary(self) -> str:
+        return self._batch.summaries[self._index]
+
+    @property
+    def published(self) -> Optional[datetime]:
+        return self._batch.published_at(self._index)
+
+    @property
+    def category_mask(self) -> int:
+        return self._batch.masks[self._index]
+
+    @property
+    def categories(self) -> List[str]:
+        return CATEGORY_TABLE.names(self._batch.masks[self._index])
+
+    @property
+    def alternates(self) -> List[Article]:
+        return self._batch.alternates.get(self._index, [])
+
+    def to_article(self) -> Article:
+        return self._batch.article(self._index)
+
+
+#: Anything renderers accept: a list of articles or a columnar batch.
+Articles = Union[Iterable[Article], ArticleBatch]
+
+
+def as_batch(articles: Articles) -> ArticleBatch:
+    """Return ``articles`` as an :class:`ArticleBatch`, converting if needed."""
+
+    return articles if isinstance(articles, ArticleBatch) else ArticleBatch.from_articles(articles)
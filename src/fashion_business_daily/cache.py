@@ -0,0 +1,149 @@
+"""Persistent HTTP cache for feed downloads."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .articles import Article
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """Validators and parsed articles remembered for a single feed URL."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    limit: int
+    stored_at: float
+    articles: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class FeedCache:
+    """On-disk cache keyed by feed URL supporting conditional GET requests.
+
+    Entries are evicted once they are older than ``ttl`` seconds or when more
+    than ``max_entries`` feeds are cached (least recently used first).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_entries: int = 512,
+        ttl: float = 7 * 24 * 3600,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def conditional_headers(self, url: str, *, limit: int) -> Dict[str, str]:
+        """Return ``If-None-Match``/``If-Modified-Since`` headers for ``url``."""
+
+        with self._lock:
+            entry = self._get(url)
+            if entry is None:
+                return {}
+            if limit > entry.limit and len(entry.articles) >= entry.limit:
+                # The cached copy was truncated below what is now requested.
+                return {}
+            headers: Dict[str, str] = {}
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+            return headers
+
+    def revalidated(self, url: str, *, limit: int) -> Optional[List[Article]]:
+        """Return cached articles after a ``304 Not Modified`` response."""
+
+        with self._lock:
+            entry = self._get(url)
+            if entry is None:
+                return None
+            entry.stored_at = self._clock()
+            self.hits += 1
+            payloads = entry.articles[:limit]
+        return [Article.from_dict(payload) for payload in payloads]
+
+    def store(
+        self,
+        url: str,
+        articles: List[Article],
+        *,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        limit: int,
+    ) -> None:
+        """Remember a fresh download of ``url``."""
+
+        with self._lock:
+            self.misses += 1
+            if not etag and not last_modified:
+                self._entries.pop(url, None)
+                return
+            self._entries[url] = CacheEntry(
+                etag=etag,
+                last_modified=last_modified,
+                limit=limit,
+                stored_at=self._clock(),
+                articles=[article.to_dict() for article in articles],
+            )
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        """Persist the cache to :attr:`path` atomically."""
+
+        with self._lock:
+            payload = {url: asdict(entry) for url, entry in self._entries.items()}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def _get(self, url: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        if self._clock() - entry.stored_at > self.ttl:
+            del self._entries[url]
+            return None
+        self._entries.move_to_end(url)
+        return entry
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable feed cache %s: %s", self.path, exc)
+            return
+        now = self._clock()
+        for url, data in payload.items():
+            entry = CacheEntry(**data)
+            if now - entry.stored_at <= self.ttl:
+                self._entries[url] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,151 @@
+"""Single-pass keyword classification across many categories."""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, Optional, Pattern
+
+from .articles import CATEGORY_TABLE, Article, Category
+
+# Optional plural ending allowed after a whole-word keyword ("ceos", "mergers",
+# "businesses").
+PLURAL = r"(?:e?s)?"
+
+
+class CategoryClassifier:
+    """Classify text against every category with one compiled pattern.
+
+    All keywords are folded into a single trie-shaped regular expression, so an
+    article is scanned once regardless of how many categories or keywords are
+    configured. With ``word_boundaries`` enabled a keyword only matches whole
+    words, e.g. ``"ceo"`` no longer fires inside ``"ceorl"``; a plural ending
+    is still allowed, so ``"ceo"`` matches ``"CEOs"``.
+    """
+
+    def __init__(
+        self,
+        categories: Iterable[Category],
+        *,
+        word_boundaries: bool = True,
+        register: bool = True,
+    ) -> None:
+        self.categories = list(categories)
+        self.word_boundaries = word_boundaries
+        self._names = [category.name for category in self.categories]
+        # Registering here keeps CATEGORY_TABLE in configuration order. Matchers
+        # that never tag articles (``register=False``) leave the table alone.
+        self._table_bits = (
+            [1 << CATEGORY_TABLE.bit(name) for name in self._names] if register else []
+        )
+        self._all = (1 << len(self.categories)) - 1
+
+        owners: Dict[str, int] = {}
+        for index, category in enumerate(self.categories):
+            for keyword in category.keywords:
+                keyword = keyword.lower()
+                if keyword:
+                    owners[keyword] = owners.get(keyword, 0) | (1 << index)
+
+        # The scan reports the longest keyword starting at each position, so a
+        # match also credits every shorter keyword contained within it.
+        self._masks: Dict[str, int] = {
+            keyword: self._contained_mask(keyword, owners) for keyword in owners
+        }
+        self._pattern: Optional[Pattern[str]] = None
+        if owners:
+            body = f"({_trie_pattern(owners)})"
+            if word_boundaries:
+                body = rf"(?<!\w){body}{PLURAL}(?!\w)"
+            # A lookahead consumes nothing, so matches may overlap: "chief
+            # executive officer" yields both "chief executive" and "executive
+            # officer".
+            body = f"(?={body})"
+            self._pattern = re.compile(body)
+
+    def categories_for(self, text: str) -> List[str]:
+        """Return the names of categories whose keywords appear in ``text``."""
+
+        return self.names(self.mask_for(text))
+
+    def mask_for(self, text: str) -> int:
+        """Return a bitmask of matching categories (bit ``i`` is ``categories[i]``)."""
+
+        mask = 0
+        if self._pattern is not None:
+            for match in self._pattern.finditer(text.lower()):
+                mask |= self._masks[match.group(1)]
+                if mask == self._all:
+                    break
+        return mask
+
+    def hit_count(self, text: str) -> int:
+        """Return how many keyword occurrences :meth:`mask_for` would scan in ``text``."""
+
+        if self._pattern is None:
+            return 0
+        return sum(1 for _ in self._pattern.finditer(text.lower()))
+
+    def names(self, mask: int) -> List[str]:
+        """Return the category names selected by ``mask``."""
+
+        return [name for index, name in enumerate(self._names) if mask >> index & 1]
+
+    def table_mask(self, mask: int) -> int:
+        """Translate a :meth:`mask_for` result into a :data:`CATEGORY_TABLE` mask."""
+
+        table_mask = 0
+        for index, bit in enumerate(self._table_bits):
+            if mask >> index & 1:
+                table_mask |= bit
+        return table_mask
+
+    def classify(self, article: Article) -> List[str]:
+        """Assign matching categories to ``article`` and return them."""
+
+        mask = self.mask_for(f"{article.title}\n{article.summary}")
+        article.category_mask = self.table_mask(mask)
+        return article.categories
+
+    def classify_batch(self, articles: Iterable[Article]) -> None:
+        """Assign categories to every article in ``articles``."""
+
+        for article in articles:
+            self.classify(article)
+
+    def _contained_mask(self, keyword: str, owners: Dict[str, int]) -> int:
+        mask = 0
+        length = len(keyword)
+        for start in range(length):
+            if self.word_boundaries and start and _is_word(keyword[start - 1]):
+                continue
+            for end in range(start + 1, length + 1):
+                if self.word_boundaries and end < length and _is_word(keyword[end]):
+                    continue
+                mask |= owners.get(keyword[start:end], 0)
+        return mask
+
+
+def _is_word(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Return a regex matching any of ``words``, preferring longer ones."""
+
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            body = f"(?:{body})?"
+        return body
+
+    return build(trie)
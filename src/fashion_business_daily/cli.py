@@ -4,18 +4,134 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .aggregator import NewsAggregator
-from .config import load_categories, load_sources
-from .report import build_markdown_digest, write_digest
-from .site import build_site_assets, write_site
+# Only the standard library is imported up front so ``--help`` and argument
+# errors stay fast; each command imports the modules it actually uses.
+if TYPE_CHECKING:  # pragma: no cover - import-time hints only
+    from .aggregator import NewsAggregator
+    from .articles import Article
+    from .cache import FeedCache
+    from .enrich import Enricher
+    from .health import HealthTracker
+    from .metrics import MetricsRecorder
+    from .sources import HTTPTransport, NewsSource
+    from .store import ArticleStore
+    from .trends import Trend
 
 LOGGER = logging.getLogger(__name__)
 
 
 def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Fashion Business Daily aggregator")
+    common = argparse.ArgumentParser(add_help=False)
+    _add_run_options(common)
+    parser = argparse.ArgumentParser(description="Fashion Business Daily aggregator", parents=[common])
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    serve = commands.add_parser(
+        "serve",
+        parents=[common],
+        help="Keep running, polling each source on its own adaptive schedule",
+        description=(
+            "Poll every source on its own interval, adapt it to how often the feed "
+            "changes, and rebuild the digest and site shortly after new stories arrive"
+        ),
+    )
+    _add_serve_options(serve)
+    serve_api = commands.add_parser(
+        "serve-api",
+        parents=[common],
+        help="Like serve, and also answer JSON queries over the latest stories on a local port",
+        description=(
+            "Poll sources like `serve` and expose the latest aggregation as JSON: "
+            "/api/articles (optionally ?since=&until=), /api/categories[/NAME], "
+            "/api/sources[/NAME] and /api/health"
+        ),
+    )
+    _add_serve_options(serve_api)
+    serve_api.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address to listen on (default: 127.0.0.1)",
+    )
+    serve_api.add_argument(
+        "--port",
+        type=int,
+        default=8080,
+        help="Port to listen on (default: 8080)",
+    )
+    serve_api.add_argument(
+        "--api-cache-size",
+        type=int,
+        default=256,
+        help="Rendered responses kept in the LRU cache (default: 256)",
+    )
+    merge = commands.add_parser(
+        "merge",
+        parents=[common],
+        help="Combine article batches written by --shard runs and publish the outputs",
+        description=(
+            "Read the batches written by `--shard i/N --shard-output FILE` runs, "
+            "drop duplicate URLs, and write the digest and site exactly as a "
+            "single run over all sources would"
+        ),
+    )
+    merge.add_argument("batches", nargs="+", type=Path, metavar="BATCH", help="Shard output files")
+    parser.add_argument(
+        "--shard",
+        type=_shard,
+        metavar="I/N",
+        help=(
+            "Fetch only shard I (counting from 0) of N stable hash partitions of the "
+            "sources and write the articles to --shard-output instead of publishing"
+        ),
+    )
+    parser.add_argument(
+        "--shard-output",
+        type=Path,
+        help="JSON lines file for the articles fetched by this shard (requires --shard)",
+    )
+    return parser
+
+
+def _shard(text: str) -> tuple[int, int]:
+    from .shard import parse_shard
+
+    try:
+        return parse_shard(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def _add_serve_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=900,
+        help="Starting poll interval in seconds for sources without one (default: 900)",
+    )
+    parser.add_argument(
+        "--min-interval",
+        type=float,
+        default=60,
+        help="Shortest poll interval in seconds (default: 60)",
+    )
+    parser.add_argument(
+        "--max-interval",
+        type=float,
+        default=6 * 3600,
+        help="Longest poll interval in seconds (default: 21600)",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=30,
+        help="Seconds to wait after new stories before rebuilding (default: 30)",
+    )
+
+
+def _add_run_options(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--output",
         type=Path,
@@ -29,50 +145,577 @@ def build_parser() -> argparse.ArgumentParser:
             "Optional directory to write a static website (e.g. docs for GitHub Pages)"
         ),
     )
+    parser.add_argument(
+        "--json-output",
+        type=Path,
+        help="Also write the grouped digest as JSON to this file",
+    )
     parser.add_argument(
         "--max-items",
         type=int,
         default=20,
         help="Maximum number of stories to fetch from each source",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of sources to fetch concurrently (default: 1, sequential)",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        help="Overall time budget in seconds for fetching all sources",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Parse and classify feeds on this many worker processes (default: 0, in-process)",
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=10,
+        help="Maximum keep-alive connections kept open per host (default: 10)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=3,
+        help="Retries with exponential backoff for failed requests (default: 3)",
+    )
+    parser.add_argument(
+        "--feed-cache",
+        type=Path,
+        help="JSON file used to cache feeds between runs for conditional requests",
+    )
+    parser.add_argument(
+        "--health-file",
+        type=Path,
+        help="JSON file tracking source failures so persistently broken feeds are skipped",
+    )
+    parser.add_argument(
+        "--enrich",
+        action="store_true",
+        help="Fetch article pages for short summaries and reclassify from the full text",
+    )
+    parser.add_argument(
+        "--enrich-cache",
+        type=Path,
+        help="SQLite file caching extracted page text so each page is fetched only once",
+    )
+    parser.add_argument(
+        "--enrich-budget",
+        type=float,
+        default=30,
+        help="Time budget in seconds for page downloads per run (default: 30)",
+    )
+    parser.add_argument(
+        "--enrich-max-mb",
+        type=float,
+        default=16,
+        help="Download budget in MiB for page downloads per run (default: 16)",
+    )
+    parser.add_argument(
+        "--enrich-workers",
+        type=int,
+        default=4,
+        help="Concurrent page downloads overall (default: 4)",
+    )
+    parser.add_argument(
+        "--enrich-per-host",
+        type=int,
+        default=2,
+        help="Concurrent page downloads per host (default: 2)",
+    )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        help="SQLite database remembering articles across runs (enables incremental runs)",
+    )
+    parser.add_argument(
+        "--site-search",
+        action="store_true",
+        help="Add a prebuilt client-side search index to the static site",
+    )
+    parser.add_argument(
+        "--archive-output",
+        type=Path,
+        help="Directory for a paginated per-day/per-category archive built from --store",
+    )
+    parser.add_argument(
+        "--archive-page-size",
+        type=int,
+        default=50,
+        help="Stories per archive page (default: 50)",
+    )
+    parser.add_argument(
+        "--trends-file",
+        type=Path,
+        help="JSON file of rolling daily mention counts; adds a Trending section to the outputs",
+    )
+    parser.add_argument(
+        "--trends-window",
+        type=int,
+        default=14,
+        help="Days of history trending terms are compared against (default: 14)",
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        help=(
+            "Keep only the K best-ranked stories per category (default: ranking.top_k "
+            "from sources.yaml; 0 disables ranking)"
+        ),
+    )
+    parser.add_argument(
+        "--whole-words",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Match category keywords as whole words, plurals included (default: on)",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Group near-duplicate stories from different sources (default: on)",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        help="Write per-source and per-stage metrics as JSON to this file",
+    )
+    parser.add_argument(
+        "--prometheus-file",
+        type=Path,
+        help="Write metrics in Prometheus textfile format (e.g. for node_exporter)",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
         help="Enable verbose logging",
     )
-    return parser
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
+    if args.archive_output and not args.store:
+        parser.error("--archive-output requires --store")
+    if args.enrich_cache and not args.enrich:
+        parser.error("--enrich-cache requires --enrich")
+    if args.top_k is not None and args.top_k < 0:
+        parser.error("--top-k must be 0 (no ranking) or more")
+    if bool(args.shard) != bool(args.shard_output):
+        parser.error("--shard and --shard-output must be given together")
+    if args.shard and args.command:
+        parser.error("--shard applies to one-off runs, not to subcommands")
+    if args.shard and args.store:
+        parser.error("--store belongs on merge, which records what every shard fetched")
 
     logging.basicConfig(
         level=logging.DEBUG if args.verbose else logging.INFO,
         format="%(asctime)s %(levelname)s %(name)s %(message)s",
     )
 
+    from .config import load_sources
+    from .metrics import MetricsRecorder, set_recorder
+    from .sources import HTTPTransport, RSSNewsSource, set_transport
+
+    recorder = MetricsRecorder() if args.metrics_file or args.prometheus_file else None
+    set_recorder(recorder)
+    if args.command == "merge":
+        return _merge(args, recorder)
+    transport = HTTPTransport(pool_maxsize=max(args.pool_size, 1), retries=args.retries)
+    set_transport(transport)
+    sources = load_sources()
+    cache = None
+    if args.feed_cache:
+        from .cache import FeedCache
+
+        cache = FeedCache(args.feed_cache)
+        for source in sources:
+            if isinstance(source, RSSNewsSource):
+                source.cache = cache
+    store = None
+    if args.store:
+        from .store import ArticleStore
+
+        store = ArticleStore(args.store)
+    content_cache = enricher = None
+    if args.enrich:
+        from .enrich import ContentCache, Enricher
+
+        content_cache = ContentCache(args.enrich_cache) if args.enrich_cache else None
+        enricher = Enricher(
+            cache=content_cache,
+            workers=max(args.enrich_workers, 1),
+            per_host=max(args.enrich_per_host, 1),
+            max_bytes=int(args.enrich_max_mb * (1 << 20)),
+            time_budget=args.enrich_budget,
+        )
+    try:
+        if args.command in ("serve", "serve-api"):
+            return _serve(args, sources, store, cache, transport, recorder, enricher)
+        return _run(args, sources, store, cache, transport, recorder, enricher)
+    finally:
+        if store is not None:
+            store.close()
+        if content_cache is not None:
+            content_cache.close()
+
+
+def _run(
+    args: argparse.Namespace,
+    sources: list[NewsSource],
+    store: ArticleStore | None,
+    cache: FeedCache | None,
+    transport: HTTPTransport,
+    recorder: MetricsRecorder | None,
+    enricher: Enricher | None = None,
+) -> int:
+    from .health import HealthTracker
+
+    positions: dict[str, int] = {}
+    if args.shard:
+        from .shard import select_shard
+
+        positions = {source.name: position for position, source in enumerate(sources)}
+        sources = select_shard(sources, *args.shard)
     LOGGER.info("Fetching news from configured sources…")
-    aggregator = NewsAggregator(
-        sources=load_sources(),
+    health = HealthTracker(args.health_file)
+    articles = _build_aggregator(args, sources, store, health, enricher).fetch()
+    LOGGER.info("Fetched %d articles", len(articles))
+    health.save()
+    _log_health(health)
+    if args.shard:
+        _write_shard(args, sources, positions, articles, cache, transport)
+        _write_metrics(args, recorder, transport)
+        return 0
+    _publish(args, articles, store, cache, transport, recorder)
+    return 0
+
+
+def _write_shard(
+    args: argparse.Namespace,
+    sources: list[NewsSource],
+    positions: dict[str, int],
+    articles: list[Article],
+    cache: FeedCache | None,
+    transport: HTTPTransport,
+) -> None:
+    """Write this shard's articles, tagged with every source's global position, for ``merge``."""
+
+    from .shard import ShardBatch, write_batch
+
+    if cache is not None:
+        cache.save()
+    _log_transport_stats(transport)
+    index, count = args.shard
+    write_batch(args.shard_output, ShardBatch(index, count, positions, articles))
+    LOGGER.info(
+        "Shard %d/%d: %d articles from %d sources written to %s",
+        index,
+        count,
+        len(articles),
+        len(sources),
+        args.shard_output,
+    )
+
+
+def _merge(args: argparse.Namespace, recorder: MetricsRecorder | None) -> int:
+    """Publish the outputs of a sharded run from the batches its shards wrote."""
+
+    from .shard import merge_batches, read_batch
+
+    try:
+        batches = [read_batch(path) for path in args.batches]
+    except (OSError, ValueError, KeyError) as exc:
+        LOGGER.error("Cannot read shard batches: %s", exc)
+        return 1
+    store = None
+    if args.store:
+        from .store import ArticleStore
+
+        store = ArticleStore(args.store)
+    try:
+        try:
+            articles = merge_batches(batches, store=store)
+        except ValueError as exc:
+            LOGGER.error("Cannot merge shard batches: %s", exc)
+            return 1
+        LOGGER.info("Merged %d articles from %d batches", len(articles), len(batches))
+        _publish(args, articles, store, None, None, recorder)
+    finally:
+        if store is not None:
+            store.close()
+    return 0
+
+
+def _serve(
+    args: argparse.Namespace,
+    sources: list[NewsSource],
+    store: ArticleStore | None,
+    cache: FeedCache | None,
+    transport: HTTPTransport,
+    recorder: MetricsRecorder | None,
+    enricher: Enricher | None = None,
+) -> int:
+    import signal
+
+    from .health import HealthTracker
+    from .scheduler import PollScheduler
+
+    health = HealthTracker(args.health_file)
+    aggregator = _build_aggregator(args, sources, store, health, enricher)
+    api = server = None
+    if args.command == "serve-api":
+        import threading
+
+        from .api import ArticleAPI, make_server
+
+        api = ArticleAPI(cache_size=max(args.api_cache_size, 1))
+        if store is not None:
+            api.publish(_stored_recent(store))
+        server = make_server(api, args.host, args.port)
+        threading.Thread(target=server.serve_forever, name="api", daemon=True).start()
+        LOGGER.info("Serving the JSON API on http://%s:%d/api/", args.host, server.server_port)
+
+    def rebuild(fetched: list[list[Article]]) -> None:
+        articles = aggregator.collect(fetched)
+        LOGGER.info("New stories arrived; rebuilding with %d articles", len(articles))
+        published = _publish(args, articles, store, cache, transport, recorder)
+        if api is not None:
+            api.publish(published)
+
+    scheduler = PollScheduler(
+        sources,
+        rebuild,
+        limit=args.max_items,
+        workers=args.workers,
+        default_interval=args.interval,
+        min_interval=args.min_interval,
+        max_interval=args.max_interval,
+        debounce=args.debounce,
+        health=health,
+    )
+    signal.signal(signal.SIGTERM, lambda *_: scheduler.stop())
+    LOGGER.info("Polling %d sources; press Ctrl+C to stop", len(sources))
+    try:
+        scheduler.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+    LOGGER.info("Stopped polling")
+    _log_health(health)
+    return 0
+
+
+def _stored_recent(store: ArticleStore) -> list[Article]:
+    from datetime import datetime, timedelta, timezone
+
+    from .articles import RECENT_SECONDS
+
+    since = datetime.now(timezone.utc) - timedelta(seconds=RECENT_SECONDS)
+    return list(store.iter_articles(since=since))
+
+
+def _build_aggregator(
+    args: argparse.Namespace,
+    sources: list[NewsSource],
+    store: ArticleStore | None,
+    health: HealthTracker | None = None,
+    enricher: Enricher | None = None,
+) -> NewsAggregator:
+    from .aggregator import NewsAggregator
+    from .articles import RECENT_SECONDS
+    from .config import load_categories
+
+    return NewsAggregator(
+        sources=sources,
         categories=load_categories(),
         max_items_per_source=args.max_items,
+        max_workers=args.workers,
+        deadline=args.deadline,
+        store=store,
+        health=health,
+        word_boundaries=args.whole_words,
+        parse_workers=args.parse_workers,
+        enricher=enricher,
+        # Shards keep older stories too, so merge can store everything it saw.
+        max_age=None if args.shard else RECENT_SECONDS,
     )
-    articles = aggregator.fetch()
-    LOGGER.info("Fetched %d articles", len(articles))
 
-    digest = build_markdown_digest(articles)
-    output_path = write_digest(digest, args.output)
+
+def _publish(
+    args: argparse.Namespace,
+    articles: list[Article],
+    store: ArticleStore | None,
+    cache: FeedCache | None,
+    transport: HTTPTransport | None,
+    recorder: MetricsRecorder | None,
+) -> list[Article]:
+    """Write every configured output and return the articles they were built from."""
+
+    from .render import RenderPlan
+    from .report import write_digest
+
+    if cache is not None:
+        cache.save()
+        LOGGER.info("Feed cache: %d hits, %d misses", cache.hits, cache.misses)
+    if transport is not None:
+        _log_transport_stats(transport)
+    # Count mentions before deduplication so coverage by several sources shows.
+    trends = _update_trends(args, articles) if args.trends_file else []
+    if args.dedupe:
+        from .dedup import cluster_articles
+
+        articles = cluster_articles(articles)
+        LOGGER.info("Grouped into %d distinct stories", len(articles))
+    # Ranking runs after deduplication so cross-source coverage counts.
+    articles = _rank(args, articles)
+
+    # Group once; every output below streams from the same plan.
+    plan = RenderPlan.build(articles, trends=trends)
+    output_path = write_digest(plan, args.output)
     LOGGER.info("Digest written to %s", output_path)
 
+    if args.json_output:
+        from .fsutil import open_atomic
+        from .metrics import get_recorder
+        from .render import write_json
+
+        with get_recorder().timer("write_seconds", output="json"), open_atomic(
+            args.json_output
+        ) as fh:
+            write_json(plan, fh)
+        LOGGER.info("JSON digest written to %s", args.json_output)
+
     if args.site_output:
-        site_dir = write_site(
-            build_site_assets(articles),
-            args.site_output,
+        from .site import build_site
+
+        result = build_site(plan, args.site_output, search=args.site_search)
+        if result.changed:
+            LOGGER.info(
+                "Static site written to %s (%s; %d sections rendered, %d reused)",
+                result.output_dir,
+                ", ".join(result.changed_files),
+                result.rendered_sections,
+                result.reused_sections,
+            )
+        else:
+            LOGGER.info("Static site in %s is unchanged; nothing to publish", result.output_dir)
+        _report_site_changed(result.changed)
+
+    if args.archive_output and store is not None:
+        from .archive import build_archive
+        from .report import write_digest_index
+
+        write_digest_index(args.output)
+        archive = build_archive(store, args.archive_output, page_size=args.archive_page_size)
+        LOGGER.info(
+            "Archive in %s: %d days, %d categories, %d pages written, %d unchanged",
+            archive.output_dir,
+            archive.days,
+            archive.categories,
+            archive.pages_written,
+            archive.pages_unchanged,
         )
-        LOGGER.info("Static site written to %s", site_dir)
 
-    return 0
+    _write_metrics(args, recorder, transport)
+    return articles
+
+
+def _write_metrics(
+    args: argparse.Namespace, recorder: MetricsRecorder | None, transport: HTTPTransport | None
+) -> None:
+    if recorder is None:
+        return
+    if transport is not None:
+        _record_transport_stats(recorder, transport)
+    if args.metrics_file:
+        recorder.write_json(args.metrics_file)
+    if args.prometheus_file:
+        recorder.write_prometheus(args.prometheus_file)
+
+
+def _update_trends(args: argparse.Namespace, articles: list[Article]) -> list[Trend]:
+    from .config import load_categories, load_trend_terms
+    from .trends import TrendTracker
+
+    tracker = TrendTracker(
+        load_categories(),
+        args.trends_file,
+        terms=load_trend_terms(),
+        window=args.trends_window,
+        word_boundaries=args.whole_words,
+    )
+    counted = tracker.update(articles)
+    tracker.save()
+    trends = tracker.trending()
+    LOGGER.info("Trends: counted %d new stories; %d terms trending", counted, len(trends))
+    return trends
+
+
+def _rank(args: argparse.Namespace, articles: list[Article]) -> list[Article]:
+    from .config import load_categories, load_ranking
+
+    config = load_ranking()
+    if args.top_k is not None:
+        config.top_k = args.top_k or None
+    if not config.top_k:
+        return articles
+
+    from .ranking import Ranker
+
+    ranked = Ranker(load_categories(), config, word_boundaries=args.whole_words).select(articles)
+    LOGGER.info("Kept the top %d stories per category: %d of %d", config.top_k, len(ranked), len(articles))
+    return ranked
+
+
+def _log_transport_stats(transport: HTTPTransport) -> None:
+    stats = transport.stats()
+    LOGGER.info(
+        "HTTP: %d requests over %d connections (%.0f%% reused)",
+        stats.requests,
+        stats.connections,
+        stats.reuse_rate * 100,
+    )
+    for host, host_stats in sorted(stats.hosts.items()):
+        LOGGER.debug(
+            "HTTP %s: %d requests, %d connections",
+            host,
+            host_stats.requests,
+            host_stats.connections,
+        )
+
+
+def _log_health(health: HealthTracker) -> None:
+    lines = health.report()
+    if not lines:
+        LOGGER.info("Source health: all sources OK")
+        return
+    LOGGER.warning("Source health: %d failing sources", len(lines))
+    for line in lines:
+        LOGGER.warning("  %s", line)
+
+
+def _report_site_changed(changed: bool) -> None:
+    # Expose the result as a step output so workflows can skip publishing.
+    github_output = os.environ.get("GITHUB_OUTPUT")
+    if github_output:
+        with open(github_output, "a", encoding="utf-8") as fh:
+            fh.write(f"site-changed={'true' if changed else 'false'}\n")
+
+
+def _record_transport_stats(recorder: MetricsRecorder, transport: HTTPTransport) -> None:
+    for host, host_stats in transport.stats().hosts.items():
+        recorder.observe("http_requests", host_stats.requests, host=host)
+        recorder.observe("http_connections", host_stats.connections, host=host)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,24 +1,40 @@
-"""Project configuration helpers."""
+"""Project configuration helpers.
+
+``config/sources.yaml`` is parsed once and compiled into a small JSON
+snapshot next to it. Later runs load the snapshot, which is validated
+against the YAML file's modification time and size and the built-in
+defaults, so neither PyYAML nor the YAML parser is needed while the
+configuration is unchanged.
+"""
 
 from __future__ import annotations
 
+import json
+import logging
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List
-
-try:
-    import yaml
-except ModuleNotFoundError:  # pragma: no cover - dependency optional for defaults
-    yaml = None
-
-from .articles import Category
-from .sources import NYTimesTopStoriesSource, NewsSource, RSSNewsSource
-
-DEFAULT_SOURCES = [
-    RSSNewsSource("Business of Fashion", "https://www.businessoffashion.com/rss"),
-    RSSNewsSource("WWD", "https://wwd.com/feed/"),
-    RSSNewsSource("Vanity Fair Fashion", "https://www.vanityfair.com/feed/rss/fashion"),
-    RSSNewsSource("Vogue Business", "https://www.voguebusiness.com/rss"),
-    NYTimesTopStoriesSource("New York Times Fashion"),
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from .fsutil import content_hash, write_atomic
+
+if TYPE_CHECKING:  # pragma: no cover - import-time hints only
+    from .articles import Category
+    from .ranking import RankingConfig
+    from .sources import NewsSource
+
+LOGGER = logging.getLogger(__name__)
+
+# Source definitions in the same shape as entries of ``sources.yaml``.
+DEFAULT_SOURCES: List[Dict[str, Any]] = [
+    {"name": "Business of Fashion", "type": "rss", "url": "https://www.businessoffashion.com/rss"},
+    {"name": "WWD", "type": "rss", "url": "https://wwd.com/feed/"},
+    {
+        "name": "Vanity Fair Fashion",
+        "type": "rss",
+        "url": "https://www.vanityfair.com/feed/rss/fashion",
+    },
+    {"name": "Vogue Business", "type": "rss", "url": "https://www.voguebusiness.com/rss"},
+    {"name": "New York Times Fashion", "type": "nyt_topstories"},
 ]
 
 DEFAULT_CATEGORIES: Dict[str, Iterable[str]] = {
@@ -67,33 +83,164 @@ DEFAULT_CATEGORIES: Dict[str, Iterable[str]] = {
 }
 
 CONFIG_PATH = Path("config/sources.yaml")
+SNAPSHOT_VERSION = 3
+
+
+@dataclass
+class ConfigSnapshot:
+    """Plain-data form of the sources, categories, ranking and trends configuration."""
+
+    key: Dict[str, Any]
+    sources: List[Dict[str, Any]]
+    categories: List[Tuple[str, List[str]]]
+    ranking: Dict[str, Any] = field(default_factory=dict)
+    trend_terms: List[str] = field(default_factory=list)
+
+
+_SNAPSHOT: Optional[ConfigSnapshot] = None
+
+
+def snapshot_path(config_path: Path) -> Path:
+    """Return where the compiled snapshot of ``config_path`` is kept."""
+
+    return config_path.with_name(f".{config_path.stem}.snapshot.json")
+
+
+def load_snapshot(config_path: Optional[Path] = None) -> ConfigSnapshot:
+    """Return the compiled configuration, recompiling it if ``sources.yaml`` changed."""
+
+    global _SNAPSHOT
+    path = CONFIG_PATH if config_path is None else config_path
+    key = _snapshot_key(path)
+    if _SNAPSHOT is not None and _SNAPSHOT.key == key:
+        return _SNAPSHOT
+    cached = snapshot_path(path)
+    snapshot = _read_snapshot(cached, key)
+    if snapshot is None:
+        snapshot = _compile(path, key)
+        if key["mtime_ns"] is not None:
+            try:
+                write_atomic(cached, json.dumps(snapshot.__dict__))
+            except OSError as exc:
+                LOGGER.debug("Could not write config snapshot %s: %s", cached, exc)
+    _SNAPSHOT = snapshot
+    return snapshot
 
 
 def load_sources() -> List[NewsSource]:
     """Load news sources from ``config/sources.yaml`` if it exists."""
 
-    if CONFIG_PATH.exists() and yaml is not None:
-        with CONFIG_PATH.open("r", encoding="utf-8") as fh:
-            config = yaml.safe_load(fh) or {}
-        return [
-            _source_from_dict(source)
-            for source in config.get("sources", [])
-        ]
-    return DEFAULT_SOURCES.copy()
+    return [_source_from_dict(source) for source in load_snapshot().sources]
 
 
 def load_categories() -> List[Category]:
     """Return the default category configuration."""
 
-    return [Category(name=name, keywords=set(keywords)) for name, keywords in DEFAULT_CATEGORIES.items()]
+    from .articles import Category
+
+    return [Category(name=name, keywords=set(keywords)) for name, keywords in load_snapshot().categories]
+
+
+def load_ranking() -> RankingConfig:
+    """Return ranking settings from ``sources.yaml`` (``ranking`` and per-source ``weight``)."""
+
+    from .ranking import RankingConfig
+
+    snapshot = load_snapshot()
+    weights = {source["name"]: source["weight"] for source in snapshot.sources if "weight" in source}
+    return RankingConfig.from_dict(snapshot.ranking, weights)
+
+
+def load_trend_terms() -> List[str]:
+    """Return extra terms (brands, executives…) listed under ``trends.terms``."""
+
+    return list(load_snapshot().trend_terms)
+
+
+def _snapshot_key(path: Path) -> Dict[str, Any]:
+    try:
+        stat = path.stat()
+        mtime_ns, size = stat.st_mtime_ns, stat.st_size
+    except OSError:
+        mtime_ns = size = None
+    defaults = json.dumps(
+        [DEFAULT_SOURCES, {name: sorted(words) for name, words in DEFAULT_CATEGORIES.items()}],
+        sort_keys=True,
+    )
+    return {
+        "version": SNAPSHOT_VERSION,
+        "path": str(path),
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "defaults": content_hash(defaults),
+    }
+
+
+def _read_snapshot(path: Path, key: Dict[str, Any]) -> Optional[ConfigSnapshot]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload["key"] != key:
+            return None
+        return ConfigSnapshot(
+            key=key,
+            sources=payload["sources"],
+            categories=[(name, words) for name, words in payload["categories"]],
+            ranking=payload.get("ranking", {}),
+            trend_terms=payload.get("trend_terms", []),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _compile(path: Path, key: Dict[str, Any]) -> ConfigSnapshot:
+    sources = DEFAULT_SOURCES
+    ranking: Dict[str, Any] = {}
+    trend_terms: List[str] = []
+    if key["mtime_ns"] is not None:
+        try:
+            import yaml
+        except ModuleNotFoundError:  # pragma: no cover - dependency optional for defaults
+            yaml = None
+        if yaml is not None:
+            with path.open("r", encoding="utf-8") as fh:
+                config = yaml.safe_load(fh) or {}
+            # A file whose ``sources`` block is commented out keeps the defaults.
+            sources = config.get("sources") or DEFAULT_SOURCES
+            ranking = config.get("ranking") or {}
+            trend_terms = [str(term) for term in (config.get("trends") or {}).get("terms", [])]
+    for source in sources:
+        _validate(source)
+    categories = [(name, sorted(words)) for name, words in DEFAULT_CATEGORIES.items()]
+    return ConfigSnapshot(
+        key=key,
+        sources=[dict(source) for source in sources],
+        categories=categories,
+        ranking=dict(ranking),
+        trend_terms=trend_terms,
+    )
+
+
+def _validate(payload: Dict[str, Any]) -> None:
+    kind = payload.get("type", "rss")
+    if kind not in ("rss", "nyt_topstories"):
+        raise ValueError(f"Unsupported source type: {kind}")
+    if "name" not in payload or (kind == "rss" and "url" not in payload):
+        raise ValueError(f"Incomplete source definition: {payload!r}")
+
 
+def _source_from_dict(payload: Dict[str, Any]) -> NewsSource:
+    from .sources import NYTimesTopStoriesSource, RSSNewsSource
 
-def _source_from_dict(payload: Dict[str, str]) -> NewsSource:
     kind = payload.get("type", "rss")
     name = payload["name"]
+    source: NewsSource
     if kind == "rss":
-        return RSSNewsSource(name, payload["url"])
-    if kind == "nyt_topstories":
+        source = RSSNewsSource(name, payload["url"])
+    elif kind == "nyt_topstories":
         section = payload.get("section", "fashion")
-        return NYTimesTopStoriesSource(name, section=section)
-    raise ValueError(f"Unsupported source type: {kind}")
+        source = NYTimesTopStoriesSource(name, section=section)
+    else:
+        raise ValueError(f"Unsupported source type: {kind}")
+    if "interval" in payload:
+        source.interval = float(payload["interval"])
+    return source
@@ -0,0 +1,189 @@
+"""Fast publication-date parsing with per-source format memoisation."""
+
+from __future__ import annotations
+
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+DateFunc = Callable[[str], Optional[datetime]]
+
+MONTHS = {
+    name: index
+    for index, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1
+    )
+}
+
+# RFC 822 zones plus the non-standard abbreviations publishers actually send.
+ZONES = {
+    "ut": 0, "utc": 0, "gmt": 0, "z": 0, "wet": 0,
+    "est": -5, "edt": -4, "cst": -6, "cdt": -5, "mst": -7, "mdt": -6, "pst": -8, "pdt": -7,
+    "bst": 1, "ist": 5.5, "cet": 1, "cest": 2, "met": 1, "mest": 2, "eet": 2, "eest": 3,
+    "msk": 3, "hkt": 8, "sgt": 8, "jst": 9, "kst": 9, "aest": 10, "aedt": 11,
+}
+ZONE_OFFSETS = {name: timedelta(hours=hours) for name, hours in ZONES.items()}
+ZONE_SUFFIXES = {
+    name: f"{'-' if hours < 0 else '+'}{int(abs(hours)):02d}:{int(abs(hours) % 1 * 60):02d}"
+    for name, hours in ZONES.items()
+}
+MONTH_NUMBERS = {name: f"{index:02d}" for name, index in MONTHS.items()}
+_NO_OFFSET = timedelta(0)
+
+RFC822_RE = re.compile(
+    r"\s*(?:[A-Za-z]{2,9},?\s*)?(\d{1,2})[\s-]+([A-Za-z]{3,9})\.?[\s-]+(\d{2,4})"
+    r"(?:\s+|T)(\d{1,2}):(\d{2})(?::(\d{2})(?:\.\d+)?)?"
+    r"\s*(?:([+-])(\d{2}):?(\d{2})|\(?([A-Za-z]{1,5})\)?)?\s*"
+)
+ISO_RE = re.compile(
+    r"\s*(\d{4})-?(\d{2})-?(\d{2})(?:[T ](\d{2}):?(\d{2})(?::?(\d{2})(?:[.,](\d+))?)?)?"
+    r"\s*(?:(Z)|([+-])(\d{2}):?(\d{2})?)?\s*",
+    re.IGNORECASE,
+)
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _iso(value: str) -> Optional[datetime]:
+    """``datetime.fromisoformat`` with a ``Z`` suffix accepted on every Python."""
+
+    text = value.strip()
+    if text[-1:] in ("Z", "z"):
+        text = text[:-1] + "+00:00"
+    return _utc(datetime.fromisoformat(text))
+
+
+def _iso_loose(value: str) -> Optional[datetime]:
+    """ISO 8601 variants ``fromisoformat`` rejects (compact forms, odd fractions)."""
+
+    match = ISO_RE.fullmatch(value)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, zulu, sign, tz_hours, tz_minutes = match.groups()
+    micros = int((fraction or "0")[:6].ljust(6, "0"))
+    parsed = datetime(
+        int(year), int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0), micros,
+        tzinfo=timezone.utc,
+    )
+    if sign and not zulu:
+        offset = timedelta(hours=int(tz_hours), minutes=int(tz_minutes or 0))
+        parsed -= offset if sign == "+" else -offset
+    return parsed
+
+
+def _rfc822(value: str) -> Optional[datetime]:
+    """Well-formed RFC 822/1123 dates, rewritten for the C ``fromisoformat``."""
+
+    parts = value.split()
+    if len(parts) == 6:
+        del parts[0]
+    day, month, year, clock, zone = parts
+    suffix = ZONE_SUFFIXES.get(zone.lower())
+    if suffix is None:
+        if len(zone) != 5 or zone[0] not in "+-":
+            return None
+        suffix = f"{zone[:3]}:{zone[3:]}"
+    parsed = datetime.fromisoformat(f"{year}-{MONTH_NUMBERS[month.lower()]}-{day:0>2}T{clock}{suffix}")
+    return parsed if suffix == "+00:00" else parsed.astimezone(timezone.utc)
+
+
+def _rfc822_loose(value: str) -> Optional[datetime]:
+    """RFC 822 variants: two-digit years, odd separators, unknown zone names."""
+
+    match = RFC822_RE.fullmatch(value)
+    if match is None:
+        return None
+    day, month_name, year, hour, minute, second, sign, tz_hours, tz_minutes, zone = match.groups()
+    month = MONTHS.get(month_name[:3].lower())
+    if month is None:
+        return None
+    full_year = int(year)
+    if len(year) == 2:
+        full_year += 2000 if full_year < 50 else 1900
+    if sign:
+        offset = timedelta(hours=int(tz_hours), minutes=int(tz_minutes))
+        if sign == "-":
+            offset = -offset
+    else:
+        # Unknown zone names are treated as UTC rather than discarding the date.
+        offset = ZONE_OFFSETS.get(zone.lower(), _NO_OFFSET) if zone else _NO_OFFSET
+    parsed = datetime(
+        full_year, month, int(day), int(hour), int(minute), int(second or 0), tzinfo=timezone.utc
+    )
+    return parsed - offset if offset else parsed
+
+
+def _email(value: str) -> Optional[datetime]:
+    return _utc(parsedate_to_datetime(value))
+
+
+#: Candidate parsers, tried in order until one succeeds for a source.
+PARSERS: List[Tuple[str, DateFunc]] = [
+    ("iso", _iso),
+    ("rfc822", _rfc822),
+    ("rfc822-loose", _rfc822_loose),
+    ("iso-loose", _iso_loose),
+    ("email", _email),
+]
+
+
+def _attempt(parser: DateFunc, value: str) -> Optional[datetime]:
+    try:
+        return parser(value)
+    except (TypeError, ValueError, OverflowError, IndexError, KeyError):
+        return None
+
+
+class DateParser:
+    """Parse publication dates, remembering which format each source uses.
+
+    The first date from a source is tried against every candidate in
+    :data:`PARSERS`; the one that succeeds is cached for that source and
+    tried first next time. A miss falls back to the remaining candidates, so
+    a source that changes format is re-detected rather than losing dates.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._by_source: Dict[str, Tuple[str, DateFunc]] = {}
+
+    def parse(self, value: Optional[str], source: str = "") -> Optional[datetime]:
+        """Return ``value`` as an aware UTC datetime, or ``None`` if unparseable."""
+
+        if not value:
+            return None
+        cached = self._by_source.get(source)
+        if cached is not None:
+            parsed = _attempt(cached[1], value)
+            if parsed is not None:
+                return parsed
+        for candidate in PARSERS:
+            if candidate is cached:
+                continue
+            parsed = _attempt(candidate[1], value)
+            if parsed is not None:
+                with self._lock:
+                    self._by_source[source] = candidate
+                return parsed
+        return None
+
+    def formats(self) -> Dict[str, str]:
+        """Return the detected format name for every source seen so far."""
+
+        with self._lock:
+            return {source: name for source, (name, _) in self._by_source.items()}
+
+
+_PARSER = DateParser()
+
+
+def parse_datetime(value: Optional[str], source: str = "") -> Optional[datetime]:
+    """Parse ``value`` with the process-wide :class:`DateParser`."""
+
+    return _PARSER.parse(value, source)
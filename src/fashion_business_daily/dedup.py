@@ -0,0 +1,147 @@
+"""Near-duplicate story detection using MinHash signatures and LSH."""
+
+from __future__ import annotations
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from .articles import Article
+
+_SPACE_RE = re.compile(r"\W+")
+EMPTY = 1 << 32
+
+
+def shingles(text: str, size: int = 5) -> Set[int]:
+    """Return CRC32 hashes of the ``size``-byte shingles of the normalised ``text``."""
+
+    data = _SPACE_RE.sub(" ", text.lower()).strip().encode("utf-8")
+    if len(data) <= size:
+        return {zlib.crc32(data)} if data else set()
+    return set(map(zlib.crc32, [data[i : i + size] for i in range(len(data) - size + 1)]))
+
+
+class MinHasher:
+    """Compute fixed-length MinHash signatures for shingle sets.
+
+    Uses one-permutation hashing: each shingle hash is routed to one of
+    ``num_perm`` bins and every bin keeps its minimum, so a signature costs a
+    single pass over the shingles instead of one pass per permutation.
+
+    Short texts such as headlines leave many bins empty, and identical empty
+    bins would make unrelated signatures collide in the LSH index. Empty bins
+    are therefore densified by rotation: each borrows the value of the next
+    non-empty bin to its right, offset by the distance, so only an empty input
+    yields ``EMPTY`` bins.
+    """
+
+    def __init__(self, num_perm: int = 64) -> None:
+        self.num_perm = num_perm
+
+    def signature(self, hashes: Set[int]) -> Tuple[int, ...]:
+        bins = [EMPTY] * self.num_perm
+        for value in hashes:
+            slot, rank = value % self.num_perm, value // self.num_perm
+            if rank < bins[slot]:
+                bins[slot] = rank
+        if hashes and EMPTY in bins:
+            dense = list(bins)
+            for slot, value in enumerate(bins):
+                if value == EMPTY:
+                    distance = 1
+                    while bins[(slot + distance) % self.num_perm] == EMPTY:
+                        distance += 1
+                    # Offsets above EMPTY keep borrowed values apart from real ranks.
+                    dense[slot] = bins[(slot + distance) % self.num_perm] + distance * (EMPTY + 1)
+            bins = dense
+        return tuple(bins)
+
+
+def similarity(first: Sequence[int], second: Sequence[int]) -> float:
+    """Estimate the Jaccard similarity of two signatures."""
+
+    # Bins that are empty in both signatures carry no information.
+    matches = total = 0
+    for a, b in zip(first, second):
+        if a == b == EMPTY:
+            continue
+        total += 1
+        matches += a == b
+    return matches / total if total else 0.0
+
+
+class LSHIndex:
+    """Banded locality-sensitive hash index over MinHash signatures."""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+
+    def insert(self, key: int, signature: Sequence[int]) -> Set[int]:
+        """Add ``signature`` under ``key`` and return previously indexed candidates."""
+
+        candidates: Set[int] = set()
+        for band in range(self.bands):
+            rows = tuple(signature[band * self.rows : (band + 1) * self.rows])
+            if EMPTY in rows:
+                # Only empty texts leave bins empty; they are similar to nothing.
+                continue
+            bucket = self._buckets[(band, rows)]
+            candidates.update(bucket)
+            bucket.append(key)
+        return candidates
+
+
+def cluster_articles(
+    articles: Iterable[Article],
+    *,
+    threshold: float = 0.6,
+    num_perm: int = 64,
+    bands: int = 16,
+) -> List[Article]:
+    """Collapse near-duplicate stories into one article per cluster.
+
+    The first article of each cluster (in input order) is returned with the
+    other members attached to :attr:`Article.alternates`. Candidate pairs come
+    from the LSH index, so the work grows roughly linearly with the input.
+
+    Only headlines are compared: outlets covering the same story write their
+    own summaries, which would otherwise drown out a shared headline. The
+    threshold sits above the 0.5 that headlines differing in a single name
+    ("Gucci names new CEO", "Prada names new CEO") tend to reach.
+    """
+
+    items = list(articles)
+    hasher = MinHasher(num_perm)
+    index = LSHIndex(num_perm, bands)
+    parent = list(range(len(items)))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    signatures: List[Tuple[int, ...]] = []
+    for position, article in enumerate(items):
+        signature = hasher.signature(shingles(article.title))
+        signatures.append(signature)
+        for candidate in index.insert(position, signature):
+            if similarity(signature, signatures[candidate]) >= threshold:
+                root, other_root = find(position), find(candidate)
+                if root != other_root:
+                    parent[max(root, other_root)] = min(root, other_root)
+
+    clusters: Dict[int, List[Article]] = {}
+    for position, article in enumerate(items):
+        clusters.setdefault(find(position), []).append(article)
+    primaries: List[Article] = []
+    for members in clusters.values():
+        primary = members[0]
+        primary.alternates = [member for member in members[1:] if member.url != primary.url]
+        primaries.append(primary)
+    return primaries
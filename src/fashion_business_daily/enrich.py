@@ -0,0 +1,376 @@
+"""Fetch article pages for stories with truncated summaries and reclassify them."""
+
+from __future__ import annotations
+
+import codecs
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .articles import Article
+from .classifier import CategoryClassifier
+from .metrics import get_recorder
+from .sources import HTTPTransport, get_transport
+from .store import article_key
+
+LOGGER = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    text TEXT NOT NULL,
+    fetched TEXT NOT NULL
+);
+"""
+
+CHARSET_RE = re.compile(r"""charset=["']?([\w.:-]+)""", re.IGNORECASE)
+# Only the start of a page is searched for a ``<meta charset>`` declaration.
+META_CHARSET_BYTES = 4096
+
+# Tags whose text is page chrome rather than the story itself.
+SKIP_TAGS = {"script", "style", "noscript", "nav", "header", "footer", "aside", "form", "figure"}
+
+
+class ContentCache:
+    """Extracted page text keyed by normalised URL, kept across runs in SQLite.
+
+    Pages that answered with a client error are cached as empty text, so every
+    article page is requested at most once.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        if str(path) != ":memory:":
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "ContentCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()
+        return count
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Return the cached text for each of ``keys`` that has been fetched before."""
+
+        keys = list(keys)
+        found: Dict[str, str] = {}
+        with self._lock:
+            for offset in range(0, len(keys), 500):
+                chunk = keys[offset : offset + 500]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(
+                    self._conn.execute(
+                        f"SELECT key, text FROM pages WHERE key IN ({placeholders})", chunk
+                    )
+                )
+        return found
+
+    def put(self, key: str, url: str, text: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (key, url, text, fetched) VALUES (?, ?, ?, ?)",
+                (key, url, text, datetime.now(timezone.utc).isoformat()),
+            )
+
+
+class _TextExtractor(HTMLParser):
+    """Collect paragraph text, preferring paragraphs inside ``<article>``."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.paragraphs: List[str] = []
+        self.article_paragraphs: List[str] = []
+        self._skip = 0
+        self._in_article = 0
+        self._current: Optional[List[str]] = None
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag in SKIP_TAGS:
+            self._skip += 1
+        elif tag == "article":
+            self._in_article += 1
+        elif tag == "p" and not self._skip:
+            self._flush()
+            self._current = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIP_TAGS:
+            self._skip = max(self._skip - 1, 0)
+        elif tag == "article":
+            self._flush()
+            self._in_article = max(self._in_article - 1, 0)
+        elif tag == "p":
+            self._flush()
+
+    def handle_data(self, data: str) -> None:
+        if self._current is not None and not self._skip:
+            self._current.append(data)
+
+    def _flush(self) -> None:
+        if self._current is None:
+            return
+        text = " ".join("".join(self._current).split())
+        self._current = None
+        if text:
+            self.paragraphs.append(text)
+            if self._in_article:
+                self.article_paragraphs.append(text)
+
+
+def page_encoding(content_type: str, body: bytes) -> str:
+    """Return the charset a page declares in its header or ``<meta>`` tag, else UTF-8.
+
+    requests assumes ISO-8859-1 for ``text/html`` without a charset, which
+    garbles the UTF-8 most pages are served in.
+    """
+
+    match = CHARSET_RE.search(content_type)
+    if match is None:
+        match = CHARSET_RE.search(body[:META_CHARSET_BYTES].decode("ascii", errors="replace"))
+    if match is not None:
+        try:
+            return codecs.lookup(match.group(1)).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def extract_text(html: str) -> str:
+    """Return the main text of an HTML page, one paragraph per line."""
+
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    parser._flush()
+    return "\n".join(parser.article_paragraphs or parser.paragraphs)
+
+
+@dataclass
+class EnrichResult:
+    """What one :meth:`Enricher.enrich` call did."""
+
+    candidates: int = 0
+    cached: int = 0
+    fetched: int = 0
+    failed: int = 0
+    skipped: int = 0
+    bytes: int = 0
+    reclassified: int = 0
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+class Enricher:
+    """Reclassify short-summary articles using the text of their pages.
+
+    Articles whose summary is shorter than ``min_summary`` characters have
+    their page downloaded (at most ``per_host`` at once per host, ``workers``
+    overall), reduced to its paragraph text and classified again together with
+    the title and summary. Downloads stop once ``max_bytes`` have been read or
+    ``time_budget`` seconds have passed; remaining articles keep the
+    categories they already have. With a :class:`ContentCache` each page is
+    downloaded once and served from the cache on later runs.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: Optional[ContentCache] = None,
+        min_summary: int = 200,
+        workers: int = 4,
+        per_host: int = 2,
+        max_bytes: int = 16 << 20,
+        max_page_bytes: int = 1 << 20,
+        time_budget: float = 30.0,
+        timeout: float = 10.0,
+        transport: Optional[HTTPTransport] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if workers < 1 or per_host < 1:
+            raise ValueError("workers and per_host must be at least 1")
+        self.cache = cache
+        self.min_summary = min_summary
+        self.workers = workers
+        self.per_host = per_host
+        self.max_bytes = max_bytes
+        self.max_page_bytes = max_page_bytes
+        self.time_budget = time_budget
+        self.timeout = timeout
+        self.transport = transport
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._ends_at = 0.0
+
+    def enrich(self, articles: Iterable[Article], classifier: CategoryClassifier) -> EnrichResult:
+        """Reclassify every article in ``articles`` whose summary looks truncated."""
+
+        result = EnrichResult()
+        pending: Dict[str, List[Article]] = {}
+        for article in articles:
+            if article.url and len(article.summary.strip()) < self.min_summary:
+                pending.setdefault(article_key(article), []).append(article)
+        result.candidates = len(pending)
+        if not pending:
+            return result
+
+        texts: Dict[str, str] = {}
+        if self.cache is not None:
+            texts = self.cache.get_many(pending)
+            result.cached = len(texts)
+        to_fetch = {key: group[0].url for key, group in pending.items() if key not in texts}
+        if to_fetch:
+            with get_recorder().timer("enrich_seconds"):
+                fetched = self._fetch_all(to_fetch, result)
+            texts.update(fetched)
+
+        for key, text in texts.items():
+            if not text:
+                continue
+            for article in pending[key]:
+                before = article.category_mask
+                mask = classifier.mask_for(f"{article.title}\n{article.summary}\n{text}")
+                article.category_mask = classifier.table_mask(mask)
+                result.reclassified += article.category_mask != before
+        get_recorder().observe("enrich_bytes", result.bytes)
+        LOGGER.info(
+            "Enrichment: %d short summaries, %d from cache, %d fetched (%d KiB), "
+            "%d failed, %d over budget, %d reclassified",
+            result.candidates,
+            result.cached,
+            result.fetched,
+            result.bytes // 1024,
+            result.failed,
+            result.skipped,
+            result.reclassified,
+        )
+        return result
+
+    def _fetch_all(self, urls: Dict[str, str], result: EnrichResult) -> Dict[str, str]:
+        """Download ``urls`` (keyed by article key) within the byte and time budget.
+
+        Pages wait in per-host queues and are only handed to the pool while
+        their host has a free slot, so a busy host never parks worker threads
+        that pages from other hosts could use.
+        """
+
+        self._bytes = 0
+        self._ends_at = self._clock() + self.time_budget
+        texts: Dict[str, str] = {}
+        queues: Dict[str, Deque[Tuple[str, str]]] = {}
+        for key, url in urls.items():
+            queues.setdefault(urlsplit(url).netloc.lower(), deque()).append((key, url))
+        active: Dict[str, int] = dict.fromkeys(queues, 0)
+        futures: Dict[Future, Tuple[str, str]] = {}
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.workers, len(urls)), thread_name_prefix="enrich"
+        )
+
+        def submit_ready() -> None:
+            for host in list(queues):
+                queue = queues[host]
+                while queue and active[host] < self.per_host and len(futures) < self.workers:
+                    key, url = queue.popleft()
+                    futures[executor.submit(self._fetch, url)] = (key, host)
+                    active[host] += 1
+                if not queue:
+                    del queues[host]
+
+        try:
+            submit_ready()
+            while futures:
+                remaining = max(self._ends_at - self._clock(), 0)
+                done, _ = wait(futures, timeout=remaining, return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    key, host = futures.pop(future)
+                    active[host] -= 1
+                    try:
+                        text = future.result()
+                    except _BudgetExceeded:
+                        result.skipped += 1
+                        continue
+                    except Exception as exc:
+                        LOGGER.debug("Could not enrich %s: %s", urls[key], exc)
+                        result.failed += 1
+                        continue
+                    if text is None:
+                        result.failed += 1
+                        text = ""
+                    else:
+                        result.fetched += 1
+                    texts[key] = text
+                    if self.cache is not None:
+                        self.cache.put(key, urls[key], text)
+                submit_ready()
+            result.skipped += len(futures) + sum(len(queue) for queue in queues.values())
+        finally:
+            # Stragglers stop on their own at the next budget check.
+            executor.shutdown(wait=False, cancel_futures=True)
+        result.bytes = self._bytes
+        return texts
+
+    def _fetch(self, url: str) -> Optional[str]:
+        """Return the page text, ``None`` for a client error, or raise."""
+
+        self._check_budget()
+        transport = self.transport or get_transport()
+        timeout = min(self.timeout, max(self._ends_at - self._clock(), 0.1))
+        response = transport.get(url, timeout=timeout, stream=True)
+        try:
+            if 400 <= response.status_code < 500:
+                return None
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "text/html")
+            if "html" not in content_type:
+                return None
+            response.raw.decode_content = True
+            chunks: List[bytes] = []
+            size = 0
+            while size < self.max_page_bytes:
+                chunk = response.raw.read(min(64 << 10, self.max_page_bytes - size))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size += len(chunk)
+                self._charge(len(chunk))
+        finally:
+            response.close()
+        body = b"".join(chunks)
+        return extract_text(body.decode(page_encoding(content_type, body), errors="replace"))
+
+    def _check_budget(self) -> None:
+        with self._lock:
+            if self._bytes >= self.max_bytes or self._clock() >= self._ends_at:
+                raise _BudgetExceeded()
+
+    def _charge(self, size: int) -> None:
+        with self._lock:
+            self._bytes += size
+        self._check_budget()
@@ -0,0 +1,61 @@
+"""Small filesystem helpers shared by the output writers."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, TextIO
+
+
+def content_hash(content: str) -> str:
+    """Return the SHA-256 hex digest of ``content``."""
+
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def file_hash(path: Path) -> str:
+    """Return the SHA-256 hex digest of ``path`` or ``""`` if it cannot be read."""
+
+    digest = hashlib.sha256()
+    try:
+        with path.open("rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 16), b""):
+                digest.update(chunk)
+    except OSError:
+        return ""
+    return digest.hexdigest()
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Write ``content`` to ``path`` via a temporary file and an atomic rename."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def open_atomic(path: Path) -> Iterator[TextIO]:
+    """Open a temporary file for streaming output, renamed onto ``path`` on success."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as fh:
+            yield fh
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Atomically write ``content`` to ``path`` unless it is already there."""
+
+    if file_hash(path) == content_hash(content):
+        return False
+    write_atomic(path, content)
+    return True
@@ -0,0 +1,147 @@
+"""Per-source circuit breaker persisted between runs."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .fsutil import write_atomic
+
+LOGGER = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+@dataclass
+class SourceHealth:
+    """Success and failure history of one source."""
+
+    consecutive_failures: int = 0
+    failures: int = 0
+    successes: int = 0
+    last_error: Optional[str] = None
+    last_success: Optional[float] = None
+    open_until: Optional[float] = None
+
+
+class HealthTracker:
+    """Skip sources that keep failing and probe them again with backoff.
+
+    After ``failure_threshold`` consecutive failures a source's circuit opens
+    and it is skipped for ``base_backoff`` seconds, doubling with every further
+    failure up to ``max_backoff``. Once the backoff expires the circuit is
+    half-open: the source is fetched once with ``probe_timeout`` and either
+    closes again on success or reopens with a longer backoff.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        *,
+        failure_threshold: int = 3,
+        base_backoff: float = 15 * 60,
+        max_backoff: float = 24 * 3600,
+        probe_timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.path = path
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.probe_timeout = probe_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sources: Dict[str, SourceHealth] = {}
+        self._load()
+
+    def state(self, name: str) -> str:
+        """Return ``closed``, ``open`` or ``half-open`` for the source ``name``."""
+
+        with self._lock:
+            health = self._sources.get(name)
+            if health is None or health.open_until is None:
+                return CLOSED
+            return OPEN if self._clock() < health.open_until else HALF_OPEN
+
+    def record_success(self, name: str) -> None:
+        with self._lock:
+            health = self._sources.setdefault(name, SourceHealth())
+            if health.open_until is not None:
+                LOGGER.info("%s recovered after %d failures", name, health.consecutive_failures)
+            health.successes += 1
+            health.consecutive_failures = 0
+            health.open_until = None
+            health.last_success = self._clock()
+
+    def record_failure(self, name: str, error: BaseException | str) -> None:
+        with self._lock:
+            health = self._sources.setdefault(name, SourceHealth())
+            health.failures += 1
+            health.consecutive_failures += 1
+            health.last_error = str(error) or type(error).__name__
+            excess = health.consecutive_failures - self.failure_threshold
+            if excess >= 0:
+                backoff = min(self.base_backoff * 2 ** min(excess, 32), self.max_backoff)
+                health.open_until = self._clock() + backoff
+                LOGGER.warning(
+                    "%s failed %d times in a row; skipping it for %s",
+                    name,
+                    health.consecutive_failures,
+                    _format_seconds(backoff),
+                )
+
+    def report(self) -> List[str]:
+        """Describe every source that is currently failing, one line each."""
+
+        lines: List[str] = []
+        with self._lock:
+            now = self._clock()
+            for name, health in sorted(self._sources.items()):
+                if not health.consecutive_failures:
+                    continue
+                if health.open_until is None:
+                    status = "failing"
+                elif now < health.open_until:
+                    status = f"open, next probe in {_format_seconds(health.open_until - now)}"
+                else:
+                    status = "half-open, probing on next run"
+                lines.append(
+                    f"{name}: {status} ({health.consecutive_failures} consecutive failures;"
+                    f" last error: {health.last_error})"
+                )
+        return lines
+
+    def save(self) -> None:
+        """Persist the tracker to :attr:`path` atomically (no-op without a path)."""
+
+        if self.path is None:
+            return
+        with self._lock:
+            payload = {name: asdict(health) for name, health in self._sources.items()}
+        write_atomic(self.path, json.dumps(payload, indent=2, sort_keys=True))
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            self._sources = {name: SourceHealth(**data) for name, data in payload.items()}
+        except (OSError, ValueError, TypeError) as exc:
+            LOGGER.warning("Ignoring unreadable source health file %s: %s", self.path, exc)
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 3600:
+        return f"{seconds / 3600:.1f}h"
+    if seconds >= 60:
+        return f"{seconds / 60:.0f}m"
+    return f"{seconds:.0f}s"
@@ -0,0 +1,127 @@
+"""Lightweight run metrics with JSON and Prometheus textfile output."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .fsutil import write_atomic
+
+PROMETHEUS_PREFIX = "fashion_business_daily_"
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+
+@dataclass
+class Metric:
+    """Accumulated observations for one metric name and label set."""
+
+    name: str
+    labels: Dict[str, str]
+    value: float = 0.0
+    count: int = 0
+
+
+class MetricsRecorder:
+    """Thread-safe collector of per-stage timings and counters."""
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: Dict[Tuple[str, LabelSet], Metric] = {}
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Add ``value`` to the metric ``name`` with the given ``labels``."""
+
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = self._metrics[key] = Metric(name=name, labels=dict(labels))
+            metric.value += value
+            metric.count += 1
+
+    @contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        """Record the wall-clock duration of the ``with`` block in seconds."""
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def metrics(self) -> List[Metric]:
+        with self._lock:
+            return sorted(
+                (Metric(m.name, dict(m.labels), m.value, m.count) for m in self._metrics.values()),
+                key=lambda m: (m.name, sorted(m.labels.items())),
+            )
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "metrics": [
+                {"name": m.name, "labels": m.labels, "value": m.value, "count": m.count}
+                for m in self.metrics()
+            ],
+        }
+
+    def to_prometheus(self) -> str:
+        """Render metrics in the Prometheus text exposition format."""
+
+        lines: List[str] = []
+        current: Optional[str] = None
+        for metric in self.metrics():
+            name = PROMETHEUS_PREFIX + metric.name
+            if name != current:
+                lines.append(f"# TYPE {name} gauge")
+                current = name
+            labels = ",".join(
+                f'{key}="{_escape_label(value)}"' for key, value in sorted(metric.labels.items())
+            )
+            lines.append(f"{name}{{{labels}}} {metric.value:g}" if labels else f"{name} {metric.value:g}")
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path: Path) -> None:
+        write_atomic(path, json.dumps(self.to_dict(), indent=2) + "\n")
+
+    def write_prometheus(self, path: Path) -> None:
+        # node_exporter's textfile collector must never see a partial file.
+        write_atomic(path, self.to_prometheus())
+
+
+class NullRecorder(MetricsRecorder):
+    """Recorder that discards every observation."""
+
+    enabled = False
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        return None
+
+
+_RECORDER: MetricsRecorder = NullRecorder()
+
+
+def get_recorder() -> MetricsRecorder:
+    """Return the process-wide metrics recorder."""
+
+    return _RECORDER
+
+
+def set_recorder(recorder: Optional[MetricsRecorder]) -> None:
+    """Install ``recorder`` process-wide (``None`` disables metrics)."""
+
+    global _RECORDER
+    _RECORDER = recorder if recorder is not None else NullRecorder()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,128 @@
+"""Parse and classify raw feed bodies on a pool of worker processes."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from .articles import Article, Category
+from .classifier import CategoryClassifier
+from .sources import RawFeed, parse_raw
+
+# What a worker sends back per article: title, url, summary, published
+# timestamp and category bitmask. Tuples of primitives pickle far smaller
+# and faster than Article instances.
+Row = Tuple[str, str, str, Optional[float], int]
+
+_CLASSIFIER: Optional[CategoryClassifier] = None
+
+
+class FeedParseError(Exception):
+    """A raw feed could not be parsed in a worker process."""
+
+
+ParseResult = Union[List[Article], FeedParseError]
+
+
+class ParsePipeline:
+    """Parse and classify :class:`RawFeed` batches across CPU cores.
+
+    Feeds are grouped into batches of roughly ``batch_bytes`` so each task
+    amortises the round trip to a worker, and every worker builds its
+    :class:`CategoryClassifier` once when it starts.
+    """
+
+    def __init__(
+        self,
+        categories: Iterable[Category],
+        *,
+        workers: Optional[int] = None,
+        batch_bytes: int = 1 << 20,
+        word_boundaries: bool = True,
+    ) -> None:
+        self.categories = list(categories)
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_bytes = batch_bytes
+        self._classifier = CategoryClassifier(self.categories, word_boundaries=word_boundaries)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.categories, word_boundaries),
+        )
+
+    def __enter__(self) -> "ParsePipeline":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def parse(self, raws: Sequence[RawFeed]) -> List[ParseResult]:
+        """Return classified articles (or the parse error) for each of ``raws``, in order."""
+
+        batches = self._batches(raws)
+        futures = [self._executor.submit(_parse_batch, batch) for batch in batches]
+        results: List[ParseResult] = []
+        for future, raw_batch in zip(futures, batches):
+            for raw, rows in zip(raw_batch, future.result()):
+                if isinstance(rows, str):
+                    results.append(FeedParseError(rows))
+                else:
+                    results.append([self._article(raw.source, row) for row in rows])
+        return results
+
+    def _batches(self, raws: Sequence[RawFeed]) -> List[List[RawFeed]]:
+        batches: List[List[RawFeed]] = []
+        size = 0
+        for raw in raws:
+            if not batches or size >= self.batch_bytes:
+                batches.append([])
+                size = 0
+            batches[-1].append(raw)
+            size += len(raw.body)
+        return batches
+
+    def _article(self, source: str, row: Row) -> Article:
+        title, url, summary, published, mask = row
+        return Article(
+            source=source,
+            title=title,
+            url=url,
+            summary=summary,
+            published=None if published is None else datetime.fromtimestamp(published, timezone.utc),
+            category_mask=self._classifier.table_mask(mask),
+        )
+
+
+def _init_worker(categories: List[Category], word_boundaries: bool) -> None:
+    global _CLASSIFIER
+    _CLASSIFIER = CategoryClassifier(categories, word_boundaries=word_boundaries)
+
+
+def _parse_batch(batch: List[RawFeed]) -> List[Union[List[Row], str]]:
+    classifier = _CLASSIFIER
+    assert classifier is not None, "worker not initialised"
+    results: List[Union[List[Row], str]] = []
+    for raw in batch:
+        try:
+            articles = parse_raw(raw)
+        except Exception as exc:  # reported back to the parent per feed
+            results.append(f"{type(exc).__name__}: {exc}")
+            continue
+        results.append(
+            [
+                (
+                    article.title,
+                    article.url,
+                    article.summary,
+                    article.published.timestamp() if article.published else None,
+                    classifier.mask_for(f"{article.title}\n{article.summary}"),
+                )
+                for article in articles
+            ]
+        )
+    return results
@@ -0,0 +1,131 @@
+"""Score articles for relevance and keep the best few per category."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .articles import Article, Category
+from .classifier import CategoryClassifier
+
+# Heap key for articles without any category (rendered under "General").
+_UNCATEGORISED = -1
+
+
+@dataclass
+class RankingConfig:
+    """Ranking weights, usually read from the ``ranking`` block of ``sources.yaml``.
+
+    An article scores ``source weight × (recency × decay + keywords ×
+    log(1 + keyword hits) + coverage × log(1 + other sources))`` where
+    ``decay`` halves every ``half_life_hours``. Undated articles count as one
+    half-life old.
+    """
+
+    top_k: Optional[int] = None
+    recency: float = 1.0
+    keywords: float = 0.5
+    coverage: float = 0.75
+    half_life_hours: float = 24.0
+    source_weights: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(
+        cls, payload: Mapping[str, Any], source_weights: Optional[Mapping[str, float]] = None
+    ) -> "RankingConfig":
+        """Build a config from a ``ranking`` block and per-source ``weight`` values."""
+
+        weights = payload.get("weights") or {}
+        unknown = set(weights) - {"recency", "keywords", "coverage"}
+        if unknown:
+            raise ValueError(f"Unknown ranking weights: {', '.join(sorted(unknown))}")
+        top_k = int(payload.get("top_k") or 0)
+        if top_k < 0:
+            raise ValueError(f"ranking.top_k must be 0 (off) or more, got {top_k}")
+        half_life_hours = float(payload.get("half_life_hours", 24.0))
+        if half_life_hours <= 0:
+            raise ValueError(f"ranking.half_life_hours must be positive, got {half_life_hours:g}")
+        return cls(
+            top_k=top_k or None,
+            half_life_hours=half_life_hours,
+            source_weights={name: float(weight) for name, weight in (source_weights or {}).items()},
+            **{name: float(value) for name, value in weights.items()},
+        )
+
+
+class Ranker:
+    """Keep the ``top_k`` highest-scoring articles of every category.
+
+    Articles are streamed through one bounded min-heap per category, so memory
+    stays proportional to ``top_k`` times the number of categories however many
+    articles are fed in. An article with several categories is kept if it makes
+    the cut in any of them.
+    """
+
+    def __init__(
+        self,
+        categories: Iterable[Category],
+        config: Optional[RankingConfig] = None,
+        *,
+        word_boundaries: bool = True,
+    ) -> None:
+        self.config = config or RankingConfig()
+        if not self.config.top_k or self.config.top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        self.classifier = CategoryClassifier(categories, word_boundaries=word_boundaries)
+
+    def score(self, article: Article, now: Optional[datetime] = None) -> float:
+        """Return the relevance score of ``article`` at ``now`` (default: current time)."""
+
+        config = self.config
+        if article.published is None:
+            decay = 0.5
+        else:
+            now = now or datetime.now(timezone.utc)
+            age_hours = max((now - article.published).total_seconds(), 0.0) / 3600
+            decay = 0.5 ** (age_hours / config.half_life_hours)
+        hits = self.classifier.hit_count(f"{article.title}\n{article.summary}")
+        relevance = (
+            config.recency * decay
+            + config.keywords * math.log1p(hits)
+            + config.coverage * math.log1p(len(article.alternates))
+        )
+        return config.source_weights.get(article.source, 1.0) * relevance
+
+    def select(self, articles: Iterable[Article], now: Optional[datetime] = None) -> List[Article]:
+        """Return the kept articles from ``articles``, best first."""
+
+        now = now or datetime.now(timezone.utc)
+        top_k = self.config.top_k
+        heaps: Dict[int, List[Tuple[float, int, Article]]] = {}
+        for sequence, article in enumerate(articles):
+            score = self.score(article, now)
+            # Ties keep the earlier article: later ones carry a smaller key.
+            entry = (score, -sequence, article)
+            for bit in _bits(article.category_mask):
+                heap = heaps.setdefault(bit, [])
+                if len(heap) < top_k:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
+
+        kept: Dict[int, Tuple[float, int, Article]] = {}
+        for heap in heaps.values():
+            for entry in heap:
+                kept[-entry[1]] = entry
+        ranked = sorted(kept.values(), key=lambda entry: entry[:2], reverse=True)
+        return [article for _, _, article in ranked]
+
+
+def _bits(mask: int) -> List[int]:
+    if not mask:
+        return [_UNCATEGORISED]
+    bits = []
+    while mask:
+        low = mask & -mask
+        bits.append(low.bit_length() - 1)
+        mask ^= low
+    return bits
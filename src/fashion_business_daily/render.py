@@ -0,0 +1,113 @@
+"""Shared render plan: group articles once, then stream each output format."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, TextIO, Union
+
+from .articles import Article, ArticleBatch, ArticleRef, Articles, as_batch
+from .metrics import get_recorder
+
+if TYPE_CHECKING:  # pragma: no cover - import-time hints only
+    from .trends import Trend
+
+DEFAULT_TITLE = "Fashion Business Daily"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class RenderPlan:
+    """Articles grouped by category, in render order, shared by every renderer.
+
+    Build one plan per aggregation and hand it to the Markdown, HTML and JSON
+    writers: the grouping happens once, and each writer streams the sections
+    to its file handle instead of assembling the whole document in memory.
+    ``articles`` keeps the ungrouped batch for outputs such as the search index,
+    and ``trends`` lists the trending terms shown above the sections.
+    """
+
+    articles: ArticleBatch
+    sections: Dict[str, ArticleBatch]
+    updated: datetime = field(default_factory=_utcnow)
+    title: str = DEFAULT_TITLE
+    trends: List[Trend] = field(default_factory=list)
+
+    @classmethod
+    def build(
+        cls,
+        articles: Articles,
+        *,
+        title: str = DEFAULT_TITLE,
+        updated: Optional[datetime] = None,
+        trends: Iterable[Trend] = (),
+    ) -> "RenderPlan":
+        """Group ``articles`` by category label, sorted for rendering."""
+
+        with get_recorder().timer("render_seconds", output="plan"):
+            batch = as_batch(articles)
+            grouped = batch.group_by_categories()
+            sections = {label: grouped[label] for label in sorted(grouped)}
+        return cls(batch, sections, updated or _utcnow(), title, list(trends))
+
+    @property
+    def stamp(self) -> str:
+        """The "Last updated" timestamp shown by the human-readable outputs."""
+
+        return self.updated.strftime("%Y-%m-%d %H:%M %Z")
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+
+def as_plan(articles: Union[Articles, RenderPlan], *, title: str = DEFAULT_TITLE) -> RenderPlan:
+    """Return ``articles`` unchanged if it is already a plan, otherwise build one."""
+
+    if isinstance(articles, RenderPlan):
+        return articles
+    return RenderPlan.build(articles, title=title)
+
+
+def article_payload(article: Union[Article, ArticleRef]) -> Dict[str, Any]:
+    """Return the JSON form of ``article`` shared by the JSON outputs."""
+
+    return {
+        "source": article.source,
+        "title": article.title,
+        "url": article.url,
+        "summary": article.summary,
+        "published": article.published.isoformat() if article.published else None,
+        "categories": list(article.categories),
+        "alternates": [
+            {"source": alternate.source, "url": alternate.url} for alternate in article.alternates
+        ],
+    }
+
+
+def describe_trend(trend: Trend) -> str:
+    """Return the one-line summary of ``trend`` used by the human-readable outputs."""
+
+    stories = "story" if trend.count == 1 else "stories"
+    return f"{trend.count} {stories} today vs {trend.mean:.1f}/day usually (z = {trend.zscore:.1f})"
+
+
+def write_json(plan: RenderPlan, fh: TextIO) -> None:
+    """Stream ``plan`` to ``fh`` as a JSON document, one article at a time."""
+
+    with get_recorder().timer("render_seconds", output="json"):
+        fh.write(
+            f'{{"title": {json.dumps(plan.title)}, '
+            f'"updated": {json.dumps(plan.updated.isoformat())}, '
+            f'"trends": {json.dumps([asdict(trend) for trend in plan.trends])}, "sections": ['
+        )
+        for position, (category, batch) in enumerate(plan.sections.items()):
+            fh.write(f'{", " if position else ""}{{"category": {json.dumps(category)}, "articles": [')
+            for index, article in enumerate(batch):
+                payload = json.dumps(article_payload(article), ensure_ascii=False)
+                fh.write(f'{", " if index else ""}{payload}')
+            fh.write("]}")
+        fh.write("]}\n")
@@ -2,51 +2,105 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import io
+import os
 from datetime import datetime, timezone
+from itertools import zip_longest
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, TextIO, Union
 
-from .articles import Article
+from .articles import Articles
+from .metrics import get_recorder
+from .render import RenderPlan, as_plan, describe_trend
 
 
-def build_markdown_digest(articles: Iterable[Article]) -> str:
-    """Return a markdown digest grouped by category."""
+def build_markdown_digest(articles: Union[Articles, RenderPlan]) -> str:
+    """Return a markdown digest grouped by category.
 
-    grouped = defaultdict(list)
-    for article in articles:
-        key = ", ".join(article.categories) if article.categories else "General"
-        grouped[key].append(article)
+    Accepts a list, an :class:`ArticleBatch` or a prebuilt :class:`RenderPlan`;
+    use :func:`write_markdown` to stream the digest to a file instead.
+    """
 
-    lines = ["# Fashion Business Daily", ""]
-    lines.append(
-        f"_Last updated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M %Z')}_"
-    )
-    lines.append("")
+    buffer = io.StringIO()
+    write_markdown(as_plan(articles), buffer)
+    return buffer.getvalue()
 
-    for category in sorted(grouped.keys()):
-        lines.append(f"## {category}")
-        lines.append("")
-        for article in grouped[category]:
-            timestamp = (
-                article.published.strftime("%Y-%m-%d %H:%M %Z")
-                if article.published
-                else "Unknown"
-            )
-            lines.append(
-                f"- [{article.title}]({article.url}) — {article.source} ({timestamp})\n  "
-                f"  {article.summary.strip()}"
-            )
-        lines.append("")
 
-    return "\n".join(lines).strip() + "\n"
+def write_markdown(plan: RenderPlan, fh: TextIO) -> None:
+    """Stream the markdown digest for ``plan`` to ``fh``, one entry at a time."""
 
+    with get_recorder().timer("render_seconds", output="markdown"):
+        fh.write(f"# {plan.title}\n\n_Last updated: {plan.stamp}_\n")
+        if plan.trends:
+            fh.write("\n## Trending\n\n")
+            for trend in plan.trends:
+                fh.write(f"- **{trend.term}** ({trend.kind}): {describe_trend(trend)}\n")
+        for category, articles in plan.sections.items():
+            fh.write(f"\n## {category}\n\n")
+            for article in articles:
+                timestamp = (
+                    article.published.strftime("%Y-%m-%d %H:%M %Z")
+                    if article.published
+                    else "Unknown"
+                )
+                fh.write(
+                    f"- [{article.title}]({article.url}) — {article.source} ({timestamp})\n  "
+                    f"  {article.summary.strip()}\n"
+                )
+                if article.alternates:
+                    links = ", ".join(
+                        f"[{alternate.source}]({alternate.url})" for alternate in article.alternates
+                    )
+                    fh.write(f"    _Also covered by: {links}_\n")
 
-def write_digest(markdown: str, output_dir: Path) -> Path:
-    """Write the markdown digest to ``output_dir`` with a dated filename."""
+
+def write_digest(digest: Union[str, RenderPlan], output_dir: Path) -> Path:
+    """Write the markdown digest to ``output_dir`` with a dated filename.
+
+    ``digest`` is either rendered markdown or a :class:`RenderPlan`, which is
+    streamed straight to disk.
+    """
 
     output_dir.mkdir(parents=True, exist_ok=True)
     filename = f"daily_digest_{datetime.now(timezone.utc).strftime('%Y_%m_%d')}.md"
     path = output_dir / filename
-    path.write_text(markdown, encoding="utf-8")
+    tmp_path = path.with_name(f".{filename}.tmp")
+    with get_recorder().timer("write_seconds", output="markdown"):
+        with tmp_path.open("w", encoding="utf-8") as fh:
+            if isinstance(digest, RenderPlan):
+                write_markdown(digest, fh)
+            else:
+                fh.write(digest)
+        # Leave the file alone when only the "Last updated" stamp would change.
+        if path.exists() and _same_without_timestamp(path, tmp_path):
+            tmp_path.unlink()
+            return path
+        os.replace(tmp_path, path)
+    return path
+
+
+def _same_without_timestamp(left: Path, right: Path) -> bool:
+    with left.open(encoding="utf-8") as first, right.open(encoding="utf-8") as second:
+        for line_a, line_b in zip_longest(_content_lines(first), _content_lines(second)):
+            if line_a != line_b:
+                return False
+    return True
+
+
+def _content_lines(lines: Iterable[str]) -> Iterator[str]:
+    return (line.rstrip("\n") for line in lines if not line.startswith("_Last updated:"))
+
+
+def write_digest_index(output_dir: Path) -> Path:
+    """Write ``index.md`` in ``output_dir`` linking every dated digest, newest first."""
+
+    digests = sorted(output_dir.glob("daily_digest_*.md"), reverse=True)
+    lines = ["# Fashion Business Daily archive", ""]
+    for digest in digests:
+        day = digest.stem.removeprefix("daily_digest_").replace("_", "-")
+        lines.append(f"- [{day}]({digest.name})")
+    path = output_dir / "index.md"
+    content = "\n".join(lines).strip() + "\n"
+    if not path.exists() or path.read_text(encoding="utf-8") != content:
+        path.write_text(content, encoding="utf-8")
     return path
@@ -0,0 +1,188 @@
+"""Adaptive per-source polling for the long-running ``serve`` mode."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from .articles import Article
+from .health import HALF_OPEN, OPEN, HealthTracker
+from .metrics import get_recorder
+from .sources import NewsSource, poll_hint
+
+LOGGER = logging.getLogger(__name__)
+
+# Interval multipliers applied after each poll.
+SPEED_UP = 0.5
+SLOW_DOWN = 1.5
+ERROR_BACKOFF = 2.0
+
+
+@dataclass
+class SourceState:
+    """Polling state kept for one source."""
+
+    source: NewsSource
+    interval: float
+    next_poll: float = 0.0
+    polls: int = 0
+    changes: int = 0
+    errors: int = 0
+    seen: Set[str] = field(default_factory=set)
+    articles: List[Article] = field(default_factory=list)
+
+
+class PollScheduler:
+    """Poll each source on its own adaptive interval and debounce rebuilds.
+
+    A source starts at its configured ``interval`` (or ``default_interval``).
+    Each poll that brings new stories halves the interval and each poll that
+    does not stretches it, within ``min_interval``..``max_interval``; failures
+    back off further. A server's ``Retry-After``, ``Cache-Control: max-age``
+    or RSS ``ttl`` is a floor for the next poll. When new stories arrive,
+    ``on_change`` is called once ``debounce`` seconds later with the latest
+    articles of every source, so a burst of updates causes a single rebuild.
+    With ``health``, sources whose circuit is open are skipped and half-open
+    ones are probed with a single short attempt, as in one-off runs.
+    """
+
+    def __init__(
+        self,
+        sources: List[NewsSource],
+        on_change: Callable[[List[List[Article]]], None],
+        *,
+        limit: int = 20,
+        workers: int = 1,
+        default_interval: float = 900.0,
+        min_interval: float = 60.0,
+        max_interval: float = 6 * 3600.0,
+        debounce: float = 30.0,
+        health: Optional[HealthTracker] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("intervals must satisfy 0 < min_interval <= max_interval")
+        self.on_change = on_change
+        self.limit = limit
+        self.workers = max(workers, 1)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.debounce = debounce
+        self.health = health
+        self._clock = clock
+        self._stop = threading.Event()
+        self._rebuild_at: Optional[float] = None
+        now = clock()
+        self.states = [
+            SourceState(source, self._clamp(source.interval or default_interval), next_poll=now)
+            for source in sources
+        ]
+        self._queue: List[Tuple[float, int]] = [(now, index) for index in range(len(self.states))]
+        heapq.heapify(self._queue)
+
+    def run(self) -> None:
+        """Poll and rebuild until :meth:`stop` is called."""
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="poll") as executor:
+            while not self._stop.is_set():
+                self.run_pending(executor)
+                self._stop.wait(self.seconds_until_next())
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def run_pending(self, executor: Optional[ThreadPoolExecutor] = None) -> int:
+        """Poll due sources, fire a pending rebuild, and return the number polled."""
+
+        now = self._clock()
+        due: List[int] = []
+        while self._queue and self._queue[0][0] <= now:
+            due.append(heapq.heappop(self._queue)[1])
+        states = [self.states[index] for index in due]
+        if executor is not None and len(states) > 1:
+            changed = list(executor.map(self._poll, states))
+        else:
+            changed = [self._poll(state) for state in states]
+        for index in due:
+            heapq.heappush(self._queue, (self.states[index].next_poll, index))
+        if self.health is not None and due:
+            self.health.save()
+        if any(changed) and self._rebuild_at is None:
+            self._rebuild_at = self._clock() + self.debounce
+        if self._rebuild_at is not None and self._clock() >= self._rebuild_at:
+            self._rebuild_at = None
+            self.on_change([state.articles for state in self.states])
+        return len(due)
+
+    def seconds_until_next(self) -> float:
+        """Return how long the loop may sleep before something is due."""
+
+        deadlines = [self._queue[0][0]] if self._queue else []
+        if self._rebuild_at is not None:
+            deadlines.append(self._rebuild_at)
+        if not deadlines:
+            return self.max_interval
+        return max(min(deadlines) - self._clock(), 0.0)
+
+    def describe(self) -> Dict[str, float]:
+        """Return the current polling interval of every source, in seconds."""
+
+        return {state.source.name: state.interval for state in self.states}
+
+    def _poll(self, state: SourceState) -> bool:
+        source = state.source
+        circuit = self.health.state(source.name) if self.health is not None else None
+        if circuit == OPEN:
+            LOGGER.debug("Skipping %s: too many recent failures", source.name)
+            get_recorder().observe("fetch_skipped", 1, source=source.name)
+            state.next_poll = self._clock() + state.interval
+            return False
+        source.poll_hint = None
+        state.polls += 1
+        timeout, retries = source.timeout, source.retries
+        if circuit == HALF_OPEN and self.health is not None:
+            LOGGER.info("Probing %s after earlier failures", source.name)
+            # One short attempt, as in NewsAggregator._fetch_source.
+            source.timeout = min(timeout, self.health.probe_timeout)
+            source.retries = False
+        try:
+            articles = source.fetch(limit=self.limit)
+        except Exception as exc:
+            if self.health is not None:
+                self.health.record_failure(source.name, exc)
+            state.errors += 1
+            LOGGER.warning("Polling %s failed: %s", source.name, exc)
+            # A throttled response (429/503) still says when to come back.
+            response = getattr(exc, "response", None)
+            if source.poll_hint is None and response is not None:
+                source.poll_hint = poll_hint(response.headers)
+            get_recorder().observe("fetch_errors", 1, source=source.name)
+            interval = state.interval * ERROR_BACKOFF
+            changed = False
+        else:
+            if self.health is not None:
+                self.health.record_success(source.name)
+            urls = {article.url for article in articles}
+            changed = bool(urls - state.seen)
+            state.seen = urls
+            state.articles = articles
+            if changed:
+                state.changes += 1
+            interval = state.interval * (SPEED_UP if changed else SLOW_DOWN)
+        finally:
+            source.timeout, source.retries = timeout, retries
+        state.interval = self._clamp(interval)
+        delay = max(state.interval, source.poll_hint or 0.0)
+        state.next_poll = self._clock() + delay
+        LOGGER.debug(
+            "%s: %s; next poll in %.0fs", source.name, "new stories" if changed else "no change", delay
+        )
+        return changed
+
+    def _clamp(self, interval: float) -> float:
+        return min(max(interval, self.min_interval), self.max_interval)
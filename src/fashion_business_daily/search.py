@@ -0,0 +1,261 @@
+"""Prebuilt, sharded client-side search index for the static site."""
+
+from __future__ import annotations
+
+import json
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+from .articles import Article, ArticleRef, Articles
+from .fsutil import write_if_changed
+
+TOKEN_RE = re.compile(r"\w+")
+SHARD_PREFIX = 2
+UNDATED = "undated"
+#: Days of stories kept searchable, counted back from the newest indexed day.
+RETENTION_DAYS = 365
+
+# Postings per shard: token -> day -> document ids within that day.
+Shard = Dict[str, Dict[str, List[int]]]
+
+
+@dataclass
+class SearchIndexResult:
+    """Summary of an :func:`update_search_index` run."""
+
+    days_updated: List[str] = field(default_factory=list)
+    days_removed: List[str] = field(default_factory=list)
+    files_written: List[str] = field(default_factory=list)
+    files_removed: List[str] = field(default_factory=list)
+
+
+def tokenize(text: str) -> Set[str]:
+    """Return the distinct lowercase search tokens (two characters or more) in ``text``."""
+
+    return {token for token in TOKEN_RE.findall(text.lower()) if len(token) >= 2}
+
+
+def shard_name(token: str) -> str:
+    """Return the shard file stem holding ``token``; the browser derives it the same way."""
+
+    return token[:SHARD_PREFIX].encode("utf-8").hex()
+
+
+def update_search_index(
+    articles: Articles, site_dir: Path, *, retention_days: int = RETENTION_DAYS
+) -> SearchIndexResult:
+    """Add ``articles`` to the search index under ``site_dir/search``.
+
+    Documents are stored per day and each day is append-only, so a run only
+    writes the day files that gained articles plus the token shards those new
+    articles touch. Shards are keyed by the first two characters of a token;
+    the browser loads one shard per query term and matches prefixes inside it.
+    Days more than ``retention_days`` before the newest indexed day are
+    dropped, together with their postings, so shards stay small.
+    """
+
+    root = site_dir / "search"
+    result = SearchIndexResult()
+    by_day: Dict[str, List[Article | ArticleRef]] = defaultdict(list)
+    for article in articles:
+        day = article.published.date().isoformat() if article.published else UNDATED
+        by_day[day].append(article)
+
+    manifest = _load(root / "manifest.json") or {"shard_prefix": SHARD_PREFIX, "days": {}}
+    dated = [day for day in [*manifest["days"], *by_day] if day != UNDATED]
+    cutoff = (
+        (date.fromisoformat(max(dated)) - timedelta(days=retention_days)).isoformat()
+        if dated
+        else ""
+    )
+    expired = {day for day in manifest["days"] if day != UNDATED and day < cutoff}
+    for day in [day for day in by_day if day != UNDATED and day < cutoff]:
+        del by_day[day]
+    updates: Dict[str, Shard] = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+    for day in sorted(by_day):
+        docs_path = root / "docs" / f"{day}.json"
+        docs: List[list] = _load(docs_path) or []
+        known = {doc[1] for doc in docs}
+        added = False
+        for article in by_day[day]:
+            if article.url in known:
+                continue
+            known.add(article.url)
+            doc_id = len(docs)
+            docs.append(
+                [
+                    article.title,
+                    article.url,
+                    article.source,
+                    article.published.isoformat() if article.published else "",
+                    list(article.categories),
+                ]
+            )
+            text = " ".join([article.title, article.summary, article.source, *article.categories])
+            for token in tokenize(text):
+                updates[shard_name(token)][token][day].append(doc_id)
+            added = True
+        if added:
+            _write(site_dir, docs_path, docs, result)
+            manifest["days"][day] = len(docs)
+            result.days_updated.append(day)
+
+    for name, postings in sorted(updates.items()):
+        shard_path = root / "shards" / f"{name}.json"
+        shard: Shard = _load(shard_path) or {}
+        for token, days in postings.items():
+            entry = shard.setdefault(token, {})
+            for day, ids in days.items():
+                entry.setdefault(day, []).extend(ids)
+        _write(site_dir, shard_path, dict(sorted(shard.items())), result)
+
+    if expired:
+        _prune(site_dir, expired, result)
+        for day in sorted(expired):
+            del manifest["days"][day]
+    if result.days_updated or expired:
+        manifest["days"] = dict(sorted(manifest["days"].items(), reverse=True))
+        _write(site_dir, root / "manifest.json", manifest, result)
+    if write_if_changed(site_dir / "search.js", SEARCH_SCRIPT):
+        result.files_written.append("search.js")
+    return result
+
+
+def _prune(site_dir: Path, expired: Set[str], result: SearchIndexResult) -> None:
+    """Delete the ``expired`` day files and their postings from every shard."""
+
+    root = site_dir / "search"
+    for day in sorted(expired):
+        docs_path = root / "docs" / f"{day}.json"
+        if docs_path.exists():
+            docs_path.unlink()
+            result.files_removed.append(docs_path.relative_to(site_dir).as_posix())
+        result.days_removed.append(day)
+    for shard_path in sorted((root / "shards").glob("*.json")):
+        shard: Shard = _load(shard_path) or {}
+        kept: Shard = {}
+        for token, days in shard.items():
+            remaining = {day: ids for day, ids in days.items() if day not in expired}
+            if remaining:
+                kept[token] = remaining
+        if not kept:
+            shard_path.unlink()
+            result.files_removed.append(shard_path.relative_to(site_dir).as_posix())
+        elif kept != shard:
+            _write(site_dir, shard_path, kept, result)
+
+
+def _load(path: Path) -> Any:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write(site_dir: Path, path: Path, payload: object, result: SearchIndexResult) -> None:
+    content = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    if write_if_changed(path, content):
+        result.files_written.append(path.relative_to(site_dir).as_posix())
+
+
+SEARCH_SCRIPT = """(function () {
+  "use strict";
+  var input = document.getElementById("search");
+  var output = document.getElementById("search-results");
+  if (!input || !output) return;
+  var cache = new Map();
+  var timer = null;
+
+  function load(path) {
+    if (!cache.has(path)) {
+      cache.set(path, fetch(path).then(function (r) { return r.ok ? r.json() : {}; }).catch(function () { return {}; }));
+    }
+    return cache.get(path);
+  }
+
+  function hex(text) {
+    return Array.from(new TextEncoder().encode(text)).map(function (b) {
+      return b.toString(16).padStart(2, "0");
+    }).join("");
+  }
+
+  function tokens(query) {
+    return (query.toLowerCase().match(/[\\p{L}\\p{N}_]+/gu) || []).filter(function (t) { return t.length >= 2; });
+  }
+
+  // Feed URLs are untrusted: only http(s) links are made clickable.
+  function safeUrl(url) {
+    try {
+      var parsed = new URL(url, location.href);
+      return parsed.protocol === "http:" || parsed.protocol === "https:" ? parsed.href : null;
+    } catch (e) {
+      return null;
+    }
+  }
+
+  // Built node by node, never from an HTML string, so feed text cannot inject markup.
+  function element(tag, className, text) {
+    var node = document.createElement(tag);
+    if (className) node.className = className;
+    if (text !== undefined) node.textContent = text;
+    return node;
+  }
+
+  function result(doc) {
+    var item = element("li", "story");
+    var url = safeUrl(doc[1]);
+    var link = element(url ? "a" : "span", "", doc[0]);
+    if (url) {
+      link.href = url;
+      link.target = "_blank";
+      link.rel = "noopener noreferrer";
+    }
+    item.appendChild(link);
+    item.appendChild(element("span", "meta", doc[2] + " — " + (doc[3] ? doc[3].slice(0, 10) : "Unknown")));
+    return item;
+  }
+
+  async function search(query) {
+    var terms = tokens(query);
+    if (!terms.length) { output.replaceChildren(); return; }
+    var matches = null;
+    for (var i = 0; i < terms.length; i++) {
+      var term = terms[i];
+      // Code points, not UTF-16 units, to match the indexer's token[:2].
+      var shard = await load("search/shards/" + hex(Array.from(term).slice(0, 2).join("")) + ".json");
+      var found = new Set();
+      Object.keys(shard).forEach(function (token) {
+        if (token.indexOf(term) !== 0) return;
+        var days = shard[token];
+        Object.keys(days).forEach(function (day) {
+          days[day].forEach(function (id) { found.add(day + ":" + id); });
+        });
+      });
+      matches = matches === null ? found : new Set(Array.from(matches).filter(function (k) { return found.has(k); }));
+      if (!matches.size) break;
+    }
+    // Newest day first, then newest document; ids compare as numbers.
+    var keys = Array.from(matches).map(function (key) {
+      var parts = key.split(":");
+      return [parts[0], Number(parts[1])];
+    }).sort(function (a, b) {
+      return a[0] === b[0] ? b[1] - a[1] : (a[0] < b[0] ? 1 : -1);
+    }).slice(0, 50);
+    var docs = await Promise.all(keys.map(async function (key) {
+      var day = await load("search/docs/" + key[0] + ".json");
+      return day[key[1]];
+    }));
+    var items = docs.filter(Boolean).map(result);
+    output.replaceChildren.apply(output, items.length ? items : [element("li", "empty", "No matching stories.")]);
+  }
+
+  input.addEventListener("input", function () {
+    clearTimeout(timer);
+    timer = setTimeout(function () { search(input.value); }, 120);
+  });
+})();
+"""
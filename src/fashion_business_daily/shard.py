@@ -0,0 +1,145 @@
+"""Split a run across workers by source and merge their article batches."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from .articles import RECENT_SECONDS, Article, ArticleBatch
+from .fsutil import open_atomic
+from .store import ArticleStore, article_key
+
+LOGGER = logging.getLogger(__name__)
+
+BATCH_FORMAT = "fashion-business-daily/articles"
+BATCH_VERSION = 1
+
+Named = TypeVar("Named")
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    """Parse ``"i/N"`` (zero-based ``i``) into ``(i, N)``."""
+
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise ValueError(f"expected INDEX/COUNT such as 0/4, got {text!r}") from None
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"shard index must be between 0 and {count - 1}, got {text!r}")
+    return index, count
+
+
+def shard_of(name: str, count: int) -> int:
+    """Return the shard of the source called ``name``; stable across runs and machines."""
+
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % count
+
+
+def select_shard(sources: Iterable[Named], index: int, count: int) -> List[Named]:
+    """Return the sources (anything with a ``name``) that belong to shard ``index``."""
+
+    return [source for source in sources if shard_of(source.name, count) == index]  # type: ignore[attr-defined]
+
+
+@dataclass
+class ShardBatch:
+    """Articles fetched by one shard, with the global position of each of its sources."""
+
+    shard: int
+    shards: int
+    sources: Dict[str, int]
+    articles: List[Article]
+
+
+def write_batch(path: Path, batch: ShardBatch) -> None:
+    """Stream ``batch`` to ``path`` as JSON lines: a header, then one article per line."""
+
+    header = {
+        "format": BATCH_FORMAT,
+        "version": BATCH_VERSION,
+        "shard": batch.shard,
+        "shards": batch.shards,
+        "sources": batch.sources,
+    }
+    with open_atomic(path) as fh:
+        fh.write(json.dumps(header, ensure_ascii=False) + "\n")
+        for article in batch.articles:
+            fh.write(json.dumps(article.to_dict(), ensure_ascii=False) + "\n")
+
+
+def read_batch(path: Path) -> ShardBatch:
+    """Read a batch written by :func:`write_batch`."""
+
+    with path.open(encoding="utf-8") as fh:
+        header = json.loads(fh.readline() or "{}")
+        if header.get("format") != BATCH_FORMAT or header.get("version") != BATCH_VERSION:
+            raise ValueError(f"{path} is not a version {BATCH_VERSION} article batch")
+        articles = [Article.from_dict(json.loads(line)) for line in fh if line.strip()]
+    return ShardBatch(header["shard"], header["shards"], header["sources"], articles)
+
+
+def merge_batches(
+    batches: Sequence[ShardBatch],
+    *,
+    store: Optional[ArticleStore] = None,
+    max_age: Optional[float] = RECENT_SECONDS,
+) -> List[Article]:
+    """Combine shard batches into the article list a single-node run would produce.
+
+    Shards write every story they fetched. Articles are put back into global
+    source order and deduplicated by URL (the first source in configuration
+    order wins). With a ``store``, stories seen before take their stored
+    categories and new ones are added, as in a single-node run. Stories
+    older than ``max_age`` seconds (``None``: none) are then dropped, and the
+    rest sorted newest first. The sort is stable, like the single-node one,
+    so ties come out identically.
+    """
+
+    if not batches:
+        return []
+    counts = {batch.shards for batch in batches}
+    if len(counts) != 1:
+        raise ValueError(f"batches come from different shard counts: {sorted(counts)}")
+    shards = [batch.shard for batch in batches]
+    duplicates = sorted({shard for shard in shards if shards.count(shard) > 1})
+    if duplicates:
+        raise ValueError(f"more than one batch for shard(s) {duplicates}")
+    missing = sorted(set(range(counts.pop())) - set(shards))
+    if missing:
+        LOGGER.warning("No batch for shard(s) %s; their sources are missing", missing)
+
+    positions: Dict[str, int] = {}
+    for batch in batches:
+        positions.update(batch.sources)
+    articles = [article for batch in batches for article in batch.articles]
+    articles.sort(key=lambda article: positions.get(article.source, len(positions)))
+
+    seen = set()
+    unique: List[Article] = []
+    for article in articles:
+        key = article_key(article)
+        if key not in seen:
+            seen.add(key)
+            unique.append(article)
+    if len(unique) < len(articles):
+        LOGGER.info("Dropped %d articles with duplicate URLs", len(articles) - len(unique))
+    if store is not None:
+        known = store.known_categories(unique)
+        new_articles: List[Article] = []
+        for article in unique:
+            stored = known.get(article_key(article))
+            if stored is None:
+                new_articles.append(article)
+            else:
+                article.categories = stored
+        added = store.add(new_articles)
+        LOGGER.info("Stored %d new articles (%d already seen)", added, len(unique) - len(new_articles))
+    merged = ArticleBatch.from_articles(unique)
+    if max_age is not None:
+        merged = merged.recent(max_age=max_age)
+    return merged.sorted(newest_first=True).to_articles()
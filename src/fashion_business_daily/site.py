@@ -2,49 +2,265 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from datetime import datetime, timezone
+import io
+import json
+from itertools import chain
+from dataclasses import dataclass, field
 from html import escape
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, TextIO, Union
 
-from .articles import Article
+from .articles import Articles
+from .fsutil import content_hash, file_hash, open_atomic, write_atomic, write_if_changed
+from .metrics import get_recorder
+from .render import DEFAULT_TITLE, RenderPlan, as_plan, describe_trend
+from .search import update_search_index
 
+if TYPE_CHECKING:  # pragma: no cover - import-time hints only
+    from .trends import Trend
 
-def build_site_assets(articles: Iterable[Article], *, title: str = "Fashion Business Daily") -> Dict[str, str]:
+MANIFEST_NAME = ".site-manifest.json"
+#: Directory of rendered sections, one file per section hash, reused between builds.
+SECTION_CACHE = ".site-sections"
+#: Bump whenever the markup produced by the renderers below changes, so pages
+#: and cached sections are rendered again.
+RENDER_VERSION = 2
+
+STYLESHEET = """:root {\n  color-scheme: light dark;\n  font-family: 'Helvetica Neue', Arial, sans-serif;\n}\n\nbody {\n  margin: 0;\n  padding: 0;\n  background: #f8f9fb;\n  color: #202124;\n}\n\n.hero {\n  background: linear-gradient(135deg, #111827, #1f2937);\n  color: #f9fafb;\n  padding: 3rem 1.5rem;\n  text-align: center;\n}\n\n.hero h1 {\n  margin: 0;\n  font-size: clamp(2rem, 4vw, 3.25rem);\n}\n\n.hero .updated {\n  margin-top: 0.5rem;\n  font-size: 0.95rem;\n  opacity: 0.85;\n}\n\nmain {\n  max-width: 960px;\n  margin: 0 auto;\n  padding: 2rem 1.5rem 4rem;\n}\n\n.category {\n  margin-bottom: 2.5rem;\n}\n\n.category h2 {\n  font-size: 1.5rem;\n  border-bottom: 2px solid #1f2937;\n  padding-bottom: 0.5rem;\n  margin-bottom: 1rem;\n}\n\n.stories {\n  list-style: none;\n  padding: 0;\n  margin: 0;\n  display: grid;\n  gap: 1.5rem;\n}\n\n.story a {\n  font-weight: 600;\n  font-size: 1.1rem;\n  color: #1f2937;\n  text-decoration: none;\n}\n\n.story a:hover,\n.story a:focus {\n  text-decoration: underline;\n}\n\n.story .meta {\n  display: block;\n  font-size: 0.9rem;\n  margin-top: 0.35rem;\n  color: #4b5563;\n}\n\n.story p {\n  margin: 0.75rem 0 0;\n  line-height: 1.5;\n  color: #374151;\n}\n\n.story .also {\n  display: block;\n  margin-top: 0.5rem;\n  font-size: 0.85rem;\n  color: #6b7280;\n}\n\n.story .also a {\n  font-size: inherit;\n  font-weight: 500;\n}\n\nfooter {\n  background: #111827;\n  color: #f9fafb;\n  text-align: center;\n  padding: 1.25rem 1rem;\n  font-size: 0.9rem;\n}\n\n.empty {\n  text-align: center;\n  font-style: italic;\n  color: #4b5563;\n}\n"""
+
+
+SEARCH_STYLES = """
+.search {
+  margin-bottom: 2.5rem;
+}
+
+.search input {
+  width: 100%;
+  box-sizing: border-box;
+  padding: 0.75rem 1rem;
+  font-size: 1rem;
+  border: 1px solid #d1d5db;
+  border-radius: 0.5rem;
+}
+
+#search-results:not(:empty) {
+  margin-top: 1.5rem;
+}
+"""
+
+
+@dataclass
+class SiteBuildResult:
+    """Outcome of an incremental :func:`build_site` run."""
+
+    output_dir: Path
+    changed_files: List[str] = field(default_factory=list)
+    rendered_sections: int = 0
+    reused_sections: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.changed_files)
+
+
+def build_site_assets(
+    articles: Union[Articles, RenderPlan], *, title: str = DEFAULT_TITLE
+) -> Dict[str, str]:
     """Return a mapping of filename to content for a static site."""
 
-    grouped = defaultdict(list)
+    buffer = io.StringIO()
+    write_html(as_plan(articles, title=title), buffer)
+    return {"index.html": buffer.getvalue(), "styles.css": STYLESHEET}
+
+
+def write_html(plan: RenderPlan, fh: TextIO, *, search: bool = False) -> None:
+    """Stream the site's ``index.html`` for ``plan`` to ``fh``, one section at a time."""
+
+    with get_recorder().timer("render_seconds", output="site"):
+        sections = (render_section(category, batch) for category, batch in plan.sections.items())
+        trends = [render_trends(plan.trends)] if plan.trends else []
+        _write_page(fh, chain(trends, sections), plan.title, plan.stamp, search=search)
+
+
+def build_site(
+    articles: Union[Articles, RenderPlan],
+    output_dir: Path,
+    *,
+    title: str = DEFAULT_TITLE,
+    search: bool = False,
+) -> SiteBuildResult:
+    """Incrementally build the site in ``output_dir``.
+
+    A manifest of per-section input hashes is kept next to the output, and
+    rendered sections are cached in :data:`SECTION_CACHE`. Only sections whose
+    articles changed are re-rendered (all of them after a
+    :data:`RENDER_VERSION` bump). The page is streamed to disk a section at a
+    time, so memory does not grow with its size. When no section changed the
+    page, including its "Last updated" stamp, is left untouched, and other
+    files are rewritten (atomically) only when their content changes. With
+    ``search`` enabled the prebuilt search index is updated as well. Pass a
+    :class:`RenderPlan` to reuse a grouping shared with other outputs.
+    """
+
+    result = SiteBuildResult(output_dir=output_dir)
+    manifest = _load_manifest(output_dir)
+    if manifest.get("render_version") != RENDER_VERSION:
+        manifest = {}
+    previous = manifest.get("sections", {})
+    plan = as_plan(articles, title=title)
+    title = plan.title
+    grouped = plan.sections
+    if search:
+        with get_recorder().timer("render_seconds", output="search"):
+            index = update_search_index(plan.articles, output_dir)
+            result.changed_files.extend(index.files_written + index.files_removed)
+
+    cache_dir = output_dir / SECTION_CACHE
+    sections = {category: _section_hash(category, batch) for category, batch in grouped.items()}
+    reused = {
+        category
+        for category, digest in sections.items()
+        if previous.get(category) == digest and (cache_dir / f"{digest}.html").exists()
+    }
+    result.reused_sections = len(reused)
+    result.rendered_sections = len(sections) - len(reused)
+    trends = render_trends(plan.trends)
+    trends_hash = content_hash(trends)
+    files: Dict[str, str] = manifest.get("files", {})
+    inputs_unchanged = (
+        manifest.get("title") == title
+        and manifest.get("search", False) == search
+        and manifest.get("trends", content_hash("")) == trends_hash
+        and list(previous.items()) == list(sections.items())
+        and len(reused) == len(sections)
+        and all(file_hash(output_dir / name) == digest for name, digest in files.items())
+    )
+    if inputs_unchanged and files:
+        return result
+
+    def section_html() -> Iterator[str]:
+        for category, digest in sections.items():
+            path = cache_dir / f"{digest}.html"
+            if category in reused:
+                yield path.read_text(encoding="utf-8")
+            else:
+                html = render_section(category, grouped[category])
+                write_atomic(path, html)
+                yield html
+
+    page_path = output_dir / "index.html"
+    before = file_hash(page_path)
+    with get_recorder().timer("render_seconds", output="site"), open_atomic(page_path) as fh:
+        _write_page(fh, chain([trends] if trends else [], section_html()), title, plan.stamp, search=search)
+    file_hashes = {"index.html": file_hash(page_path)}
+    if file_hashes["index.html"] != before:
+        result.changed_files.append("index.html")
+
+    with get_recorder().timer("write_seconds", output="site"):
+        stylesheet = STYLESHEET + SEARCH_STYLES if search else STYLESHEET
+        file_hashes["styles.css"] = content_hash(stylesheet)
+        if write_if_changed(output_dir / "styles.css", stylesheet):
+            result.changed_files.append("styles.css")
+        live = {f"{digest}.html" for digest in sections.values()}
+        for path in cache_dir.glob("*.html"):
+            if path.name not in live:
+                path.unlink()
+        write_atomic(
+            output_dir / MANIFEST_NAME,
+            json.dumps(
+                {
+                    "render_version": RENDER_VERSION,
+                    "title": title,
+                    "search": search,
+                    "trends": trends_hash,
+                    "sections": sections,
+                    "files": file_hashes,
+                }
+            ),
+        )
+    return result
+
+
+def _section_hash(category: str, articles: Articles) -> str:
+    # The category is part of the markup, so it is part of the cache key too.
+    payload = [
+        [
+            article.source,
+            article.title,
+            article.url,
+            article.summary,
+            article.published.isoformat() if article.published else None,
+            [[alternate.source, alternate.url] for alternate in article.alternates],
+        ]
+        for article in articles
+    ]
+    return content_hash(json.dumps([category, payload], ensure_ascii=False))
+
+
+def render_section(category: str, articles: Articles) -> str:
+    """Return the HTML ``<section>`` listing ``articles`` under ``category``."""
+
+    section_lines = [f"<section class=\"category\" id=\"{escape(category.lower().replace(' ', '-'))}\">"]
+    section_lines.append(f"  <h2>{escape(category)}</h2>")
+    section_lines.append("  <ul class=\"stories\">")
     for article in articles:
-        key = ", ".join(article.categories) if article.categories else "General"
-        grouped[key].append(article)
-
-    updated = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M %Z")
-
-    sections: list[str] = []
-    for category in sorted(grouped.keys()):
-        section_lines = [f"<section class=\"category\" id=\"{escape(category.lower().replace(' ', '-'))}\">"]
-        section_lines.append(f"  <h2>{escape(category)}</h2>")
-        section_lines.append("  <ul class=\"stories\">")
-        for article in grouped[category]:
-            published = (
-                article.published.strftime("%Y-%m-%d %H:%M %Z")
-                if article.published
-                else "Unknown"
-            )
-            section_lines.append(
-                "    <li class=\"story\">"
-                f"<a href=\"{escape(article.url)}\" target=\"_blank\" rel=\"noopener noreferrer\">"
-                f"{escape(article.title)}</a>"
-                f"<span class=\"meta\">{escape(article.source)} — {escape(published)}</span>"
-                f"<p>{escape(article.summary.strip())}</p>"
-                "    </li>"
+        published = (
+            article.published.strftime("%Y-%m-%d %H:%M %Z")
+            if article.published
+            else "Unknown"
+        )
+        also = ""
+        if article.alternates:
+            links = ", ".join(
+                f"<a href=\"{escape(alternate.url)}\" target=\"_blank\" rel=\"noopener noreferrer\">"
+                f"{escape(alternate.source)}</a>"
+                for alternate in article.alternates
             )
-        section_lines.append("  </ul>")
-        section_lines.append("</section>")
-        sections.append("\n".join(section_lines))
+            also = f"<span class=\"also\">Also covered by {links}</span>"
+        section_lines.append(
+            "    <li class=\"story\">"
+            f"<a href=\"{escape(article.url)}\" target=\"_blank\" rel=\"noopener noreferrer\">"
+            f"{escape(article.title)}</a>"
+            f"<span class=\"meta\">{escape(article.source)} — {escape(published)}</span>"
+            f"<p>{escape(article.summary.strip())}</p>"
+            f"{also}"
+            "    </li>"
+        )
+    section_lines.append("  </ul>")
+    section_lines.append("</section>")
+    return "\n".join(section_lines)
 
-    html = f"""<!DOCTYPE html>
+
+def render_trends(trends: List[Trend]) -> str:
+    """Return the "Trending" ``<section>`` for ``trends`` (empty without any)."""
+
+    if not trends:
+        return ""
+    lines = ["<section class=\"category trends\" id=\"trending\">", "  <h2>Trending</h2>"]
+    lines.append("  <ul class=\"stories\">")
+    for trend in trends:
+        lines.append(
+            f"    <li class=\"story\"><strong>{escape(trend.term)}</strong>"
+            f"<span class=\"meta\">{escape(trend.kind)} — {escape(describe_trend(trend))}</span></li>"
+        )
+    lines.append("  </ul>")
+    lines.append("</section>")
+    return "\n".join(lines)
+
+
+def _write_page(
+    fh: TextIO, sections: Iterable[str], title: str, updated: str, *, search: bool = False
+) -> None:
+    search_box = script = ""
+    if search:
+        search_box = (
+            "<div class=\"search\">"
+            "<input id=\"search\" type=\"search\" placeholder=\"Search stories, brands, sources…\" "
+            "aria-label=\"Search stories\" />"
+            "<ul id=\"search-results\" class=\"stories\"></ul></div>\n    "
+        )
+        script = "\n  <script src=\"search.js\" defer></script>"
+    fh.write(f"""<!DOCTYPE html>
 <html lang=\"en\">
 <head>
   <meta charset=\"utf-8\" />
@@ -58,24 +274,35 @@ def build_site_assets(articles: Iterable[Article], *, title: str = "Fashion Busi
     <p class=\"updated\">Last updated {escape(updated)}</p>
   </header>
   <main>
-    {''.join(sections) if sections else '<p class="empty">No articles available.</p>'}
+    {search_box}""")
+    empty = True
+    for section in sections:
+        fh.write(section)
+        empty = False
+    if empty:
+        fh.write('<p class="empty">No articles available.</p>')
+    fh.write(f"""
   </main>
   <footer>
     <p>Powered by trusted fashion business sources including Business of Fashion, WWD, Vanity Fair, Vogue Business, and The New York Times.</p>
-  </footer>
+  </footer>{script}
 </body>
 </html>
-"""
-
-    css = """:root {\n  color-scheme: light dark;\n  font-family: 'Helvetica Neue', Arial, sans-serif;\n}\n\nbody {\n  margin: 0;\n  padding: 0;\n  background: #f8f9fb;\n  color: #202124;\n}\n\n.hero {\n  background: linear-gradient(135deg, #111827, #1f2937);\n  color: #f9fafb;\n  padding: 3rem 1.5rem;\n  text-align: center;\n}\n\n.hero h1 {\n  margin: 0;\n  font-size: clamp(2rem, 4vw, 3.25rem);\n}\n\n.hero .updated {\n  margin-top: 0.5rem;\n  font-size: 0.95rem;\n  opacity: 0.85;\n}\n\nmain {\n  max-width: 960px;\n  margin: 0 auto;\n  padding: 2rem 1.5rem 4rem;\n}\n\n.category {\n  margin-bottom: 2.5rem;\n}\n\n.category h2 {\n  font-size: 1.5rem;\n  border-bottom: 2px solid #1f2937;\n  padding-bottom: 0.5rem;\n  margin-bottom: 1rem;\n}\n\n.stories {\n  list-style: none;\n  padding: 0;\n  margin: 0;\n  display: grid;\n  gap: 1.5rem;\n}\n\n.story a {\n  font-weight: 600;\n  font-size: 1.1rem;\n  color: #1f2937;\n  text-decoration: none;\n}\n\n.story a:hover,\n.story a:focus {\n  text-decoration: underline;\n}\n\n.story .meta {\n  display: block;\n  font-size: 0.9rem;\n  margin-top: 0.35rem;\n  color: #4b5563;\n}\n\n.story p {\n  margin: 0.75rem 0 0;\n  line-height: 1.5;\n  color: #374151;\n}\n\nfooter {\n  background: #111827;\n  color: #f9fafb;\n  text-align: center;\n  padding: 1.25rem 1rem;\n  font-size: 0.9rem;\n}\n\n.empty {\n  text-align: center;\n  font-style: italic;\n  color: #4b5563;\n}\n"""
-
-    return {"index.html": html, "styles.css": css}
+""")
 
 
 def write_site(assets: Dict[str, str], output_dir: Path) -> Path:
     """Write static site assets to ``output_dir`` and return the directory."""
 
     output_dir.mkdir(parents=True, exist_ok=True)
-    for name, content in assets.items():
-        (output_dir / name).write_text(content, encoding="utf-8")
+    with get_recorder().timer("write_seconds", output="site"):
+        for name, content in assets.items():
+            write_if_changed(output_dir / name, content)
     return output_dir
+
+
+def _load_manifest(output_dir: Path) -> Dict[str, dict]:
+    try:
+        return json.loads((output_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
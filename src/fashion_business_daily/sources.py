@@ -2,93 +2,468 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import io
+import json
 import os
 import re
+import threading
 import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from email.utils import parsedate_to_datetime
-from typing import Iterable, List, Optional
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .articles import Article
+from .dates import parse_datetime
+from .metrics import get_recorder
+
+if TYPE_CHECKING:  # pragma: no cover - import-time hints only
+    from .cache import FeedCache
 
 USER_AGENT = (
     "FashionBusinessDaily/0.1 (+https://github.com/example/fashion-business-daily)"
 )
+NYT_API_URL = "https://api.nytimes.com"
+
+# urllib3 only decodes brotli bodies when one of these packages is installed.
+if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+    ACCEPT_ENCODING = "gzip, deflate, br"
+else:  # pragma: no cover - depends on the environment
+    ACCEPT_ENCODING = "gzip, deflate"
+
+
+@dataclass
+class HostStats:
+    """Request and connection counters for a single host."""
+
+    requests: int = 0
+    connections: int = 0
+
+
+@dataclass
+class TransportStats:
+    """Connection pool usage collected by :class:`HTTPTransport`."""
+
+    hosts: Dict[str, HostStats] = field(default_factory=dict)
+
+    @property
+    def requests(self) -> int:
+        return sum(host.requests for host in self.hosts.values())
+
+    @property
+    def connections(self) -> int:
+        return sum(host.connections for host in self.hosts.values())
+
+    @property
+    def reuse_rate(self) -> float:
+        """Fraction of requests that were served over an existing connection."""
+
+        if not self.requests:
+            return 0.0
+        return max(0.0, 1 - self.connections / self.requests)
+
+
+class _TrackingAdapter(HTTPAdapter):
+    """HTTP adapter remembering every connection pool it hands out."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._pools: Dict[str, Any] = {}
+        self._pools_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._pools_lock:
+            return dict(self._pools)
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):  # type: ignore
+        pool = super().get_connection_with_tls_context(request, verify, proxies, cert)
+        return self._track(pool)
+
+    def get_connection(self, url, proxies=None):  # type: ignore[no-untyped-def]  # requests < 2.32
+        return self._track(super().get_connection(url, proxies))
+
+    def _track(self, pool: Any) -> Any:
+        # Keep a handle on every pool so counters survive pool manager eviction.
+        with self._pools_lock:
+            self._pools.setdefault(f"{pool.host}:{pool.port}", pool)
+        return pool
+
+
+class _CappedRetry(Retry):
+    """Retry policy that waits at most ``retry_after_max`` seconds for ``Retry-After``.
+
+    A feed asking for a longer pause is retried after the cap instead, so it
+    cannot hold a fetch thread past the run's deadline; ``serve`` mode still
+    honours the full value as a poll hint.
+    """
+
+    retry_after_max: float = 10.0
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.retry_after_max)
+
+    def new(self, **kw: Any) -> "_CappedRetry":
+        retry = super().new(**kw)
+        retry.retry_after_max = self.retry_after_max
+        return retry
+
+
+class HTTPTransport:
+    """Pooled keep-alive HTTP session shared by every news source."""
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = 32,
+        pool_maxsize: int = 10,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        retry_after_max: float = 10.0,
+    ) -> None:
+        retry = _CappedRetry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            # Hand the last 429/503 back instead of raising RetryError, so
+            # sources still see its Retry-After (the ``serve`` poll hint).
+            raise_on_status=False,
+        )
+        retry.retry_after_max = retry_after_max
+        self._adapter = _TrackingAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+        self.session = self._session(self._adapter)
+        # Single-attempt requests (circuit-breaker probes) get their own pools:
+        # urllib3 reads the retry policy from the adapter, not the request.
+        self._single_adapter = _TrackingAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0
+        )
+        self._single_session = self._session(self._single_adapter)
+
+    @staticmethod
+    def _session(adapter: HTTPAdapter) -> requests.Session:
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING})
+        return session
+
+    def get(
+        self,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30,
+        stream: bool = False,
+        retries: bool = True,
+    ) -> requests.Response:
+        """Issue a GET request over the shared connection pool.
+
+        With ``retries=False`` the request is attempted once, without the
+        transport's retry policy.
+        """
+
+        session = self.session if retries else self._single_session
+        return session.get(url, headers=headers, timeout=timeout, stream=stream)
+
+    def stats(self) -> TransportStats:
+        """Return per-host request and connection counts for this transport."""
+
+        hosts: Dict[str, HostStats] = {}
+        for adapter in (self._adapter, self._single_adapter):
+            for host, pool in adapter.snapshot().items():
+                stats = hosts.setdefault(host, HostStats())
+                stats.requests += pool.num_requests
+                stats.connections += pool.num_connections
+        return TransportStats(hosts=hosts)
+
+    def close(self) -> None:
+        self.session.close()
+        self._single_session.close()
+
+
+_DEFAULT_TRANSPORT: Optional[HTTPTransport] = None
+_TRANSPORT_LOCK = threading.Lock()
+
+
+def get_transport() -> HTTPTransport:
+    """Return the process-wide transport, creating it on first use."""
+
+    global _DEFAULT_TRANSPORT
+    with _TRANSPORT_LOCK:
+        if _DEFAULT_TRANSPORT is None:
+            _DEFAULT_TRANSPORT = HTTPTransport()
+        return _DEFAULT_TRANSPORT
+
+
+def set_transport(transport: Optional[HTTPTransport]) -> None:
+    """Replace the process-wide transport used by sources without their own."""
+
+    global _DEFAULT_TRANSPORT
+    with _TRANSPORT_LOCK:
+        _DEFAULT_TRANSPORT = transport
+
+
+@dataclass
+class RawFeed:
+    """An undecoded feed body, parsed later by :func:`parse_raw`."""
+
+    source: str
+    format: str  # "feed" (RSS/Atom) or "nyt"
+    body: bytes
+    limit: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 class NewsSource(ABC):
     """Abstract base class for news sources."""
 
+    #: Socket timeout, in seconds, for each HTTP request made by the source.
+    timeout: float = 30
+    #: Whether requests go through the transport's retry policy.
+    retries: bool = True
+
     def __init__(self, name: str) -> None:
         self.name = name
+        self.transport: Optional[HTTPTransport] = None
+        # Configured polling interval in seconds (``serve`` mode).
+        self.interval: Optional[float] = None
+        # Minimum delay before the next poll requested by the last response.
+        self.poll_hint: Optional[float] = None
+
+    def _get(
+        self,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        transport = self.transport or get_transport()
+        response = transport.get(
+            url, headers=headers, timeout=self.timeout, stream=stream, retries=self.retries
+        )
+        self.poll_hint = poll_hint(response.headers)
+        return response
 
     @abstractmethod
     def fetch(self, *, limit: int) -> List[Article]:
         """Return a list of articles from the source."""
 
+    async def fetch_async(self, *, limit: int) -> List[Article]:
+        """Return a list of articles without blocking the event loop.
+
+        The default runs :meth:`fetch` in the loop's default executor. A
+        cancelled call returns immediately; the worker thread finishes once its
+        request completes or hits :attr:`timeout`.
+        """
+
+        return await asyncio.to_thread(self.fetch, limit=limit)
+
+    def fetch_raw(self, *, limit: int) -> Union[RawFeed, List[Article]]:
+        """Return the undecoded feed for :func:`parse_raw`, or parsed articles.
+
+        Used when parsing runs in a process pool. Sources without a raw form,
+        or answered from a cache, return articles; the default calls
+        :meth:`fetch`.
+        """
+
+        return self.fetch(limit=limit)
+
+    def remember(self, raw: RawFeed, articles: List[Article]) -> None:
+        """Hook called with the articles parsed from this source's ``raw`` feed."""
+
 
 class RSSNewsSource(NewsSource):
     """Fetch articles from an RSS or Atom feed."""
 
-    def __init__(self, name: str, url: str) -> None:
+    def __init__(self, name: str, url: str, *, cache: Optional["FeedCache"] = None) -> None:
         super().__init__(name)
         self.url = url
+        self.cache = cache
 
     def fetch(self, *, limit: int) -> List[Article]:  # noqa: D401 - inherited
-        response = requests.get(self.url, headers={"User-Agent": USER_AGENT}, timeout=30)
-        response.raise_for_status()
-        root = ET.fromstring(response.content)
-        items: Iterable[ET.Element]
-        if root.tag.endswith("feed"):
-            items = root.findall("{http://www.w3.org/2005/Atom}entry")
-            return [
-                _article_from_atom(self.name, entry) for entry in list(items)[:limit]
-            ]
-        channel = root.find("channel")
-        if channel is None:
-            items = root.findall("item")
-        else:
-            items = channel.findall("item")
-        return [
-            _article_from_rss(self.name, item) for item in list(items)[:limit]
-        ]
+        response = self._request(limit=limit)
+        if isinstance(response, list):
+            return response
+        recorder = get_recorder()
+        try:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            # The body is streamed, so parse time includes reading it.
+            meta: Dict[str, str] = {}
+            with recorder.timer("parse_seconds", source=self.name):
+                articles = parse_feed(self.name, response.raw, limit=limit, meta=meta)
+            recorder.observe("fetch_bytes", response.raw.tell(), source=self.name)
+            self.poll_hint = poll_hint(response.headers, ttl=meta.get("ttl"))
+        finally:
+            response.close()
+        headers = response.headers
+        self._store(articles, headers.get("ETag"), headers.get("Last-Modified"), limit)
+        return articles
+
+    def fetch_raw(self, *, limit: int) -> Union[RawFeed, List[Article]]:  # noqa: D401 - inherited
+        response = self._request(limit=limit)
+        if isinstance(response, list):
+            return response
+        try:
+            response.raise_for_status()
+            body = response.content
+        finally:
+            response.close()
+        get_recorder().observe("fetch_bytes", len(body), source=self.name)
+        return RawFeed(
+            self.name,
+            "feed",
+            body,
+            limit,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def remember(self, raw: RawFeed, articles: List[Article]) -> None:  # noqa: D401 - inherited
+        self._store(articles, raw.etag, raw.last_modified, raw.limit)
+
+    def _request(self, *, limit: int) -> Union[requests.Response, List[Article]]:
+        """Issue a (conditional) GET, returning cached articles on a ``304``."""
+
+        headers: Dict[str, str] = {}
+        if self.cache is not None:
+            headers.update(self.cache.conditional_headers(self.url, limit=limit))
+        response = self._get(self.url, headers=headers, stream=True)
+        if response.status_code == 304 and self.cache is not None:
+            response.close()
+            cached = self.cache.revalidated(self.url, limit=limit)
+            if cached is not None:
+                get_recorder().observe("feed_cache_hits", 1, source=self.name)
+                return cached
+            response = self._get(self.url, stream=True)
+        return response
+
+    def _store(
+        self,
+        articles: List[Article],
+        etag: Optional[str],
+        last_modified: Optional[str],
+        limit: int,
+    ) -> None:
+        if self.cache is not None:
+            self.cache.store(self.url, articles, etag=etag, last_modified=last_modified, limit=limit)
 
 
 class NYTimesTopStoriesSource(NewsSource):
     """Fetch fashion stories from The New York Times Top Stories API."""
 
-    def __init__(self, name: str, section: str = "fashion") -> None:
+    def __init__(
+        self,
+        name: str,
+        section: str = "fashion",
+        *,
+        base_url: str = NYT_API_URL,
+    ) -> None:
         super().__init__(name)
         self.section = section
+        self.base_url = base_url.rstrip("/")
 
     def fetch(self, *, limit: int) -> List[Article]:  # noqa: D401 - inherited
+        raw = self.fetch_raw(limit=limit)
+        with get_recorder().timer("parse_seconds", source=self.name):
+            return parse_raw(raw)
+
+    def fetch_raw(self, *, limit: int) -> RawFeed:  # noqa: D401 - inherited
         api_key = os.environ.get("NYTIMES_API_KEY")
         if not api_key:
             raise RuntimeError(
                 "NYTIMES_API_KEY environment variable is required for New York Times access."
             )
-        url = (
-            f"https://api.nytimes.com/svc/topstories/v2/{self.section}.json?api-key={api_key}"
-        )
-        response = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=30)
+        url = f"{self.base_url}/svc/topstories/v2/{self.section}.json?api-key={api_key}"
+        response = self._get(url)
         response.raise_for_status()
-        payload = response.json()
-        results = payload.get("results", [])
-        articles: List[Article] = []
-        for item in results[:limit]:
-            published = _parse_datetime(item.get("published_date"))
-            article = Article(
-                source=self.name,
-                title=item.get("title", "Untitled"),
-                url=item.get("url", ""),
-                summary=item.get("abstract", ""),
-                published=published,
-            )
-            articles.append(article)
+        get_recorder().observe("fetch_bytes", len(response.content), source=self.name)
+        return RawFeed(self.name, "nyt", response.content, limit)
+
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+
+def parse_raw(raw: RawFeed) -> List[Article]:
+    """Parse a :class:`RawFeed`; a pure function, safe to run in a worker process."""
+
+    if raw.format == "nyt":
+        return _articles_from_nyt(raw.source, json.loads(raw.body), limit=raw.limit)
+    return parse_feed(raw.source, io.BytesIO(raw.body), limit=raw.limit)
+
+
+def parse_feed(
+    source: str,
+    stream: IO[bytes],
+    *,
+    limit: int,
+    meta: Optional[Dict[str, str]] = None,
+) -> List[Article]:
+    """Incrementally parse up to ``limit`` items from an RSS or Atom ``stream``.
+
+    Reading stops as soon as ``limit`` items have been produced and every
+    processed item is detached from the tree, so memory use is bounded by
+    ``limit`` rather than by the size of the feed. Channel-level values read
+    along the way (currently the RSS ``ttl``) are stored in ``meta``.
+    """
+
+    articles: List[Article] = []
+    if limit <= 0:
         return articles
+    path: List[ET.Element] = []
+    for event, element in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            path.append(element)
+            continue
+        path.pop()
+        if not path:
+            break
+        parent, root = path[-1], path[0]
+        if root.tag.endswith("feed"):
+            if element.tag != f"{ATOM_NS}entry" or parent is not root:
+                continue
+            articles.append(_article_from_atom(source, element))
+        else:
+            in_channel = len(path) == 2 and parent.tag == "channel"
+            if meta is not None and in_channel and element.tag == "ttl" and element.text:
+                meta["ttl"] = element.text.strip()
+            if element.tag != "item" or (parent is not root and not in_channel):
+                continue
+            articles.append(_article_from_rss(source, element))
+        parent.remove(element)
+        element.clear()
+        if len(articles) >= limit:
+            break
+    return articles
+
+
+def _articles_from_nyt(source: str, payload: Dict[str, Any], *, limit: int) -> List[Article]:
+    results = payload.get("results", [])
+    articles: List[Article] = []
+    for item in results[:limit]:
+        published = parse_datetime(item.get("published_date"), source)
+        article = Article(
+            source=source,
+            title=item.get("title", "Untitled"),
+            url=item.get("url", ""),
+            summary=item.get("abstract", ""),
+            published=published,
+        )
+        articles.append(article)
+    return articles
 
 
 def _article_from_rss(source: str, item: ET.Element) -> Article:
@@ -96,12 +471,12 @@ def _article_from_rss(source: str, item: ET.Element) -> Article:
     summary = item.findtext("description") or item.findtext("summary") or ""
     summary = _strip_html(summary)
     url = item.findtext("link") or ""
-    published = _parse_datetime(item.findtext("pubDate"))
+    published = parse_datetime(item.findtext("pubDate"), source)
     return Article(source=source, title=title.strip(), url=url.strip(), summary=summary.strip(), published=published)
 
 
 def _article_from_atom(source: str, entry: ET.Element) -> Article:
-    ns = "{http://www.w3.org/2005/Atom}"
+    ns = ATOM_NS
     title = entry.findtext(f"{ns}title") or "Untitled"
     summary = entry.findtext(f"{ns}summary") or entry.findtext(f"{ns}content") or ""
     summary = _strip_html(summary)
@@ -109,25 +484,36 @@ def _article_from_atom(source: str, entry: ET.Element) -> Article:
     link_el = entry.find(f"{ns}link[@rel='alternate']") or entry.find(f"{ns}link")
     if link_el is not None:
         url = link_el.get("href", "")
-    published = _parse_datetime(entry.findtext(f"{ns}updated")) or _parse_datetime(
-        entry.findtext(f"{ns}published")
+    published = parse_datetime(entry.findtext(f"{ns}updated"), source) or parse_datetime(
+        entry.findtext(f"{ns}published"), source
     )
     return Article(source=source, title=title.strip(), url=url.strip(), summary=summary.strip(), published=published)
 
 
-def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    try:
-        dt = parsedate_to_datetime(value)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
-    except (TypeError, ValueError):
-        try:
-            return datetime.fromisoformat(value).astimezone(timezone.utc)
-        except ValueError:
-            return None
+MAX_AGE_RE = re.compile(r"(?:^|[,\s])max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+
+def poll_hint(headers: Mapping[str, str], *, ttl: Optional[str] = None) -> Optional[float]:
+    """Return the seconds a server asks clients to wait before polling again.
+
+    ``Retry-After`` (seconds or an HTTP date), ``Cache-Control: max-age`` and
+    the RSS ``<ttl>`` (minutes) are honoured; the longest one wins.
+    """
+
+    hints: List[float] = []
+    retry_after = (headers.get("Retry-After") or "").strip()
+    if retry_after.isdigit():
+        hints.append(float(retry_after))
+    elif retry_after:
+        retry_at = parse_datetime(retry_after, "Retry-After")
+        if retry_at is not None:
+            hints.append(max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0))
+    match = MAX_AGE_RE.search(headers.get("Cache-Control") or "")
+    if match:
+        hints.append(float(match.group(1)))
+    if ttl and ttl.isdigit():
+        hints.append(float(ttl) * 60)
+    return max(hints) if hints else None
 
 
 TAG_RE = re.compile(r"<[^>]+>")
@@ -0,0 +1,203 @@
+"""Persistent SQLite store of every article seen across runs."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .articles import Article
+
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "cmpid", "smid"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    published TEXT,
+    first_seen TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS article_categories (
+    key TEXT NOT NULL REFERENCES articles(key),
+    category TEXT NOT NULL,
+    PRIMARY KEY (key, category)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published);
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);
+CREATE INDEX IF NOT EXISTS idx_article_categories_category ON article_categories(category);
+"""
+
+
+def normalize_url(url: str) -> str:
+    """Return a canonical form of ``url`` used to identify an article."""
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower() or "https", host, path, urlencode(query), ""))
+
+
+def article_key(article: Article) -> str:
+    """Return the store key for ``article``."""
+
+    if article.url:
+        return normalize_url(article.url)
+    return f"{article.source}:{article.title}"
+
+
+class ArticleStore:
+    """Embedded article history keyed by normalised URL."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        if str(path) != ":memory:":
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "ArticleStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()
+        return count
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def known_categories(self, articles: Iterable[Article]) -> Dict[str, List[str]]:
+        """Return stored categories for each of ``articles`` already in the store."""
+
+        keys = list({article_key(article) for article in articles})
+        found: Dict[str, List[str]] = {}
+        with self._lock:
+            for offset in range(0, len(keys), 500):
+                chunk = keys[offset : offset + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for (key,) in self._conn.execute(
+                    f"SELECT key FROM articles WHERE key IN ({placeholders})", chunk
+                ):
+                    found[key] = []
+                for key, category in self._conn.execute(
+                    f"SELECT key, category FROM article_categories WHERE key IN ({placeholders}) "
+                    "ORDER BY rowid",
+                    chunk,
+                ):
+                    found[key].append(category)
+        return found
+
+    def add(self, articles: Iterable[Article]) -> int:
+        """Insert ``articles`` not yet stored and return how many were new."""
+
+        first_seen = datetime.now(timezone.utc).isoformat()
+        added = 0
+        with self._lock, self._conn:
+            for article in articles:
+                key = article_key(article)
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO articles "
+                    "(key, url, source, title, summary, published, first_seen) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        article.url,
+                        article.source,
+                        article.title,
+                        article.summary,
+                        _to_text(article.published),
+                        first_seen,
+                    ),
+                )
+                if not cursor.rowcount:
+                    continue
+                added += 1
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO article_categories (key, category) VALUES (?, ?)",
+                    [(key, category) for category in article.categories],
+                )
+        return added
+
+    def categories(self) -> Dict[str, int]:
+        """Return every stored category name with its article count."""
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT category, COUNT(*) FROM article_categories GROUP BY category ORDER BY category"
+            ).fetchall()
+        return dict(rows)
+
+    def iter_articles(
+        self,
+        *,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        newest_first: bool = True,
+    ) -> Iterator[Article]:
+        """Stream stored articles matching the given filters, ordered by date."""
+
+        clauses: List[str] = []
+        params: List[str] = []
+        if since is not None:
+            clauses.append("a.published >= ?")
+            params.append(_to_text(since) or "")
+        if until is not None:
+            clauses.append("a.published < ?")
+            params.append(_to_text(until) or "")
+        if category is not None:
+            clauses.append("a.key IN (SELECT key FROM article_categories WHERE category = ?)")
+            params.append(category)
+        if source is not None:
+            clauses.append("a.source = ?")
+            params.append(source)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "DESC" if newest_first else "ASC"
+        query = (
+            "SELECT a.key, a.source, a.title, a.url, a.summary, a.published, "
+            "(SELECT group_concat(category, char(31)) FROM "
+            "(SELECT category FROM article_categories c WHERE c.key = a.key ORDER BY rowid)) "
+            f"FROM articles a {where} ORDER BY a.published {order}, a.key"
+        )
+        # A dedicated cursor streams rows instead of materialising the result.
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(256)
+            if not rows:
+                return
+            for _key, source_name, title, url, summary, published, categories in rows:
+                yield Article(
+                    source=source_name,
+                    title=title,
+                    url=url,
+                    summary=summary,
+                    published=datetime.fromisoformat(published) if published else None,
+                    categories=categories.split("\x1f") if categories else [],
+                )
+
+
+def _to_text(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+    return value.astimezone(timezone.utc).isoformat()
@@ -0,0 +1,210 @@
+"""Rolling per-day mention counts and trending-term detection."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from .articles import Article, Category
+from .classifier import CategoryClassifier
+from .fsutil import write_atomic
+from .store import article_key
+
+LOGGER = logging.getLogger(__name__)
+
+CATEGORY = "category"
+KEYWORD = "keyword"
+TERM = "term"
+
+
+@dataclass
+class Trend:
+    """A term mentioned unusually often today compared with the days before."""
+
+    term: str
+    kind: str
+    count: int
+    mean: float
+    zscore: float
+
+
+@dataclass
+class _Day:
+    day: str
+    counts: array
+    seen: Set[int]
+
+
+class TrendTracker:
+    """Per-day mention counters for categories, keywords and watched terms.
+
+    The table holds one row of counters per day for the last ``window`` days
+    plus today, one column per term, so its size is fixed however long the
+    tracker runs. :meth:`update` adds only articles not counted before
+    (remembered by a 64-bit hash of their key while their day is in the
+    window), and :meth:`trending` compares today's row with the mean and
+    standard deviation of up to ``window`` previous rows, so no history is
+    rescanned.
+    """
+
+    def __init__(
+        self,
+        categories: Iterable[Category],
+        path: Optional[Path] = None,
+        *,
+        terms: Iterable[str] = (),
+        window: int = 14,
+        word_boundaries: bool = True,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        if window < 2:
+            raise ValueError("window must be at least 2 days")
+        categories = list(categories)
+        self.kinds: Dict[str, str] = {category.name: CATEGORY for category in categories}
+        for category in categories:
+            for keyword in sorted(category.keywords):
+                self.kinds.setdefault(keyword.lower(), KEYWORD)
+        for term in terms:
+            self.kinds.setdefault(term.lower(), TERM)
+        self.terms = list(self.kinds)
+        self._columns = {term: index for index, term in enumerate(self.terms)}
+        matched = [term for term in self.terms if self.kinds[term] != CATEGORY]
+        self._matched_columns = [self._columns[term] for term in matched]
+        self._matcher = CategoryClassifier(
+            [Category(name=term, keywords={term}) for term in matched],
+            word_boundaries=word_boundaries,
+            register=False,
+        )
+        self.path = path
+        self.window = window
+        self._clock = clock
+        self._days: List[_Day] = []
+        self._load()
+
+    def update(self, articles: Iterable[Article]) -> int:
+        """Count mentions in ``articles`` not seen before; return how many were new."""
+
+        today = self._clock().date()
+        self._roll(today)
+        by_day = {row.day: row for row in self._days}
+        oldest = today - timedelta(days=self.window)
+        added = 0
+        for article in articles:
+            day = article.published.astimezone(timezone.utc).date() if article.published else today
+            if day > today or day < oldest:
+                continue
+            row = by_day.get(day.isoformat())
+            if row is None:
+                row = by_day[day.isoformat()] = self._insert(day)
+            digest = _hash(article_key(article))
+            if digest in row.seen:
+                continue
+            row.seen.add(digest)
+            added += 1
+            for name in article.categories:
+                column = self._columns.get(name)
+                if column is not None:
+                    row.counts[column] += 1
+            mask = self._matcher.mask_for(f"{article.title}\n{article.summary}")
+            while mask:
+                low = mask & -mask
+                row.counts[self._matched_columns[low.bit_length() - 1]] += 1
+                mask ^= low
+        return added
+
+    def trending(
+        self,
+        *,
+        threshold: float = 2.0,
+        min_count: int = 3,
+        limit: int = 10,
+        min_days: int = 3,
+    ) -> List[Trend]:
+        """Return terms whose count today is ``threshold`` deviations above the window.
+
+        The baseline covers only the days since the first recorded one, so a
+        fresh tracker does not compare today against days it never saw; until
+        it has ``min_days`` of history nothing is reported.
+        """
+
+        today = self._clock().date()
+        self._roll(today)
+        rows = {row.day: row for row in self._days}
+        current = rows.get(today.isoformat())
+        past = [row.day for row in self._days if row.day < today.isoformat()]
+        if current is None or not past:
+            return []
+        span = min((today - date.fromisoformat(past[0])).days, self.window)
+        if span < min_days:
+            return []
+        history = [
+            rows.get((today - timedelta(days=offset)).isoformat())
+            for offset in range(1, span + 1)
+        ]
+        trends: List[Trend] = []
+        for term, column in self._columns.items():
+            count = current.counts[column]
+            if count < min_count:
+                continue
+            values = [row.counts[column] if row else 0 for row in history]
+            mean = sum(values) / len(values)
+            deviation = math.sqrt(sum((value - mean) ** 2 for value in values) / len(values))
+            # A floor of one mention keeps quiet terms from spiking on noise.
+            zscore = (count - mean) / max(deviation, 1.0)
+            if zscore >= threshold:
+                trends.append(Trend(term, self.kinds[term], count, mean, zscore))
+        trends.sort(key=lambda trend: (-trend.zscore, -trend.count, trend.term))
+        return trends[:limit]
+
+    def save(self) -> None:
+        """Persist the counter table to :attr:`path` atomically (no-op without a path)."""
+
+        if self.path is None:
+            return
+        payload = {
+            "terms": self.terms,
+            "days": [
+                {"day": row.day, "counts": row.counts.tolist(), "seen": sorted(row.seen)}
+                for row in self._days
+            ],
+        }
+        write_atomic(self.path, json.dumps(payload, separators=(",", ":")))
+
+    def _insert(self, day: date) -> _Day:
+        row = _Day(day.isoformat(), array("I", bytes(4 * len(self.terms))), set())
+        self._days.append(row)
+        self._days.sort(key=lambda item: item.day)
+        return row
+
+    def _roll(self, today: date) -> None:
+        oldest = (today - timedelta(days=self.window)).isoformat()
+        self._days = [row for row in self._days if row.day >= oldest]
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            stored_terms = payload["terms"]
+            for stored in payload["days"]:
+                row = self._insert(date.fromisoformat(stored["day"]))
+                # Terms may have changed since the table was written.
+                for term, count in zip(stored_terms, stored["counts"]):
+                    column = self._columns.get(term)
+                    if column is not None:
+                        row.counts[column] = count
+                row.seen.update(stored["seen"])
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            LOGGER.warning("Ignoring unreadable trends file %s: %s", self.path, exc)
+            self._days = []
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
@@ -0,0 +1,95 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from fashion_business_daily.aggregator import NewsAggregator
+from fashion_business_daily.articles import Article, Category
+from fashion_business_daily.sources import NewsSource
+
+
+NOW = datetime.now(timezone.utc)
+
+
+class StaticSource(NewsSource):
+    def __init__(self, name, titles, *, delay=0.0, fail=False):
+        super().__init__(name)
+        self.titles = titles
+        self.delay = delay
+        self.fail = fail
+
+    def fetch(self, *, limit):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        return self.articles(limit)
+
+    def articles(self, limit):
+        return [
+            Article(
+                source=self.name,
+                title=title,
+                url=f"https://example.com/{self.name}/{index}",
+                summary="",
+                published=NOW - timedelta(minutes=index),
+            )
+            for index, title in enumerate(self.titles[:limit])
+        ]
+
+
+CATEGORIES = [Category(name="Marketing", keywords={"campaign"})]
+
+
+def test_concurrent_fetch_matches_sequential_and_isolates_errors() -> None:
+    sources = [
+        StaticSource("slow", ["Slow campaign"], delay=0.05),
+        StaticSource("broken", ["Never"], fail=True),
+        StaticSource("fast", ["Fast story"]),
+    ]
+
+    sequential = NewsAggregator(sources, CATEGORIES).fetch()
+    concurrent = NewsAggregator(sources, CATEGORIES, max_workers=4).fetch()
+
+    assert [a.url for a in concurrent] == [a.url for a in sequential]
+    assert {a.source for a in concurrent} == {"slow", "fast"}
+    assert [a.categories for a in concurrent if a.source == "slow"] == [["Marketing"]]
+
+
+def test_concurrent_fetch_honours_deadline() -> None:
+    sources = [
+        StaticSource("fast", ["Fast story"]),
+        StaticSource("stalled", ["Stalled story"], delay=1.0),
+    ]
+
+    started = time.monotonic()
+    articles = NewsAggregator(sources, CATEGORIES, max_workers=2, deadline=0.2).fetch()
+
+    assert time.monotonic() - started < 0.9
+    assert [a.source for a in articles] == ["fast"]
+
+
+class AsyncSource(StaticSource):
+    async def fetch_async(self, *, limit):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        return self.articles(limit)
+
+
+def test_fetch_async_applies_timeouts_deadline_and_concurrency() -> None:
+    sources = [
+        AsyncSource("slow", ["Slow campaign"], delay=0.05),
+        AsyncSource("hung", ["Hung story"], delay=5.0),
+        AsyncSource("broken", ["Never"], fail=True),
+        StaticSource("threaded", ["Threaded story"]),
+    ]
+    aggregator = NewsAggregator(sources, CATEGORIES, source_timeout=0.5, deadline=2.0)
+
+    started = time.monotonic()
+    articles = asyncio.run(aggregator.fetch_async(concurrency=2))
+
+    assert time.monotonic() - started < 1.5
+    assert [a.source for a in articles] == ["slow", "threaded"]
+    assert articles[0].categories == ["Marketing"]
+
+    stalled = NewsAggregator([AsyncSource("hung", ["Hung"], delay=5.0)], CATEGORIES, deadline=0.1)
+    assert asyncio.run(stalled.fetch_async()) == []
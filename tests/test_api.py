@@ -0,0 +1,89 @@
+import json
+import threading
+import urllib.request
+from datetime import datetime, timezone
+
+from fashion_business_daily.api import ArticleAPI, make_server
+from fashion_business_daily.articles import Article
+
+
+def _article(title, day, source="WWD", categories=("Executive",)):
+    return Article(
+        source=source,
+        title=title,
+        url=f"https://example.com/{day}",
+        summary="",
+        published=None if day is None else datetime(2025, 10, day, tzinfo=timezone.utc),
+        categories=categories,
+    )
+
+
+ARTICLES = [
+    _article("Undated", None, categories=()),
+    _article("Newest", 25, source="Vogue Business"),
+    _article("Middle", 24, categories=("Executive", "Marketing")),
+    _article("Oldest", 20),
+]
+
+
+def _json(response):
+    return json.loads(response.body)
+
+
+def test_endpoints_use_indexes_and_cache_until_next_aggregation():
+    api = ArticleAPI(cache_size=2)
+    api.publish(ARTICLES)
+
+    latest = _json(api.handle("/api/articles?limit=2"))
+    assert (latest["total"], [a["title"] for a in latest["articles"]]) == (4, ["Undated", "Newest"])
+    marketing = _json(api.handle("/api/categories/Marketing"))
+    assert [a["title"] for a in marketing["articles"]] == ["Middle"]
+    assert _json(api.handle("/api/categories"))["categories"] == {
+        "Executive": 3, "General": 1, "Marketing": 1
+    }
+    by_source = _json(api.handle("/api/sources/Vogue%20Business"))
+    assert [a["title"] for a in by_source["articles"]] == ["Newest"]
+    ranged = _json(api.handle("/api/articles?since=2025-10-21&until=2025-10-25"))
+    assert [a["title"] for a in ranged["articles"]] == ["Middle"]
+    assert api.handle("/api/sources/Nope").status == 404
+    assert api.handle("/api/articles?limit=x").status == 400
+
+    first = api.handle("/api/articles")
+    assert api.handle("/api/articles") is first
+    assert api.handle("/api/articles", first.etag).status == 304
+
+    api.publish(ARTICLES[1:])
+    assert _json(api.handle("/api/articles"))["total"] == 3
+    assert api.handle("/api/articles", first.etag).status == 200
+
+
+def test_articles_are_listed_latest_first_after_ranking():
+    api = ArticleAPI()
+    # Ranked output is in relevance order, not publication order.
+    api.publish([ARTICLES[3], ARTICLES[1], ARTICLES[0], ARTICLES[2]])
+
+    titles = [a["title"] for a in _json(api.handle("/api/articles"))["articles"]]
+    assert titles == ["Undated", "Newest", "Middle", "Oldest"]
+
+
+def test_http_server_answers_with_etags():
+    api = ArticleAPI()
+    api.publish(ARTICLES)
+    server = make_server(api, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}/api/articles"
+    try:
+        with urllib.request.urlopen(url) as response:
+            etag = response.headers["ETag"]
+            assert json.loads(response.read())["total"] == 4
+        request = urllib.request.Request(url, headers={"If-None-Match": etag})
+        try:
+            urllib.request.urlopen(request)
+        except urllib.error.HTTPError as exc:
+            assert exc.code == 304
+        else:  # pragma: no cover - the assertion below reports it
+            raise AssertionError("expected 304 Not Modified")
+    finally:
+        server.shutdown()
+        server.server_close()
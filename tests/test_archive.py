@@ -0,0 +1,38 @@
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+
+from fashion_business_daily.archive import build_archive
+from fashion_business_daily.articles import Article
+from fashion_business_daily.store import ArticleStore
+
+
+def test_build_archive_paginates_days_and_categories(tmp_path) -> None:
+    start = datetime(2025, 10, 25, 12, tzinfo=timezone.utc)
+    with ArticleStore(tmp_path / "articles.db") as store:
+        store.add(
+            Article(
+                source="WWD",
+                title=f"Story {index}",
+                url=f"https://example.com/{index}",
+                summary="Summary",
+                published=start - timedelta(hours=index * 6),
+                categories=["Marketing & Campaigns"] if index % 2 else [],
+            )
+            for index in range(7)
+        )
+
+        result = build_archive(store, tmp_path / "archive", page_size=2)
+        rerun = build_archive(store, tmp_path / "archive", page_size=2)
+
+    archive = tmp_path / "archive"
+    assert result.days == 2
+    assert sorted(p.name for p in (archive / "days" / "2025-10-24").iterdir()) == [
+        "page-1.html",
+        "page-2.html",
+    ]
+    assert 'href="page-2.html">Older' in (archive / "days" / "2025-10-24" / "page-1.html").read_text()
+    assert (archive / "categories" / "marketing-campaigns" / "page-2.html").exists()
+    assert "days/2025-10-25/page-1.html" in (archive / "index.html").read_text()
+    feed = ET.parse(archive / "feed.xml").getroot()
+    assert len(feed.findall("{http://www.w3.org/2005/Atom}entry")) == 7
+    assert rerun.pages_written == 0
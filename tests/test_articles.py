@@ -0,0 +1,64 @@
+import pickle
+from datetime import datetime, timedelta, timezone
+
+from fashion_business_daily.articles import Article, ArticleBatch
+from fashion_business_daily.report import build_markdown_digest
+from fashion_business_daily.site import render_section
+
+NOW = datetime(2025, 10, 25, 12, tzinfo=timezone.utc)
+
+
+def make(index, categories=(), published=None):
+    return Article(
+        source="WWD",
+        title=f"Story {index}",
+        url=f"https://example.com/{index}",
+        summary="Summary",
+        published=published,
+        categories=categories,
+    )
+
+
+def test_article_is_slotted_and_keeps_categories_as_a_mask() -> None:
+    article = make(1, ["Marketing", "Retail"])
+
+    assert not hasattr(article, "__dict__")
+    assert article.categories == ["Marketing", "Retail"]
+    article.categories = ["Retail"]
+    assert article.category_mask.bit_count() == 1
+    assert article == make(1, ["Retail"])
+    assert pickle.loads(pickle.dumps(article)).categories == ["Retail"]
+
+
+def test_batch_filters_sorts_and_groups_on_columns() -> None:
+    articles = [
+        make(1, ["Marketing"], NOW - timedelta(hours=5)),
+        make(2, [], NOW - timedelta(days=10)),
+        make(3, ["Marketing"], None),
+        make(4, [], NOW - timedelta(hours=1)),
+    ]
+    batch = ArticleBatch.from_articles(articles).recent(now=NOW).sorted()
+
+    assert [ref.title for ref in batch] == ["Story 3", "Story 4", "Story 1"]
+    assert batch[2].published == NOW - timedelta(hours=5)
+    grouped = batch.group_by_categories()
+    assert {label: [ref.url for ref in rows] for label, rows in grouped.items()} == {
+        "Marketing": ["https://example.com/3", "https://example.com/1"],
+        "General": ["https://example.com/4"],
+    }
+    assert batch.to_articles()[2] == articles[0]
+
+
+def test_group_labels_do_not_depend_on_registration_order() -> None:
+    # "Zeta Label" is registered (gets its bit) before "Alpha Label".
+    batch = ArticleBatch.from_articles([make(1, ["Zeta Label", "Alpha Label"], NOW)])
+
+    assert list(batch.group_by_categories()) == ["Alpha Label, Zeta Label"]
+
+
+def test_renderers_accept_batches() -> None:
+    articles = [make(1, ["Marketing"], NOW), make(2, [], NOW - timedelta(hours=1))]
+    batch = ArticleBatch.from_articles(articles)
+
+    assert build_markdown_digest(batch).split("\n", 3)[3] == build_markdown_digest(articles).split("\n", 3)[3]
+    assert render_section("Marketing", batch) == render_section("Marketing", articles)
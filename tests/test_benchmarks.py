@@ -0,0 +1,53 @@
+from benchmarks.dates import run as run_dates
+from benchmarks.run import build_parser, compare, percentile, run
+from benchmarks.startup import check as check_startup
+
+
+def test_benchmark_harness_runs_against_fixture_server() -> None:
+    args = build_parser().parse_args(
+        ["--rss-feeds", "3", "--atom-feeds", "2", "--nyt-feeds", "1", "--items", "10",
+         "--limit", "5", "--failure-rate", "0.3", "--repeat", "1"]
+    )
+
+    results = run(args)
+
+    assert results["articles"] == 5 * (6 - results["failing_feeds"])
+    assert set(results["stages"]) == {"fetch", "classify", "assign_categories", "digest", "site"}
+    assert compare(results, results, tolerance=0.0) == []
+
+
+def test_compare_flags_slower_stages() -> None:
+    baseline = {"stages": {"fetch": {"seconds": 1.0, "peak_mb": 1.0}}}
+    current = {"stages": {"fetch": {"seconds": 1.5, "peak_mb": 1.0}}}
+
+    assert compare(current, baseline, tolerance=0.2) == ["fetch.seconds: 1.5000 > 1.0000 (+20%)"]
+    assert percentile([3.0, 1.0, 2.0, 4.0], 50) == 2.0
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    ten = [float(value) for value in range(10, 0, -1)]
+    hundred = [float(value) for value in range(1, 101)]
+
+    assert (percentile(ten, 50), percentile(ten, 90), percentile(ten, 99)) == (5.0, 9.0, 10.0)
+    assert (percentile(hundred, 50), percentile(hundred, 90), percentile(hundred, 99)) == (50.0, 90.0, 99.0)
+    assert percentile(ten, 0) == 1.0
+
+
+def test_date_benchmark_agrees_with_expected_values() -> None:
+    results = run_dates(items=500, sources=12)
+
+    assert results["memoized"]["correct"] == 500
+    assert results["legacy"]["correct"] < 500
+
+
+def test_startup_budget_check_reports_overruns() -> None:
+    results = {
+        "cli_import_ms": 80.0,
+        "help_startup_ms": 100.0,
+        "config_load": {"warm": {"ms": 1.0, "yaml_imported": True}},
+    }
+
+    assert check_startup(results, import_budget_ms=60, startup_budget_ms=250) == [
+        "cli_import_ms: 80.0 > 60.0",
+        "config_load.warm: PyYAML imported despite an up-to-date snapshot",
+    ]
@@ -0,0 +1,67 @@
+import io
+
+from fashion_business_daily.cache import FeedCache
+from fashion_business_daily.sources import RSSNewsSource
+
+FEED = b"""<?xml version="1.0"?>
+<rss><channel>
+  <item><title>Label names new CEO</title><link>https://example.com/a</link>
+  <description>Story</description><pubDate>Sat, 25 Oct 2025 08:00:00 GMT</pubDate></item>
+</channel></rss>
+"""
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.raw = io.BytesIO(content)
+        self.headers = headers or {}
+
+    def close(self):
+        pass
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+class FakeTransport:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, *, headers=None, timeout=30, stream=False, retries=True):
+        headers = headers or {}
+        self.calls.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(200, FEED, {"ETag": '"v1"'})
+
+
+def test_conditional_get_serves_304_from_cache(tmp_path) -> None:
+    path = tmp_path / "cache.json"
+    cache = FeedCache(path)
+    source = RSSNewsSource("Test", "https://example.com/rss", cache=cache)
+    source.transport = transport = FakeTransport()
+
+    first = source.fetch(limit=5)
+    cache.save()
+    source.cache = reloaded = FeedCache(path)
+    second = source.fetch(limit=5)
+
+    assert [a.title for a in second] == [a.title for a in first] == ["Label names new CEO"]
+    assert second[0].published == first[0].published
+    assert transport.calls[1]["If-None-Match"] == '"v1"'
+    assert (cache.misses, reloaded.hits) == (1, 1)
+
+
+def test_cache_evicts_by_size_and_ttl(tmp_path) -> None:
+    now = [1000.0]
+    cache = FeedCache(tmp_path / "cache.json", max_entries=2, ttl=60, clock=lambda: now[0])
+    for url in ("a", "b", "c"):
+        cache.store(url, [], etag="x", last_modified=None, limit=5)
+
+    assert cache.conditional_headers("a", limit=5) == {}
+    assert cache.conditional_headers("c", limit=5) == {"If-None-Match": "x"}
+
+    now[0] += 61
+    assert cache.conditional_headers("c", limit=5) == {}
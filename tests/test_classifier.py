@@ -0,0 +1,71 @@
+from fashion_business_daily.articles import Article, Category
+from fashion_business_daily.classifier import CategoryClassifier
+from fashion_business_daily.config import load_categories
+
+CATEGORIES = [
+    Category(name="Executive", keywords={"ceo", "chief executive"}),
+    Category(name="Campaigns", keywords={"campaign", "ad campaign"}),
+    Category(name="Ads", keywords={"ad"}),
+]
+
+
+def test_word_boundaries_avoid_partial_hits() -> None:
+    classifier = CategoryClassifier(CATEGORIES)
+
+    assert classifier.categories_for("Ceorl unveils a new look") == []
+    assert classifier.categories_for("Label names new CEO.") == ["Executive"]
+    assert CategoryClassifier(CATEGORIES, word_boundaries=False).categories_for("Ceorl") == [
+        "Executive"
+    ]
+
+
+def test_longer_keyword_credits_contained_keywords() -> None:
+    classifier = CategoryClassifier(CATEGORIES)
+
+    assert classifier.categories_for("An ad campaign for spring") == ["Campaigns", "Ads"]
+
+
+def test_matches_category_match_for_default_configuration() -> None:
+    categories = load_categories()
+    classifier = CategoryClassifier(categories, word_boundaries=False)
+    articles = [
+        Article("S", "Gucci acquires label in merger", "u1", "Chief executive to step down", None),
+        Article("S", "Capsule collection campaign", "u2", "Climate goals and ESG", None),
+        Article("S", "Runway review", "u3", "", None),
+    ]
+
+    classifier.classify_batch(articles)
+
+    for article in articles:
+        expected = [c.name for c in categories if c.match(f"{article.title}\n{article.summary}")]
+        assert article.categories == expected
+
+
+def test_overlapping_keywords_all_match() -> None:
+    categories = [
+        Category(name="A", keywords={"chief executive", "ab"}),
+        Category(name="B", keywords={"executive officer", "bc"}),
+    ]
+    text = "named chief executive officer today"
+
+    assert CategoryClassifier(categories).categories_for(text) == ["A", "B"]
+    assert [c.name for c in categories if c.match(text)] == ["A", "B"]
+    assert CategoryClassifier(categories, word_boundaries=False).categories_for("abc") == ["A", "B"]
+    assert CategoryClassifier(categories).hit_count(text) == 2
+
+
+def test_whole_words_still_match_plurals() -> None:
+    categories = load_categories()
+    headlines = [
+        "Luxury group names two new CEOs",
+        "Brand campaigns go digital",
+        "Acquisitions surge in luxury",
+        "Mergers and acquisitions",
+        "New ambassadors named",
+    ]
+
+    for headline in headlines:
+        expected = [c.name for c in categories if c.match(headline)]
+        assert expected
+        assert CategoryClassifier(categories).categories_for(headline) == expected
+    assert CategoryClassifier(CATEGORIES).categories_for("Ads and ad campaigns") == ["Campaigns", "Ads"]
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from fashion_business_daily.cli import build_parser, main
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def test_cli_import_does_not_load_the_http_stack():
+    code = (
+        "import sys; import fashion_business_daily.cli; "
+        "print(sorted(m for m in ('requests', 'yaml', 'xml.etree.ElementTree') if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        env={"PYTHONPATH": str(SRC)},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert output.strip() == "[]"
+
+
+def test_negative_top_k_is_a_usage_error(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["--top-k", "-1"])
+
+    assert excinfo.value.code == 2
+    assert "--top-k must be 0" in capsys.readouterr().err
+
+
+def test_whole_word_matching_can_be_turned_off():
+    assert build_parser().parse_args([]).whole_words
+    assert not build_parser().parse_args(["--no-whole-words"]).whole_words
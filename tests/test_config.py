@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from fashion_business_daily import config
+
+SOURCES = """sources:
+  - name: "Example"
+    type: "rss"
+    url: "https://example.com/rss"
+    interval: 300
+"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_snapshot(monkeypatch):
+    monkeypatch.setattr(config, "_SNAPSHOT", None)
+
+
+def test_snapshot_is_compiled_once_and_revalidated(tmp_path, monkeypatch):
+    path = tmp_path / "sources.yaml"
+    path.write_text(SOURCES, encoding="utf-8")
+
+    first = config.load_snapshot(path)
+    assert first.sources == [
+        {"name": "Example", "type": "rss", "url": "https://example.com/rss", "interval": 300}
+    ]
+    assert config.snapshot_path(path).exists()
+
+    compiled = []
+    original = config._compile
+    monkeypatch.setattr(config, "_compile", lambda *args: compiled.append(args) or original(*args))
+    monkeypatch.setattr(config, "_SNAPSHOT", None)
+    assert config.load_snapshot(path).sources == first.sources
+    assert compiled == []
+
+    path.write_text(SOURCES.replace("Example", "Renamed"), encoding="utf-8")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 10**9))
+    assert config.load_snapshot(path).sources[0]["name"] == "Renamed"
+    assert len(compiled) == 1
+
+
+def test_commented_out_sources_keep_the_defaults(tmp_path):
+    path = tmp_path / "sources.yaml"
+    path.write_text("# sources:\n#   - name: Example\n", encoding="utf-8")
+
+    assert config.load_snapshot(path).sources == config.DEFAULT_SOURCES
+    assert [name for name, _ in config.load_snapshot(path).categories] == list(
+        config.DEFAULT_CATEGORIES
+    )
+
+
+def test_ranking_settings_come_from_sources_yaml(tmp_path, monkeypatch):
+    path = tmp_path / "sources.yaml"
+    path.write_text(
+        SOURCES + "    weight: 2\nranking:\n  top_k: 5\n  weights:\n    keywords: 1.5\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(config, "CONFIG_PATH", path)
+
+    ranking = config.load_ranking()
+
+    assert (ranking.top_k, ranking.keywords, ranking.recency) == (5, 1.5, 1.0)
+    assert ranking.source_weights == {"Example": 2.0}
@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from fashion_business_daily.dates import DateParser
+
+EXPECTED = datetime(2025, 3, 4, 5, 6, 7, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "Tue, 04 Mar 2025 05:06:07 GMT",
+        "Tue, 04 Mar 2025 01:06:07 -0400",
+        "Mon, 03 Mar 2025 22:06:07 PDT",
+        "Tue, 04 Mar 2025 07:06:07 CEST",
+        "4 Mar 25 5:06:07 UT",
+        "2025-03-04T05:06:07Z",
+        "2025-03-04T07:06:07+02:00",
+        "20250304T050607Z",
+        "2025-03-04 05:06:07.0000",
+    ],
+)
+def test_parses_common_publisher_formats(value) -> None:
+    assert DateParser().parse(value, "feed") == EXPECTED
+
+
+def test_format_is_memoized_per_source_and_redetected() -> None:
+    parser = DateParser()
+
+    parser.parse("Tue, 04 Mar 2025 05:06:07 GMT", "a")
+    parser.parse("2025-03-04T05:06:07Z", "b")
+    assert parser.formats() == {"a": "rfc822", "b": "iso"}
+
+    assert parser.parse("2025-03-04T05:06:07Z", "a") == EXPECTED
+    assert parser.formats()["a"] == "iso"
+    assert parser.parse("not a date", "a") is None
+    assert parser.parse(None, "a") is None
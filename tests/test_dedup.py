@@ -0,0 +1,90 @@
+import random
+from datetime import datetime, timezone
+
+from fashion_business_daily.articles import Article
+from fashion_business_daily.dedup import LSHIndex, MinHasher, cluster_articles, shingles
+from fashion_business_daily.report import build_markdown_digest
+from fashion_business_daily.site import build_site_assets
+
+
+def make(source, title, url, summary=""):
+    return Article(
+        source=source,
+        title=title,
+        url=url,
+        summary=summary,
+        published=datetime(2025, 10, 25, tzinfo=timezone.utc),
+        categories=["Creative Director Moves"],
+    )
+
+
+def test_cluster_articles_groups_near_duplicates() -> None:
+    articles = [
+        make("BoF", "Gucci names Demna as its new creative director", "https://bof.example/1"),
+        make("WWD", "Gucci names Demna as new creative director", "https://wwd.example/1"),
+        make("NYT", "Sustainability targets slip across luxury sector", "https://nyt.example/1"),
+        make("Vogue Business", "Gucci names Demna as its new creative director.", "https://vb.example/1"),
+    ]
+
+    clusters = cluster_articles(articles)
+
+    assert [article.source for article in clusters] == ["BoF", "NYT"]
+    assert [alternate.source for alternate in clusters[0].alternates] == ["WWD", "Vogue Business"]
+
+    digest = build_markdown_digest(clusters)
+    html = build_site_assets(clusters)["index.html"]
+    assert digest.count("Gucci names Demna") == 1
+    assert "Also covered by: [WWD](https://wwd.example/1)" in digest
+    assert "https://vb.example/1" in html
+
+
+def test_cluster_articles_ignores_differing_summaries() -> None:
+    articles = [
+        make(
+            "BoF",
+            "Gucci names Demna as its new creative director",
+            "https://bof.example/2",
+            "The Balenciaga designer will take over creative direction at Kering's biggest brand "
+            "in July, the group said on Thursday, ending months of speculation.",
+        ),
+        make(
+            "WWD",
+            "Gucci Names Demna as New Creative Director",
+            "https://wwd.example/2",
+            "Demna, who spent a decade at Balenciaga, becomes artistic director as Kering tries "
+            "to revive sales at its largest label.",
+        ),
+        make(
+            "Vogue Business",
+            "Gucci names Demna creative director",
+            "https://vb.example/2",
+            "The designer leaves after ten years to take the top creative job at the Italian "
+            "house, with a first collection due in September.",
+        ),
+        make("NYT", "Gucci names new CEO", "https://nyt.example/2", "Kering appointed a new chief executive."),
+        make("FT", "Prada names new CEO", "https://ft.example/2", "Prada Group appointed a new chief executive."),
+    ]
+
+    clusters = cluster_articles(articles)
+
+    assert [article.source for article in clusters] == ["BoF", "NYT", "FT"]
+    assert [alternate.source for alternate in clusters[0].alternates] == ["WWD", "Vogue Business"]
+
+
+def _candidate_count(count: int) -> int:
+    rng = random.Random(count)
+    hasher, index = MinHasher(64), LSHIndex(64, 16)
+    total = 0
+    for key in range(count):
+        words = ("".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(3, 9))) for _ in range(6))
+        total += len(index.insert(key, hasher.signature(shingles(" ".join(words)))))
+    return total
+
+
+def test_unrelated_headlines_rarely_become_candidates() -> None:
+    # Sparse headline signatures used to share all-empty bands, so candidate
+    # comparisons grew quadratically with the number of articles.
+    small, large = _candidate_count(1000), _candidate_count(4000)
+
+    assert small < 100
+    assert large < 400
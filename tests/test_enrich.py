@@ -0,0 +1,127 @@
+import io
+import threading
+import time
+from urllib.parse import urlsplit
+
+from fashion_business_daily.articles import Article, Category
+from fashion_business_daily.classifier import CategoryClassifier
+from fashion_business_daily.enrich import ContentCache, Enricher, extract_text, page_encoding
+
+CATEGORIES = [
+    Category(name="Executive", keywords={"ceo"}),
+    Category(name="Sustainability", keywords={"recycled"}),
+]
+
+PAGE = b"""<html><head><script>var ceo = 1;</script></head><body>
+<nav><p>Menu: CEO interviews</p></nav>
+<article><h1>Spring line</h1><p>The label moves to   recycled
+nylon.</p><p>More &amp; more.</p></article>
+<footer><p>Copyright</p></footer></body></html>"""
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b""):
+        self.status_code = status_code
+        self.raw = io.BytesIO(content)
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+
+    def close(self):
+        pass
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+class FakeTransport:
+    """Records requests; each one blocks for ``delay`` so overlapping calls are seen."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.urls = []
+        self.active = {}
+        self.peak = 0
+        self.host_peak = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, *, headers=None, timeout=30, stream=False):
+        host = urlsplit(url).netloc
+        with self._lock:
+            self.urls.append(url)
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak = max(self.peak, sum(self.active.values()))
+            self.host_peak = max(self.host_peak, self.active[host])
+        try:
+            time.sleep(self.delay)
+            return FakeResponse(404) if url.endswith("/missing") else FakeResponse(200, PAGE)
+        finally:
+            with self._lock:
+                self.active[host] -= 1
+
+
+def _article(url, summary="Short teaser"):
+    return Article(source="WWD", title="Spring line", url=url, summary=summary, published=None)
+
+
+def test_extract_text_prefers_article_paragraphs():
+    assert extract_text(PAGE.decode()) == "The label moves to recycled nylon.\nMore & more."
+
+
+def test_page_encoding_defaults_to_utf8_without_a_charset():
+    page = "<p>Maison Margiela’s new café</p>".encode("utf-8")
+
+    assert page.decode(page_encoding("text/html", page)) == page.decode("utf-8")
+    assert page_encoding("text/html; charset=ISO-8859-1", page) == "iso8859-1"
+    assert page_encoding("text/html", b'<meta charset="windows-1252"><p>x</p>') == "cp1252"
+    assert page_encoding("text/html; charset=bogus", page) == "utf-8"
+
+
+def test_enrich_reclassifies_short_summaries_and_caches_pages(tmp_path):
+    classifier = CategoryClassifier(CATEGORIES)
+    articles = [
+        _article("https://example.com/a"),
+        _article("https://example.com/missing"),
+        _article("https://example.com/long", summary="x" * 300),
+    ]
+    transport = FakeTransport()
+    with ContentCache(tmp_path / "pages.db") as cache:
+        result = Enricher(cache=cache, transport=transport, per_host=1).enrich(articles, classifier)
+
+        assert articles[0].categories == ["Sustainability"]
+        assert (result.candidates, result.fetched, result.failed, result.reclassified) == (2, 1, 1, 1)
+        assert sorted(transport.urls) == ["https://example.com/a", "https://example.com/missing"]
+        assert transport.peak == 1
+        assert len(cache) == 2
+
+        again = [_article("https://example.com/a"), _article("https://example.com/missing")]
+        second = Enricher(cache=cache, transport=transport).enrich(again, classifier)
+        assert again[0].categories == ["Sustainability"]
+        assert (second.cached, second.fetched) == (2, 0)
+        assert len(transport.urls) == 2
+
+
+def test_enrich_stops_at_budget():
+    classifier = CategoryClassifier(CATEGORIES)
+    articles = [_article(f"https://example.com/{index}") for index in range(3)]
+    transport = FakeTransport()
+
+    result = Enricher(transport=transport, time_budget=0).enrich(articles, classifier)
+
+    assert result.skipped == 3
+    assert transport.urls == []
+    assert all(article.categories == [] for article in articles)
+
+
+def test_busy_host_does_not_hold_workers_other_hosts_need():
+    classifier = CategoryClassifier(CATEGORIES)
+    articles = [_article(f"https://busy.example/{index}") for index in range(4)]
+    articles += [_article(f"https://quiet.example/{index}") for index in range(2)]
+    transport = FakeTransport()
+
+    result = Enricher(transport=transport, workers=3, per_host=1).enrich(articles, classifier)
+
+    assert result.fetched == 6
+    assert transport.host_peak == 1
+    assert transport.peak == 2
+    # The quiet host is served alongside the busy one, not after its backlog.
+    assert {"https://quiet.example/0", "https://quiet.example/1"} <= set(transport.urls[:4])
@@ -0,0 +1,107 @@
+import asyncio
+
+from fashion_business_daily.aggregator import NewsAggregator
+from fashion_business_daily.health import CLOSED, HALF_OPEN, OPEN, HealthTracker
+from fashion_business_daily.scheduler import PollScheduler
+from fashion_business_daily.sources import NewsSource
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class BrokenSource(NewsSource):
+    def __init__(self, name):
+        super().__init__(name)
+        self.timeouts = []
+
+    def fetch(self, *, limit):
+        self.timeouts.append((self.timeout, self.retries))
+        raise RuntimeError("connection refused")
+
+
+def test_circuit_opens_backs_off_and_persists(tmp_path) -> None:
+    clock = Clock()
+    path = tmp_path / "health.json"
+    health = HealthTracker(path, failure_threshold=2, base_backoff=60, probe_timeout=3, clock=clock)
+    source = BrokenSource("Dead feed")
+    aggregator = NewsAggregator([source], [], health=health)
+
+    aggregator.fetch()
+    assert health.state("Dead feed") == CLOSED
+    aggregator.fetch()
+    assert health.state("Dead feed") == OPEN
+    aggregator.fetch()
+    assert source.timeouts == [(30, True), (30, True)]
+
+    clock.now += 61
+    assert health.state("Dead feed") == HALF_OPEN
+    aggregator.fetch()
+    # The probe is one short attempt, without transport retries.
+    assert source.timeouts == [(30, True), (30, True), (3, False)]
+    assert (source.timeout, source.retries) == (30, True)
+    health.save()
+
+    reloaded = HealthTracker(path, failure_threshold=2, base_backoff=60, clock=clock)
+    clock.now += 61
+    assert reloaded.state("Dead feed") == OPEN
+    assert "3 consecutive failures" in reloaded.report()[0]
+    clock.now += 60
+    reloaded.record_success("Dead feed")
+    assert reloaded.state("Dead feed") == CLOSED
+    assert reloaded.report() == []
+
+
+def test_probe_restores_a_source_without_retries() -> None:
+    clock = Clock()
+    health = HealthTracker(failure_threshold=1, base_backoff=60, probe_timeout=3, clock=clock)
+    source = BrokenSource("Single shot")
+    source.retries = False
+    aggregator = NewsAggregator([source], [], health=health)
+
+    aggregator.fetch()
+    clock.now += 61
+    aggregator.fetch()
+
+    assert source.timeouts == [(30, False), (3, False)]
+    assert (source.timeout, source.retries) == (30, False)
+
+
+def test_scheduler_skips_open_circuits_and_probes_once(tmp_path) -> None:
+    clock = Clock()
+    path = tmp_path / "health.json"
+    health = HealthTracker(path, failure_threshold=1, base_backoff=60, probe_timeout=3, clock=clock)
+    source = BrokenSource("Dead feed")
+    scheduler = PollScheduler(
+        [source], lambda batches: None, min_interval=10, max_interval=30, health=health, clock=clock
+    )
+
+    scheduler.run_pending()
+    assert health.state("Dead feed") == OPEN
+    clock.now = scheduler.states[0].next_poll
+    scheduler.run_pending()
+    assert source.timeouts == [(30, True)]
+
+    clock.now += 61
+    scheduler.run_pending()
+    assert source.timeouts == [(30, True), (3, False)]
+    assert (source.timeout, source.retries) == (30, True)
+    assert HealthTracker(path, clock=clock).report()
+
+
+def test_async_fetch_bounds_the_request_and_probes_once() -> None:
+    clock = Clock()
+    health = HealthTracker(failure_threshold=1, base_backoff=60, probe_timeout=3, clock=clock)
+    source = BrokenSource("Dead feed")
+    aggregator = NewsAggregator([source], [], source_timeout=10, health=health)
+
+    asyncio.run(aggregator.fetch_async())
+    clock.now += 61
+    asyncio.run(aggregator.fetch_async())
+
+    assert source.timeouts == [(10, True), (3, False)]
+    assert (source.timeout, source.retries) == (30, True)
@@ -0,0 +1,45 @@
+import json
+
+from benchmarks.fixture_server import FixtureConfig, FixtureServer
+from fashion_business_daily.aggregator import NewsAggregator
+from fashion_business_daily.config import load_categories
+from fashion_business_daily.metrics import MetricsRecorder, set_recorder
+
+
+def test_recorder_renders_json_and_prometheus(tmp_path) -> None:
+    recorder = MetricsRecorder()
+    recorder.observe("fetch_seconds", 0.5, source='Vogue "Business"')
+    recorder.observe("fetch_seconds", 0.25, source='Vogue "Business"')
+    recorder.observe("articles_total", 12)
+
+    recorder.write_json(tmp_path / "metrics.json")
+    recorder.write_prometheus(tmp_path / "metrics.prom")
+
+    payload = json.loads((tmp_path / "metrics.json").read_text())
+    assert {
+        "name": "fetch_seconds",
+        "labels": {"source": 'Vogue "Business"'},
+        "value": 0.75,
+        "count": 2,
+    } in payload["metrics"]
+    prometheus = (tmp_path / "metrics.prom").read_text()
+    assert 'fashion_business_daily_fetch_seconds{source="Vogue \\"Business\\""} 0.75' in prometheus
+    assert "fashion_business_daily_articles_total 12" in prometheus
+
+
+def test_pipeline_records_per_source_metrics() -> None:
+    recorder = MetricsRecorder()
+    set_recorder(recorder)
+    try:
+        with FixtureServer(FixtureConfig(rss_feeds=2, atom_feeds=1, nyt_feeds=0, items=5)) as server:
+            NewsAggregator(server.sources(), load_categories(), max_items_per_source=3).fetch()
+    finally:
+        set_recorder(None)
+
+    by_name = {}
+    for metric in recorder.metrics():
+        by_name.setdefault(metric.name, {})[metric.labels.get("source")] = metric.value
+    assert len(by_name["fetch_seconds"]) == 3
+    assert all(value > 0 for value in by_name["fetch_bytes"].values())
+    assert set(by_name["fetch_items"].values()) == {3}
+    assert "classify_seconds" in by_name
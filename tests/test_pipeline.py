@@ -0,0 +1,71 @@
+import json
+import os
+
+from benchmarks.fixture_server import FixtureConfig, FixtureServer
+from fashion_business_daily.aggregator import NewsAggregator
+from fashion_business_daily.config import load_categories
+from fashion_business_daily.health import HealthTracker
+from fashion_business_daily.pipeline import FeedParseError, ParsePipeline
+from fashion_business_daily.sources import HTTPTransport, NewsSource, RawFeed
+
+
+def test_process_pool_matches_in_process_parsing(monkeypatch) -> None:
+    monkeypatch.setitem(os.environ, "NYTIMES_API_KEY", "fixture")
+    config = FixtureConfig(rss_feeds=3, atom_feeds=2, nyt_feeds=1, items=20)
+    with FixtureServer(config) as server:
+        transport = HTTPTransport(retries=0)
+        sources = server.sources()
+        for source in sources:
+            source.transport = transport
+        expected = NewsAggregator(sources, load_categories(), max_items_per_source=10).fetch()
+        pooled = NewsAggregator(
+            sources, load_categories(), max_items_per_source=10, max_workers=4, parse_workers=2
+        ).fetch()
+        transport.close()
+
+    assert len(pooled) == 60
+    assert [(a.url, a.published, a.categories) for a in pooled] == [
+        (a.url, a.published, a.categories) for a in expected
+    ]
+
+
+def test_parse_errors_are_reported_per_feed() -> None:
+    good = RawFeed("Good", "feed", b"<rss><channel><item><title>CEO named</title></item></channel></rss>", 5)
+    bad = RawFeed("Bad", "feed", b"<rss><channel>", 5)
+
+    with ParsePipeline(load_categories(), workers=1, batch_bytes=1) as pipeline:
+        first, second = pipeline.parse([good, bad])
+
+    assert [a.categories for a in first] == [["Executive & Leadership"]]
+    assert isinstance(second, FeedParseError)
+
+
+class RawSource(NewsSource):
+    def __init__(self, name, body):
+        super().__init__(name)
+        self.body = body
+        self.remembered = []
+
+    def fetch(self, *, limit):
+        raise AssertionError("pipeline mode fetches raw bodies")
+
+    def fetch_raw(self, *, limit):
+        return RawFeed(self.name, "feed", self.body, limit)
+
+    def remember(self, raw, articles):
+        self.remembered.extend(article.title for article in articles)
+
+
+def test_pool_records_health_after_parsing_and_keeps_sources_apart(tmp_path) -> None:
+    first = RawSource("Same", b"<rss><channel><item><title>First</title></item></channel></rss>")
+    second = RawSource("Same", b"<rss><channel><item><title>Second</title></item></channel></rss>")
+    bad = RawSource("Bad", b"<rss><channel>")
+    health = HealthTracker(tmp_path / "health.json")
+
+    NewsAggregator([first, second, bad], load_categories(), health=health, parse_workers=1).fetch()
+    health.save()
+
+    recorded = json.loads((tmp_path / "health.json").read_text())
+    assert (first.remembered, second.remembered) == (["First"], ["Second"])
+    assert (recorded["Bad"]["successes"], recorded["Bad"]["failures"]) == (0, 1)
+    assert recorded["Same"]["successes"] == 2
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from fashion_business_daily.articles import Article, Category
+from fashion_business_daily.ranking import Ranker, RankingConfig
+
+CATEGORIES = [
+    Category(name="Executive", keywords={"ceo"}),
+    Category(name="Marketing", keywords={"campaign"}),
+]
+NOW = datetime(2025, 10, 25, 12, tzinfo=timezone.utc)
+
+
+def _article(title, *, hours_old=1.0, source="WWD", categories=("Executive",)):
+    return Article(
+        source=source,
+        title=title,
+        url=f"https://example.com/{title.replace(' ', '-')}",
+        summary="",
+        published=None if hours_old is None else NOW - timedelta(hours=hours_old),
+        categories=categories,
+    )
+
+
+def test_keeps_top_k_per_category_best_first():
+    articles = [
+        _article("Old CEO news", hours_old=48),
+        _article("Fresh CEO news", hours_old=1),
+        _article("CEO CEO CEO shake-up", hours_old=6),
+        _article("Undated CEO item", hours_old=None),
+        _article("Campaign launch", categories=("Marketing",)),
+        _article("Both CEO campaign", categories=("Executive", "Marketing"), hours_old=30),
+    ]
+    ranker = Ranker(CATEGORIES, RankingConfig(top_k=2))
+
+    kept = [article.title for article in ranker.select(articles, now=NOW)]
+
+    assert kept == ["CEO CEO CEO shake-up", "Fresh CEO news", "Campaign launch", "Both CEO campaign"]
+
+
+def test_source_weight_and_coverage_raise_scores():
+    config = RankingConfig.from_dict(
+        {"top_k": 1, "weights": {"coverage": 2.0}}, {"Business of Fashion": 3.0}
+    )
+    ranker = Ranker(CATEGORIES, config)
+    plain = _article("CEO news")
+    boosted = _article("CEO news", source="Business of Fashion")
+    covered = _article("CEO update")
+    covered.alternates = [_article("CEO update", source="Vogue Business")]
+
+    assert ranker.score(boosted, NOW) == pytest.approx(3 * ranker.score(plain, NOW))
+    assert ranker.score(covered, NOW) > ranker.score(plain, NOW)
+    assert ranker.select([plain, boosted], now=NOW) == [boosted]
+    with pytest.raises(ValueError):
+        RankingConfig.from_dict({"weights": {"freshness": 1}})
+    with pytest.raises(ValueError, match="half_life_hours"):
+        RankingConfig.from_dict({"top_k": 1, "half_life_hours": 0})
+    with pytest.raises(ValueError, match="top_k"):
+        RankingConfig.from_dict({"top_k": -1})
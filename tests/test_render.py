@@ -0,0 +1,71 @@
+import io
+import json
+from datetime import datetime, timezone
+
+from fashion_business_daily.articles import Article, ArticleBatch
+from fashion_business_daily.render import RenderPlan, write_json
+from fashion_business_daily.report import build_markdown_digest, write_digest, write_markdown
+from fashion_business_daily.site import build_site, build_site_assets, write_html
+
+
+def _articles():
+    return [
+        Article(
+            source="WWD",
+            title="Label launches sustainability initiative",
+            url="https://example.com/sustain",
+            summary="New sustainability strategy",
+            published=datetime(2025, 10, 24, tzinfo=timezone.utc),
+            categories=["Sustainability & Responsibility", "Marketing"],
+        ),
+        Article(
+            source="Business of Fashion",
+            title="Brand appoints new creative director",
+            url="https://example.com/creative",
+            summary="A major creative director move.",
+            published=datetime(2025, 10, 25, tzinfo=timezone.utc),
+            categories=["Creative Director Moves"],
+        ),
+    ]
+
+
+def test_plan_groups_once_for_every_output(tmp_path, monkeypatch):
+    calls = []
+    original = ArticleBatch.group_by_categories
+
+    def counting(self, *args, **kwargs):
+        calls.append(len(self))
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ArticleBatch, "group_by_categories", counting)
+    plan = RenderPlan.build(_articles())
+
+    markdown, html, payload = io.StringIO(), io.StringIO(), io.StringIO()
+    write_markdown(plan, markdown)
+    write_html(plan, html)
+    write_json(plan, payload)
+    build_site(plan, tmp_path / "site")
+    write_digest(plan, tmp_path / "digest")
+
+    assert calls == [2]
+    assert list(plan.sections) == sorted(plan.sections)
+    assert markdown.getvalue() == build_markdown_digest(plan)
+    assert html.getvalue() == build_site_assets(plan)["index.html"]
+    document = json.loads(payload.getvalue())
+    assert [section["category"] for section in document["sections"]] == list(plan.sections)
+    section = document["sections"][1]
+    assert section["category"] == "Marketing, Sustainability & Responsibility"
+    assert section["articles"][0]["url"] == "https://example.com/sustain"
+
+
+def test_streamed_digest_matches_string_digest(tmp_path):
+    plan = RenderPlan.build(_articles())
+
+    path = write_digest(plan, tmp_path)
+    assert path.read_text(encoding="utf-8") == build_markdown_digest(plan)
+
+    later = RenderPlan.build(_articles(), updated=datetime(2030, 1, 1, tzinfo=timezone.utc))
+    before = path.stat().st_mtime_ns
+    write_digest(later, tmp_path)
+    assert path.stat().st_mtime_ns == before
+    assert not list(tmp_path.glob(".*.tmp"))
@@ -0,0 +1,102 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from fashion_business_daily.articles import Article
+from fashion_business_daily.scheduler import PollScheduler
+from fashion_business_daily.sources import HTTPTransport, NewsSource, RSSNewsSource
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ScriptedSource(NewsSource):
+    def __init__(self, name, batches, *, hint=None):
+        super().__init__(name)
+        self.batches = batches
+        self.hint = hint
+        self.polls = 0
+
+    def fetch(self, *, limit):
+        urls = self.batches[min(self.polls, len(self.batches) - 1)]
+        self.polls += 1
+        self.poll_hint = self.hint
+        return [Article(source=self.name, title=url, url=url, summary="", published=None) for url in urls]
+
+
+def test_intervals_adapt_and_rebuilds_are_debounced() -> None:
+    clock = Clock()
+    busy = ScriptedSource("busy", [["a"], ["a", "b"], ["a", "b", "c"]])
+    quiet = ScriptedSource("quiet", [["x"]])
+    throttled = ScriptedSource("throttled", [["t"]], hint=1000)
+    throttled.interval = 100
+    rebuilds = []
+    scheduler = PollScheduler(
+        [busy, quiet, throttled],
+        rebuilds.append,
+        default_interval=400,
+        min_interval=100,
+        max_interval=1000,
+        debounce=10,
+        clock=clock,
+    )
+
+    assert scheduler.run_pending() == 3
+    assert rebuilds == []
+    assert scheduler.seconds_until_next() == 10
+    clock.now = 10
+    assert scheduler.run_pending() == 0
+    assert len(rebuilds) == 1
+    assert [len(batch) for batch in rebuilds[0]] == [1, 1, 1]
+
+    intervals = scheduler.describe()
+    assert intervals == {"busy": 200, "quiet": 200, "throttled": 100}
+    assert scheduler.states[2].next_poll == 1000
+
+    clock.now = 200
+    assert scheduler.run_pending() == 2
+    assert scheduler.describe() == {"busy": 100, "quiet": 300, "throttled": 100}
+    assert len(rebuilds) == 1
+    clock.now = 210
+    scheduler.run_pending()
+    assert len(rebuilds) == 2
+    assert [a.url for a in rebuilds[1][0]] == ["a", "b"]
+
+
+class ThrottledHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(429)
+        self.send_header("Retry-After", "3600")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def test_throttled_source_waits_for_retry_after() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottledHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    transport = HTTPTransport(retries=1, backoff_factor=0, retry_after_max=0.01)
+    source = RSSNewsSource("Throttled", f"http://127.0.0.1:{server.server_port}/feed")
+    source.transport = transport
+    clock = Clock()
+    scheduler = PollScheduler(
+        [source], lambda batches: None, default_interval=300, min_interval=60, max_interval=900, clock=clock
+    )
+
+    try:
+        assert scheduler.run_pending() == 1
+    finally:
+        transport.close()
+        server.shutdown()
+        server.server_close()
+
+    assert scheduler.states[0].errors == 1
+    assert scheduler.states[0].next_poll == 3600
@@ -0,0 +1,65 @@
+import json
+from datetime import datetime, timezone
+
+from fashion_business_daily.articles import Article
+from fashion_business_daily.search import SEARCH_SCRIPT, shard_name, update_search_index
+from fashion_business_daily.site import build_site
+
+
+def make(title, url, day):
+    return Article(
+        source="WWD",
+        title=title,
+        url=url,
+        summary="Luxury group results",
+        published=datetime(2025, 10, day, 9, tzinfo=timezone.utc),
+        categories=["Executive & Leadership"],
+    )
+
+
+def test_search_index_is_sharded_and_incremental(tmp_path) -> None:
+    first = update_search_index([make("Gucci names CEO", "https://e.com/1", 24)], tmp_path)
+    second = update_search_index(
+        [make("Gucci names CEO", "https://e.com/1", 24), make("Prada campaign", "https://e.com/2", 25)],
+        tmp_path,
+    )
+
+    shard = json.loads((tmp_path / "search" / "shards" / f"{shard_name('gucci')}.json").read_text())
+    docs = json.loads((tmp_path / "search" / "docs" / "2025-10-25.json").read_text())
+    assert shard["gucci"] == {"2025-10-24": [0]}
+    assert docs[0][:3] == ["Prada campaign", "https://e.com/2", "WWD"]
+    assert first.days_updated == ["2025-10-24"]
+    assert second.days_updated == ["2025-10-25"]
+    assert "search/docs/2025-10-24.json" not in second.files_written
+
+
+def test_build_site_with_search_links_script(tmp_path) -> None:
+    result = build_site([make("Gucci names CEO", "https://e.com/1", 24)], tmp_path, search=True)
+
+    html = (tmp_path / "index.html").read_text()
+    assert 'id="search"' in html and 'src="search.js"' in html
+    assert "search.js" in result.changed_files
+    assert (tmp_path / "search" / "manifest.json").exists()
+
+
+def test_search_script_builds_results_without_html_and_shards_by_code_point() -> None:
+    assert "innerHTML" not in SEARCH_SCRIPT
+    assert 'parsed.protocol === "https:"' in SEARCH_SCRIPT
+    assert "Array.from(term).slice(0, 2)" in SEARCH_SCRIPT
+    assert shard_name("\U0001F45Ccouture") == "\U0001F45Cc".encode("utf-8").hex()
+
+
+def test_search_index_drops_days_past_retention(tmp_path) -> None:
+    update_search_index([make("Gucci names CEO", "https://e.com/1", 1)], tmp_path, retention_days=7)
+    result = update_search_index(
+        [make("Gucci campaign", "https://e.com/2", 20)], tmp_path, retention_days=7
+    )
+
+    shard = json.loads((tmp_path / "search" / "shards" / f"{shard_name('gucci')}.json").read_text())
+    manifest = json.loads((tmp_path / "search" / "manifest.json").read_text())
+    assert shard["gucci"] == {"2025-10-20": [0]}
+    assert f"search/shards/{shard_name('names')}.json" in result.files_removed
+    assert list(manifest["days"]) == ["2025-10-20"]
+    assert result.days_removed == ["2025-10-01"]
+    assert "search/docs/2025-10-01.json" in result.files_removed
+    assert not (tmp_path / "search" / "docs" / "2025-10-01.json").exists()
@@ -0,0 +1,143 @@
+import os
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from benchmarks.fixture_server import FixtureConfig, FixtureServer
+from fashion_business_daily.articles import Article
+from fashion_business_daily.shard import (
+    ShardBatch,
+    merge_batches,
+    parse_shard,
+    read_batch,
+    select_shard,
+    shard_of,
+    write_batch,
+)
+from fashion_business_daily.store import ArticleStore
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+class Named:
+    def __init__(self, name):
+        self.name = name
+
+
+def _article(source, url, minute):
+    published = datetime(2024, 5, 1, 12, minute, tzinfo=timezone.utc)
+    return Article(source=source, title=url, url=url, summary="", published=published)
+
+
+def test_shards_partition_sources_stably():
+    sources = [Named(f"feed {index}") for index in range(40)]
+
+    shards = [select_shard(sources, index, 4) for index in range(4)]
+
+    assert sorted(source.name for shard in shards for source in shard) == sorted(s.name for s in sources)
+    assert all(shard for shard in shards)
+    assert shard_of("feed 7", 4) == shard_of("feed 7", 4)
+    assert parse_shard("2/4") == (2, 4)
+    with pytest.raises(ValueError):
+        parse_shard("4/4")
+
+
+def test_merge_restores_source_order_and_drops_duplicate_urls(tmp_path):
+    positions = {"A": 0, "B": 1}
+    write_batch(tmp_path / "1.jsonl", ShardBatch(1, 2, positions, [_article("B", "https://x/1", 5)]))
+    write_batch(
+        tmp_path / "0.jsonl",
+        ShardBatch(0, 2, positions, [_article("A", "https://x/1", 5), _article("A", "https://x/2", 9)]),
+    )
+    batches = [read_batch(tmp_path / "1.jsonl"), read_batch(tmp_path / "0.jsonl")]
+
+    merged = merge_batches(batches, max_age=None)
+
+    assert [(article.source, article.url) for article in merged] == [("A", "https://x/2"), ("A", "https://x/1")]
+    with pytest.raises(ValueError):
+        merge_batches([batches[0], batches[0]])
+
+
+def test_merge_stores_new_articles_and_keeps_stored_categories(tmp_path):
+    seen = _article("A", "https://x/1", 5)
+    seen.categories = ["Marketing"]
+    batch = ShardBatch(0, 1, {"A": 0}, [_article("A", "https://x/1", 5), _article("A", "https://x/2", 9)])
+
+    with ArticleStore(tmp_path / "articles.db") as store:
+        store.add([seen])
+        merged = merge_batches([batch], store=store, max_age=None)
+
+        assert len(store) == 2
+    assert {article.url: article.categories for article in merged}["https://x/1"] == ["Marketing"]
+
+
+def _cli(args, cwd):
+    return subprocess.Popen(
+        [sys.executable, "-m", "fashion_business_daily.cli", *args],
+        cwd=cwd,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+def _wait(*processes):
+    for process in processes:
+        _, stderr = process.communicate(timeout=60)
+        assert process.returncode == 0, stderr
+
+
+def _archive(name):
+    return ["--store", f"{name}.db", "--archive-output", f"{name}_archive"]
+
+
+def _pages(root):
+    return sorted(path.relative_to(root) for path in root.rglob("*") if path.is_file())
+
+
+def _content(path):
+    return [line for line in path.read_text(encoding="utf-8").splitlines() if "Last updated" not in line]
+
+
+def test_sharded_run_matches_single_node_run(tmp_path):
+    # RSS feeds only: the fixture's Atom feeds reuse the RSS story URLs.
+    with FixtureServer(FixtureConfig(rss_feeds=9, atom_feeds=0, nyt_feeds=0, items=6)) as server:
+        (tmp_path / "config").mkdir()
+        entries = "".join(
+            f'  - name: "{source.name}"\n    type: "rss"\n    url: "{source.url}"\n'
+            for source in server.sources()
+        )
+        (tmp_path / "config" / "sources.yaml").write_text(f"sources:\n{entries}", encoding="utf-8")
+
+        _wait(_cli(["--output", "single", "--site-output", "single_site", *_archive("single")], tmp_path))
+        count = 3
+        _wait(
+            *[
+                _cli(["--shard", f"{index}/{count}", "--shard-output", f"shard{index}.jsonl"], tmp_path)
+                for index in range(count)
+            ]
+        )
+    batches = [f"shard{index}.jsonl" for index in range(count)]
+    _wait(
+        _cli(
+            ["merge", *batches, "--output", "merged", "--site-output", "merged_site", *_archive("merged")],
+            tmp_path,
+        )
+    )
+
+    assert sum(len(read_batch(tmp_path / batch).articles) for batch in batches) == 9 * 6
+    (single,) = (tmp_path / "single").glob("daily_digest_*.md")
+    (merged,) = (tmp_path / "merged").glob("daily_digest_*.md")
+    assert _content(merged) == _content(single)
+    assert _content(tmp_path / "merged_site" / "index.html") == _content(
+        tmp_path / "single_site" / "index.html"
+    )
+    assert _content(tmp_path / "merged" / "index.md") == _content(tmp_path / "single" / "index.md")
+    single_pages = _pages(tmp_path / "single_archive")
+    assert single_pages and _pages(tmp_path / "merged_archive") == single_pages
+    for page in single_pages:
+        assert _content(tmp_path / "merged_archive" / page) == _content(tmp_path / "single_archive" / page)
@@ -1,7 +1,8 @@
+import json
 from datetime import datetime, timezone
 
 from fashion_business_daily.articles import Article
-from fashion_business_daily.site import build_site_assets
+from fashion_business_daily.site import build_site, build_site_assets
 
 
 def test_site_contains_categories_and_articles():
@@ -31,3 +32,66 @@ def test_site_contains_categories_and_articles():
     assert "Marketing" in html
     assert "https://example.com/director" in html
     assert "https://example.com/marketing" in html
+
+
+def test_build_site_skips_unchanged_output(tmp_path):
+    articles = [
+        Article(
+            title="Creative Director moves",
+            url="https://example.com/director",
+            source="Business of Fashion",
+            summary="Big change in leadership.",
+            categories=["Creative Leadership"],
+            published=datetime(2024, 5, 1, tzinfo=timezone.utc),
+        ),
+        Article(
+            title="Marketing push",
+            url="https://example.com/marketing",
+            source="WWD",
+            summary="New campaign launched.",
+            categories=["Marketing"],
+            published=datetime(2024, 5, 2, tzinfo=timezone.utc),
+        ),
+    ]
+
+    first = build_site(articles, tmp_path)
+    index = tmp_path / "index.html"
+    written = index.read_text()
+    second = build_site(articles, tmp_path)
+
+    articles[1].title = "Marketing push expands"
+    third = build_site(articles, tmp_path)
+
+    assert first.changed_files == ["index.html", "styles.css"]
+    assert not second.changed
+    assert index.read_text() != written
+    assert third.changed_files == ["index.html"]
+    assert (third.rendered_sections, third.reused_sections) == (1, 1)
+    assert "Marketing push expands" in index.read_text()
+    # The manifest keeps hashes only; rendered sections live in one file each.
+    manifest = json.loads((tmp_path / ".site-manifest.json").read_text())
+    assert all(isinstance(digest, str) for digest in manifest["sections"].values())
+    assert len(list((tmp_path / ".site-sections").glob("*.html"))) == 2
+
+
+def test_build_site_rerenders_after_render_version_change(tmp_path, monkeypatch):
+    from fashion_business_daily import site
+
+    articles = [
+        Article(
+            title="Marketing push",
+            url="https://example.com/marketing",
+            source="WWD",
+            summary="New campaign launched.",
+            categories=["Marketing"],
+            published=datetime(2024, 5, 2, tzinfo=timezone.utc),
+        ),
+    ]
+    build_site(articles, tmp_path)
+    monkeypatch.setattr(site, "RENDER_VERSION", site.RENDER_VERSION + 1)
+    monkeypatch.setattr(site, "render_section", lambda category, items: f"<section>{category} v2</section>")
+
+    result = build_site(articles, tmp_path)
+
+    assert (result.rendered_sections, result.reused_sections) == (1, 0)
+    assert "Marketing v2" in (tmp_path / "index.html").read_text()
@@ -0,0 +1,143 @@
+import io
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from fashion_business_daily.sources import HTTPTransport, RSSNewsSource, parse_feed, poll_hint
+
+FEED = b"""<?xml version="1.0"?>
+<rss><channel>
+  <item><title>First</title><link>https://example.com/1</link></item>
+  <item><title>Second</title><link>https://example.com/2</link></item>
+</channel></rss>
+"""
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    busy = 0
+
+    def do_GET(self):
+        if self.path == "/busy" and FeedHandler.busy == 0:
+            FeedHandler.busy += 1
+            self.send_response(503)
+            self.send_header("Retry-After", "3600")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(FEED)))
+        self.end_headers()
+        self.wfile.write(FEED)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def feed_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_sources_share_keep_alive_connections(feed_url) -> None:
+    transport = HTTPTransport()
+    sources = [
+        RSSNewsSource("Section A", f"{feed_url}/a"),
+        RSSNewsSource("Section B", f"{feed_url}/b"),
+    ]
+    for source in sources:
+        source.transport = transport
+
+    titles = [article.title for source in sources for article in source.fetch(limit=1)]
+    stats = transport.stats()
+    transport.close()
+
+    assert titles == ["First", "First"]
+    assert (stats.requests, stats.connections) == (2, 1)
+    assert stats.reuse_rate == 0.5
+
+
+def test_retry_after_sleep_is_capped(feed_url) -> None:
+    FeedHandler.busy = 0
+    transport = HTTPTransport(retry_after_max=0.05)
+    source = RSSNewsSource("Busy", f"{feed_url}/busy")
+    source.transport = transport
+
+    started = time.monotonic()
+    titles = [article.title for article in source.fetch(limit=1)]
+    transport.close()
+
+    assert titles == ["First"]
+    assert time.monotonic() - started < 5
+
+
+def test_single_attempt_requests_skip_retries(feed_url) -> None:
+    FeedHandler.busy = 0
+    transport = HTTPTransport()
+    source = RSSNewsSource("Busy", f"{feed_url}/busy")
+    source.transport = transport
+    source.retries = False
+
+    with pytest.raises(requests.HTTPError):
+        source.fetch(limit=1)
+    stats = transport.stats()
+    transport.close()
+
+    assert stats.requests == 1
+
+
+class CountingStream(io.BytesIO):
+    def __init__(self, data):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def test_parse_feed_stops_reading_after_limit() -> None:
+    body = "".join(
+        f"<item><title>Story {index}</title><link>https://example.com/{index}</link>"
+        f"<description>{'x' * 2000}</description></item>"
+        for index in range(500)
+    )
+    stream = CountingStream(f"<rss><channel>{body}</channel></rss>".encode())
+
+    articles = parse_feed("Test", stream, limit=3)
+
+    assert [article.title for article in articles] == ["Story 0", "Story 1", "Story 2"]
+    assert stream.bytes_read < len(stream.getvalue()) / 10
+
+
+def test_parse_feed_reads_atom_entries() -> None:
+    feed = b"""<feed xmlns="http://www.w3.org/2005/Atom">
+      <title>Feed</title>
+      <entry><title>Atom story</title><link href="https://example.com/atom"/>
+        <summary>&lt;p&gt;Summary&lt;/p&gt;</summary><updated>2025-10-25T08:00:00+00:00</updated></entry>
+    </feed>"""
+
+    [article] = parse_feed("Atom", io.BytesIO(feed), limit=5)
+
+    assert (article.title, article.url, article.summary) == (
+        "Atom story",
+        "https://example.com/atom",
+        "Summary",
+    )
+
+
+def test_poll_hint_honours_retry_after_cache_control_and_ttl() -> None:
+    assert poll_hint({}) is None
+    assert poll_hint({"Cache-Control": "public, max-age=300"}) == 300
+    assert poll_hint({"Retry-After": "120", "Cache-Control": "max-age=60"}, ttl="5") == 300
+    assert poll_hint({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
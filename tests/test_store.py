@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+
+from fashion_business_daily.aggregator import NewsAggregator
+from fashion_business_daily.articles import Article, Category
+from fashion_business_daily.sources import NewsSource
+from fashion_business_daily.store import ArticleStore, normalize_url
+
+
+class OnceSource(NewsSource):
+    def fetch(self, *, limit):
+        return [
+            Article(
+                source=self.name,
+                title="Brand launches campaign",
+                url="https://www.example.com/story/?utm_source=rss",
+                summary="",
+                published=datetime.now(timezone.utc),
+            )
+        ]
+
+
+def test_normalize_url_drops_tracking_noise() -> None:
+    assert normalize_url("HTTPS://WWW.Example.com/a/?utm_medium=x&b=2&a=1#top") == (
+        "https://example.com/a?a=1&b=2"
+    )
+
+
+def test_store_keeps_categories_across_runs(tmp_path) -> None:
+    path = tmp_path / "articles.db"
+    with ArticleStore(path) as store:
+        first = NewsAggregator(
+            [OnceSource("Feed")], [Category("Marketing", {"campaign"})], store=store
+        ).fetch()
+
+    with ArticleStore(path) as store:
+        # A different category table proves the stored categories were reused.
+        second = NewsAggregator(
+            [OnceSource("Feed")], [Category("Other", {"campaign"})], store=store
+        ).fetch()
+        history = list(store.iter_articles(category="Marketing"))
+
+    assert first[0].categories == second[0].categories == ["Marketing"]
+    assert [article.title for article in history] == ["Brand launches campaign"]
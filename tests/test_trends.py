@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+
+from fashion_business_daily.articles import Article, Category
+from fashion_business_daily.render import RenderPlan
+from fashion_business_daily.report import build_markdown_digest
+from fashion_business_daily.site import build_site_assets
+from fashion_business_daily.trends import CATEGORY, KEYWORD, TERM, Trend, TrendTracker
+
+CATEGORIES = [Category(name="Executive", keywords={"ceo", "chief executive"})]
+NOW = datetime(2025, 10, 25, 12, tzinfo=timezone.utc)
+
+
+def _article(index, days_ago, title):
+    return Article(
+        source="WWD",
+        title=title,
+        url=f"https://example.com/{days_ago}/{index}",
+        summary="",
+        published=NOW - timedelta(days=days_ago, hours=1),
+        categories=["Executive"] if "CEO" in title else [],
+    )
+
+
+def test_tracker_counts_incrementally_and_flags_spikes(tmp_path):
+    path = tmp_path / "trends.json"
+    tracker = TrendTracker(CATEGORIES, path, terms=["Loewe"], window=7, clock=lambda: NOW)
+    history = [_article(0, days, "Loewe names CEO") for days in range(1, 8)]
+    today = [_article(index, 0, f"Loewe appoints CEO #{index}") for index in range(6)]
+
+    assert tracker.update(history + today) == 13
+    assert tracker.update(today) == 0
+    tracker.save()
+
+    reloaded = TrendTracker(CATEGORIES, path, terms=["Loewe"], window=7, clock=lambda: NOW)
+    trends = reloaded.trending(threshold=2.0, min_count=3)
+    assert [(trend.term, trend.kind, trend.count) for trend in trends] == [
+        ("Executive", CATEGORY, 6),
+        ("ceo", KEYWORD, 6),
+        ("loewe", TERM, 6),
+    ]
+    assert trends[0].mean == 1.0
+
+    later = TrendTracker(
+        CATEGORIES, path, terms=["Loewe"], window=7, clock=lambda: NOW + timedelta(days=30)
+    )
+    assert later.trending(min_count=0) == []
+    assert later.update(history) == 0
+
+
+def test_trends_section_is_rendered_above_categories():
+    article = _article(0, 0, "Label names CEO")
+    trend = Trend("ceo", KEYWORD, 6, 1.0, 5.0)
+    plan = RenderPlan.build([article], trends=[trend])
+
+    digest = build_markdown_digest(plan)
+    html = build_site_assets(plan)["index.html"]
+
+    assert digest.index("## Trending") < digest.index("## Executive")
+    assert "- **ceo** (keyword): 6 stories today vs 1.0/day usually (z = 5.0)" in digest
+    assert html.index('id="trending"') < html.index('id="executive"')
+
+
+def test_new_tracker_reports_nothing_until_it_has_history():
+    tracker = TrendTracker(CATEGORIES, terms=["Loewe"], window=7, clock=lambda: NOW)
+    tracker.update([_article(index, 0, f"Loewe appoints CEO #{index}") for index in range(5)])
+
+    assert tracker.trending() == []
+
+    tracker.update([_article(0, 2, "Loewe names CEO")])
+    assert tracker.trending() == []
+    tracker.update([_article(0, 3, "Loewe names CEO")])
+    # Three days of history, two of them quiet: 5 today is well above ~0.67/day.
+    assert [trend.term for trend in tracker.trending()] == ["Executive", "ceo", "loewe"]